@@ -65,6 +65,11 @@ def main():
         remove_file("src/exceptions/jwt_token.py")
         print("JWT helper files removed (not needed)")
 
+    # Remove the SQLite benchmark for other databases
+    database_type = "{{ cookiecutter.database_type }}"
+    if use_database == "no" or database_type != "SQLite":
+        remove_file("benchmarks/sqlite_profile.py")
+
     # Remove authentication files if not needed
     include_authentication = "{{ cookiecutter.include_authentication }}"
     if include_authentication == "no":
@@ -77,6 +82,7 @@ def main():
         remove_file("src/dependencies/auth.py")
         remove_file("src/exceptions/auth.py")
         remove_file("src/helper/password.py")
+        remove_file("benchmarks/repository_statements.py")
         print("Authentication files removed (not needed)")
 
     print("\nProject generation completed successfully!")
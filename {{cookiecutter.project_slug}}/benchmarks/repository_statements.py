@@ -0,0 +1,78 @@
+{% if cookiecutter.use_database == "yes" and cookiecutter.include_authentication == "yes" -%}
+"""
+Benchmark per-call overhead of prebuilt repository statements.
+
+Compares building ``select(users).where(...)`` on every call, as the user
+repository used to, with executing the prebuilt ``GET_USER_BY_EMAIL``
+statement with only its parameters changing. Both run against an in-memory
+SQLite database, so the numbers are the Python-side cost per call:
+statement construction, cache key generation, compiled cache lookup and
+execution.
+
+Run from the project root:
+
+    python -m benchmarks.repository_statements --calls 20000
+"""
+import argparse
+import time
+from typing import Callable
+
+from sqlalchemy import Connection, create_engine, insert, select
+
+from src.models.user import metadata, users
+from src.repositories.user import GET_USER_BY_EMAIL
+
+
+def build_per_call(conn: Connection, email: str) -> None:
+    query = select(users).where(users.c.email == email, users.c.deleted_at.is_(None))
+    conn.execute(query).mappings().first()
+
+
+def prebuilt(conn: Connection, email: str) -> None:
+    conn.execute(GET_USER_BY_EMAIL, {"email": email}).mappings().first()
+
+
+def measure(conn: Connection, lookup: Callable[[Connection, str], None], calls: int) -> float:
+    """Microseconds per call, best of three rounds."""
+    rounds = []
+    for _ in range(3):
+        start = time.perf_counter()
+        for i in range(calls):
+            lookup(conn, f"user{i % 100}@example.com")
+        rounds.append((time.perf_counter() - start) / calls * 1_000_000)
+    return min(rounds)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=20_000)
+    args = parser.parse_args()
+
+    engine = create_engine("sqlite://")
+    metadata.create_all(engine)
+    with engine.connect() as conn:
+        conn.execute(insert(users), [
+            {
+                "id": f"{i:036d}",
+                "email": f"user{i}@example.com",
+                "username": f"user{i}",
+                "hashed_password": "x",
+            }
+            for i in range(100)
+        ])
+        # Warm the compiled cache for both forms
+        build_per_call(conn, "user0@example.com")
+        prebuilt(conn, "user0@example.com")
+
+        before = measure(conn, build_per_call, args.calls)
+        after = measure(conn, prebuilt, args.calls)
+
+    print(f"{'':<16}{'us/call':>10}")
+    print(f"{'build per call':<16}{before:>10.1f}")
+    print(f"{'prebuilt':<16}{after:>10.1f}")
+    print(f"\nsaved per call: {before - after:.1f} us ({(1 - after / before) * 100:.0f}%)")
+
+
+if __name__ == "__main__":
+    main()
+{% endif -%}
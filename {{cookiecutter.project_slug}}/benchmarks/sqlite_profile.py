@@ -0,0 +1,124 @@
+{% if cookiecutter.use_database == "yes" and cookiecutter.database_type == "SQLite" -%}
+"""
+Benchmark the SQLite profile against SQLite's defaults.
+
+Threads run a mixed workload, each write committed in its own transaction,
+first on a database opened with SQLite's defaults (rollback journal,
+synchronous=FULL, no memory map) and pre-pinged connections, then with the
+profile applied from the SQLITE_* settings.
+
+Run from the project root:
+
+    python -m benchmarks.sqlite_profile --threads 8 --seconds 5 --write-ratio 0.2
+"""
+import argparse
+import random
+import statistics
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from sqlalchemy import Engine, create_engine, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.pool import QueuePool
+
+from src.database.sqlite_profile import apply_sqlite_profile
+
+SEED_ROWS = 10_000
+
+
+def build_engine(path: Path, profile: bool, threads: int) -> Engine:
+    if not profile:
+        return create_engine(f"sqlite:///{path}", pool_size=threads, pool_pre_ping=True)
+    engine = create_engine(f"sqlite:///{path}", poolclass=QueuePool, pool_size=threads)
+    apply_sqlite_profile(engine)
+    return engine
+
+
+def seed(engine: Engine) -> None:
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT NOT NULL, score INTEGER NOT NULL)"))
+        conn.execute(
+            text("INSERT INTO items (name, score) VALUES (:name, :score)"),
+            [{"name": f"item-{i}", "score": i % 100} for i in range(SEED_ROWS)],
+        )
+
+
+def worker(engine: Engine, deadline: float, write_ratio: float, latencies: list[float], errors: list[int]) -> None:
+    rng = random.Random()
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        try:
+            if rng.random() < write_ratio:
+                with engine.begin() as conn:
+                    conn.execute(
+                        text("INSERT INTO items (name, score) VALUES (:name, :score)"),
+                        {"name": "new", "score": rng.randrange(100)},
+                    )
+            else:
+                with engine.connect() as conn:
+                    low = rng.randrange(SEED_ROWS)
+                    conn.execute(
+                        text("SELECT id, name, score FROM items WHERE id BETWEEN :low AND :high"),
+                        {"low": low, "high": low + 20},
+                    ).all()
+        except OperationalError:
+            # "database is locked" once busy_timeout runs out
+            errors.append(1)
+            continue
+        latencies.append(time.perf_counter() - start)
+
+
+def run(profile: bool, threads: int, seconds: float, write_ratio: float) -> dict[str, float]:
+    with tempfile.TemporaryDirectory() as directory:
+        engine = build_engine(Path(directory) / "bench.db", profile, threads)
+        seed(engine)
+
+        latencies: list[float] = []
+        errors: list[int] = []
+        deadline = time.perf_counter() + seconds
+        pool = [
+            threading.Thread(target=worker, args=(engine, deadline, write_ratio, latencies, errors))
+            for _ in range(threads)
+        ]
+        for thread in pool:
+            thread.start()
+        for thread in pool:
+            thread.join()
+        engine.dispose()
+
+    return {
+        "ops_per_second": len(latencies) / seconds,
+        "p50_ms": statistics.median(latencies) * 1000 if latencies else 0.0,
+        "p99_ms": statistics.quantiles(latencies, n=100)[98] * 1000 if len(latencies) > 1 else 0.0,
+        "errors": len(errors),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--write-ratio", type=float, default=0.2)
+    args = parser.parse_args()
+
+    results = {
+        name: run(profile, args.threads, args.seconds, args.write_ratio)
+        for name, profile in (("defaults", False), ("profile", True))
+    }
+
+    print(f"{'':<10}{'ops/s':>12}{'p50 ms':>10}{'p99 ms':>10}{'errors':>8}")
+    for name, result in results.items():
+        print(
+            f"{name:<10}{result['ops_per_second']:>12.0f}{result['p50_ms']:>10.2f}"
+            f"{result['p99_ms']:>10.2f}{result['errors']:>8}"
+        )
+    baseline = results["defaults"]["ops_per_second"]
+    if baseline:
+        print(f"\nthroughput: {results['profile']['ops_per_second'] / baseline:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
+{% endif -%}
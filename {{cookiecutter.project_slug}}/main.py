@@ -1,32 +1,47 @@
-import os
-import signal
+# Imported first so, with PROFILE_STARTUP_IMPORTS set, the startup report covers every import
+from src.helper.startup import startup_profile  # noqa: I001
+
+{% if cookiecutter.use_database == "yes" -%}
+import asyncio
+{% endif -%}
 import time
 from contextlib import asynccontextmanager
 
 import uvicorn
 from fastapi import FastAPI
-{% if cookiecutter.include_cors == "yes" -%}
-from fastapi.middleware.cors import CORSMiddleware
-{% endif -%}
-from fastapi.responses import ORJSONResponse
 
 from src.config import settings
+from src.controllers.admin import admin_router
 {% if cookiecutter.include_health_check == "yes" -%}
 from src.controllers.health import health_router
 {% endif -%}
 {% if cookiecutter.include_authentication == "yes" -%}
 from src.controllers.auth import auth_router
 {% endif -%}
+from src.controllers.metrics import metrics_router
 {% if cookiecutter.use_database == "yes" -%}
-from src.database.client import engine, client as db_client
+from src.database.client import client as db_client
 {% endif -%}
 {% if cookiecutter.include_middleware_logging == "yes" -%}
 from src.dependencies.http_client import close_http_client
 {% endif -%}
 from src.exceptions.exception_registration import exception_handlers
-from src.helper.logger import setup_logging, get_logger
+from src.helper.drain import drainer, install_drain_signal_handler, remove_drain_signal_handler
+from src.helper.logger import setup_logging, get_logger, shutdown_logging
+from src.helper.metrics import registry as metrics_registry
+from src.helper.response import TimedORJSONResponse
+from src.helper.settings_reload import install_reload_signal_handler, remove_reload_signal_handler
+from src.helper.supervisor import Supervisor
 {% if cookiecutter.include_middleware_logging == "yes" -%}
 from src.middleware.asgi_logging import ASGILoggingMiddleware
+from src.middleware.payload_processor import shutdown_payload_processor
+{% endif -%}
+{% if cookiecutter.include_cors == "yes" -%}
+from src.middleware.cors import ReloadableCORSMiddleware
+{% endif -%}
+from src.middleware.drain import DrainMiddleware
+{% if cookiecutter.use_database == "yes" -%}
+from src.middleware.query_tracking import QueryTrackingMiddleware
 {% endif -%}
 from src.version import VERSION
 
@@ -37,7 +52,8 @@ async def lifespan(app: FastAPI):
     startup_start = time.time()
 
     # Setup logging on startup
-    setup_logging()
+    with startup_profile.phase("logging"):
+        setup_logging()
     logger = get_logger(__name__)
 
     logger.info(
@@ -50,22 +66,91 @@ async def lifespan(app: FastAPI):
 {% if cookiecutter.use_cloud_sql == "yes" -%}
     # Initialize Cloud SQL connector in the current event loop
     if db_client.use_cloud_sql:
-        await db_client.init_connector()
+        with startup_profile.phase("cloud_sql_connector"):
+            await db_client.init_connector()
         logger.info(
             "Cloud SQL connector initialized",
             event_type="cloud_sql_connector_initialized"
         )
 
 {% endif -%}
-    # Calculate and log startup time
+{% if cookiecutter.use_database == "yes" -%}
+    # Build the engine here rather than at import, and report how the
+    # connection budget sized this process's pool
+    with startup_profile.phase("database_engine"):
+        db_client.create_engine()
+    db_client.start_replica_monitor()
+    pool_plan = db_client.pool_plan
+    if pool_plan.within_budget:
+        log_pool_plan, message = logger.info, "Database pool sized"
+    else:
+        log_pool_plan, message = logger.warning, "Database connection budget cannot be honored"
+    log_pool_plan(
+        message,
+        event_type="db_pool_planned",
+        pool_size=pool_plan.pool_size,
+        max_overflow=pool_plan.max_overflow,
+        processes=pool_plan.processes,
+        max_connections=pool_plan.max_connections,
+        connection_budget=pool_plan.budget,
+        read_replicas=len(db_client.replicas),
+    )
+
+    # Open pool connections before reporting ready, so the first requests skip the handshakes
+    if settings.DB_POOL_WARMUP:
+        warmup_start = time.perf_counter()
+        try:
+            with startup_profile.phase("database_warmup"):
+                warmed = await asyncio.wait_for(
+{% if cookiecutter.use_async_database == "yes" -%}
+                    db_client.warm_up(settings.DB_POOL_WARMUP),
+{% else -%}
+                    asyncio.to_thread(db_client.warm_up, settings.DB_POOL_WARMUP),
+{% endif -%}
+                    timeout=settings.DB_POOL_WARMUP_TIMEOUT,
+                )
+        except Exception as exc:
+            logger.warning(
+                "Database pool warm-up failed",
+                event_type="db_pool_warmup_failed",
+                error=str(exc) or type(exc).__name__,
+            )
+        else:
+            logger.info(
+                "Database pool warmed up",
+                event_type="db_pool_warmed_up",
+                connections=warmed,
+                warmup_time_ms=round((time.perf_counter() - warmup_start) * 1000, 2),
+            )
+
+{% endif -%}
+    # Share metrics with sibling worker processes
+    with startup_profile.phase("metrics"):
+        metrics_registry.start_flusher(settings.METRICS_FLUSH_INTERVAL)
+
+    # Reload runtime settings on SIGHUP (also available at POST /admin/settings/reload)
+    install_reload_signal_handler()
+
+    # Drain in-flight requests on SIGTERM before the server shuts down
+    drainer.reset()
+    install_drain_signal_handler()
+
+    # Calculate and log startup time, with per-phase and import timings
     startup_time = time.time() - startup_start
+    startup_report = startup_profile.finish()
     logger.info(
         "Application startup completed",
         event_type="app_startup_completed",
         app_name=settings.APP_NAME,
         app_version=VERSION,
         startup_time_seconds=round(startup_time, 4),
-        startup_time_ms=round(startup_time * 1000, 2)
+        startup_time_ms=round(startup_time * 1000, 2),
+{% if cookiecutter.use_database == "yes" -%}
+        db_pool_warmup_ms=startup_report["phases_ms"].get("database_warmup"),
+{% endif -%}
+        startup_phases_ms=startup_report["phases_ms"],
+        import_time_ms=startup_report["imports_ms"],
+        slowest_imports_ms=startup_report["slowest_imports_ms"],
     )
 
     yield {}
@@ -76,12 +161,25 @@ async def lifespan(app: FastAPI):
         "Application shutting down",
         event_type="app_shutdown_started"
     )
+    remove_reload_signal_handler()
+
+    # Reject new requests and let running ones finish before closing pools
+    abandoned_requests = await drainer.wait(settings.DRAIN_TIMEOUT)
+    remove_drain_signal_handler()
+    if abandoned_requests:
+        logger.warning(
+            "Drain deadline passed with requests in flight",
+            event_type="app_drain_timeout",
+            abandoned_requests=abandoned_requests,
+        )
 
 {% if cookiecutter.use_database == "yes" -%}
     await db_client.close()
 {% endif -%}
+    metrics_registry.stop_flusher()
 {% if cookiecutter.include_middleware_logging == "yes" -%}
     await close_http_client()
+    shutdown_payload_processor()
 {% endif -%}
 
     shutdown_time = time.time() - shutdown_start
@@ -89,49 +187,64 @@ async def lifespan(app: FastAPI):
         "Application shutdown completed",
         event_type="app_shutdown_completed",
         shutdown_time_seconds=round(shutdown_time, 4),
-        shutdown_time_ms=round(shutdown_time * 1000, 2)
+        shutdown_time_ms=round(shutdown_time * 1000, 2),
+        drain_time_ms=round(drainer.drain_seconds * 1000, 2),
+        abandoned_requests=abandoned_requests,
     )
 
+    # Flush queued log records before the process exits
+    shutdown_logging()
+
 
 app = FastAPI(
     title=settings.APP_NAME,
     version=VERSION,
     lifespan=lifespan,
-    default_response_class=ORJSONResponse,
+    default_response_class=TimedORJSONResponse,
     exception_handlers=exception_handlers,
 )
 
 {% if cookiecutter.include_cors == "yes" -%}
 app.add_middleware(
-    CORSMiddleware,
-    allow_origins=settings.ALLOWED_ORIGINS,
+    ReloadableCORSMiddleware,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
+{% endif -%}
+{% if cookiecutter.use_database == "yes" -%}
+# Count statements per request, inside the logging middleware's request context
+app.add_middleware(QueryTrackingMiddleware)
+
 {% endif -%}
 {% if cookiecutter.include_middleware_logging == "yes" -%}
 # Add ASGI logging middleware (avoids BaseHTTPMiddleware limitations)
 app.add_middleware(ASGILoggingMiddleware)
 
 {% endif -%}
+# Outermost: tracks in-flight requests and rejects new ones while draining
+app.add_middleware(DrainMiddleware)
+
 {% if cookiecutter.include_health_check == "yes" -%}
 app.include_router(health_router)
 {% endif -%}
 {% if cookiecutter.include_authentication == "yes" -%}
 app.include_router(auth_router)
 {% endif -%}
+if settings.METRICS_ENABLED:
+    app.include_router(metrics_router)
+app.include_router(admin_router)
 
 if __name__ == "__main__":
-    try:
+    if settings.DEBUG:
+        # Single auto-reloading process for development
         uvicorn.run(
             app="main:app",
             host=settings.HOST,
             port=settings.PORT,
-            reload=settings.DEBUG,
+            reload=True,
         )
-    except KeyboardInterrupt:
-        pass
-    finally:
-        os.kill(os.getpid(), signal.SIGINT)
+    else:
+        # Pre-forked workers serving the already imported app
+        Supervisor(app).run()
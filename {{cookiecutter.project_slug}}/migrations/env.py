@@ -13,6 +13,9 @@ from sqlalchemy import create_engine
 
 from src.database.client import metadata
 from src.config import settings
+{% if cookiecutter.database_type == "PostgreSQL" and cookiecutter.use_async_database == "yes" -%}
+from src.database.driver import connect_args, driver_name
+{% endif -%}
 from src.helper.generator import build_connection_url
 {% if cookiecutter.include_authentication == "yes" -%}
 from src.models.user import users  # noqa: F401
@@ -34,7 +37,7 @@ def run_migrations_offline() -> None:
 {%- if cookiecutter.database_type == "PostgreSQL" %}
     url = build_connection_url(
 {% if cookiecutter.use_async_database == "yes" -%}
-        driver_name="postgresql+psycopg",
+        driver_name=driver_name(),
 {% else -%}
         driver_name="postgresql+psycopg2",
 {% endif -%}
@@ -84,7 +87,7 @@ async def run_async_migrations():
     """Run migrations in 'online' mode with async engine."""
 {%- if cookiecutter.database_type == "PostgreSQL" %}
     url = build_connection_url(
-        driver_name="postgresql+asyncpg",
+        driver_name=driver_name(),
         username=settings.POSTGRES_USER,
         password=settings.POSTGRES_PASSWORD,
         host=settings.POSTGRES_HOST,
@@ -104,7 +107,11 @@ async def run_async_migrations():
     url = f"sqlite+aiosqlite:///{settings.SQLITE_DB_PATH}"
 {%- endif %}
 
+{% if cookiecutter.database_type == "PostgreSQL" -%}
+    connectable = create_async_engine(url, poolclass=pool.NullPool, connect_args=connect_args(settings.DB_DRIVER))
+{% else -%}
     connectable = create_async_engine(url, poolclass=pool.NullPool)
+{% endif -%}
 
     async with connectable.connect() as connection:
         await connection.run_sync(do_run_migrations)
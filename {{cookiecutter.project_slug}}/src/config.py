@@ -1,5 +1,8 @@
+import asyncio
+import inspect
+import os
 from functools import lru_cache
-from typing import Self
+from typing import Any, Callable, Iterable, Self
 
 from pydantic import Field, field_validator, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -27,6 +30,43 @@ class Settings(BaseSettings):
     HOST: str = Field(default="0.0.0.0")
     PORT: int = Field(default={{ cookiecutter.default_port }}, ge=1, le=65535)
     DEBUG: bool = Field(default=False)
+    DRAIN_TIMEOUT: float = Field(
+        default=20.0,
+        ge=0.0,
+        description="Seconds in-flight requests may take to finish on shutdown before pools are closed"
+    )
+    PROFILE_STARTUP_IMPORTS: bool = Field(
+        default=False,
+        description="Time module imports until startup completes; read from the process environment only"
+    )
+
+    # Worker Settings (production runner, see src/helper/supervisor.py)
+    WORKERS: int = Field(default=0, ge=0, description="Worker processes (0 uses the CPUs available to this process)")
+    WORKER_MAX_REQUESTS: int = Field(
+        default=0,
+        ge=0,
+        description="Recycle a worker after this many requests (0 disables)"
+    )
+    WORKER_MAX_REQUESTS_JITTER: int = Field(
+        default=0,
+        ge=0,
+        description="Random extra requests per worker so recycles do not coincide"
+    )
+    WORKER_MAX_RSS_MB: int = Field(
+        default=0,
+        ge=0,
+        description="Recycle a worker whose resident memory exceeds this many MB (0 disables)"
+    )
+    WORKER_GRACEFUL_TIMEOUT: float = Field(
+        default=30.0,
+        gt=0.0,
+        description="Seconds a stopping worker may spend finishing in-flight requests"
+    )
+    WORKER_RESTART_BACKOFF_MAX: float = Field(
+        default=30.0,
+        gt=0.0,
+        description="Upper bound in seconds of the delay before restarting a crashing worker"
+    )
 
     # Security Settings
     SECRET_KEY: str = Field(default=..., min_length=32, description="Secret key for JWT tokens")
@@ -43,6 +83,18 @@ class Settings(BaseSettings):
     POSTGRES_HOST: str = Field(default="localhost", description="PostgreSQL host")
     POSTGRES_PORT: int = Field(default=5432, ge=1, le=65535, description="PostgreSQL port")
     POSTGRES_DB: str = Field(default=..., description="PostgreSQL database name")
+{%- if cookiecutter.use_async_database == "yes" %}
+    DB_DRIVER: str = Field(default="psycopg", description="PostgreSQL async driver: psycopg, asyncpg")
+    DB_STATEMENT_CACHE_SIZE: int = Field(
+        default=100,
+        ge=0,
+        description="Prepared statements cached per connection by asyncpg (0 disables)"
+    )
+    DB_PGBOUNCER: bool = Field(
+        default=False,
+        description="Disable server-side prepared statements for PgBouncer in transaction pooling mode"
+    )
+{%- endif %}
 {%- elif cookiecutter.database_type == "MySQL" %}
     MYSQL_USER: str = Field(default=..., description="MySQL username")
     MYSQL_PASSWORD: str = Field(default=..., description="MySQL password")
@@ -51,6 +103,15 @@ class Settings(BaseSettings):
     MYSQL_DB: str = Field(default=..., description="MySQL database name")
 {%- elif cookiecutter.database_type == "SQLite" %}
     SQLITE_DB_PATH: str = Field(default="./app.db", description="SQLite database file path")
+    SQLITE_JOURNAL_MODE: str = Field(default="WAL", description="SQLite journal mode: WAL, DELETE, TRUNCATE, PERSIST, MEMORY")
+    SQLITE_SYNCHRONOUS: str = Field(default="NORMAL", description="SQLite synchronous mode: OFF, NORMAL, FULL, EXTRA")
+    SQLITE_BUSY_TIMEOUT: int = Field(default=5000, ge=0, description="Milliseconds to wait for a locked database")
+    SQLITE_MMAP_SIZE: int = Field(
+        default=256 * 1024 * 1024,
+        ge=0,
+        description="Bytes of the database file read through memory mapping (0 disables)"
+    )
+    SQLITE_CACHE_SIZE: int = Field(default=65536, ge=0, description="Page cache per connection in KiB")
 {%- endif %}
 
 {% if cookiecutter.use_cloud_sql == "yes" -%}
@@ -68,6 +129,76 @@ class Settings(BaseSettings):
     DB_POOL_RECYCLE: int = Field(default=3600, ge=300, description="Connection recycle time in seconds")
     DB_POOL_TIMEOUT: int = Field(default=30, ge=5, description="Connection timeout in seconds")
     DB_POOL_PRE_PING: bool = Field(default=True, description="Enable connection pool pre-ping")
+    DB_POOL_WARMUP: int = Field(
+        default=0,
+        ge=0,
+        description="Connections opened concurrently at startup, capped at the pool size (0 disables)"
+    )
+    DB_POOL_WARMUP_TIMEOUT: float = Field(default=10.0, gt=0.0, description="Seconds allowed for pool warm-up")
+    DB_POOL_SATURATION_WAITERS: int = Field(
+        default=5,
+        ge=0,
+        description="Callers waiting for a pool connection above which a saturation event is logged"
+    )
+    DB_POOL_SATURATION_LOG_INTERVAL: float = Field(
+        default=30.0,
+        ge=0.0,
+        description="Minimum seconds between pool saturation events"
+    )
+    DB_ADMISSION_CONTROL: bool = Field(
+        default=True,
+        description="Reject requests fast when every pool connection is in use and the wait queue is full"
+    )
+    DB_ADMISSION_MAX_QUEUE: int = Field(
+        default=100,
+        ge=0,
+        description="Requests allowed to wait for a connection once the pool is exhausted"
+    )
+    DB_ADMISSION_MAX_WAIT: float = Field(
+        default=1.0,
+        gt=0.0,
+        description="Seconds a queued request waits for a connection before it is rejected"
+    )
+    DB_ADMISSION_RETRY_AFTER: int = Field(default=1, ge=0, description="Retry-After seconds sent with rejections")
+    DB_SLOW_QUERY_MS: float = Field(default=200.0, ge=0.0, description="Log statements slower than this (0 disables)")
+    DB_N_PLUS_ONE_THRESHOLD: int = Field(
+        default=10,
+        ge=0,
+        description="Executions of one statement fingerprint per request above which a warning is logged (0 disables)"
+    )
+{%- if cookiecutter.use_async_database == "yes" %}
+    DB_BATCH_MAX_SIZE: int = Field(default=100, ge=1, description="Most keys a batched lookup fetches in one query")
+    DB_BATCH_WINDOW_MS: float = Field(
+        default=0.0,
+        ge=0.0,
+        description="Milliseconds a batched lookup waits for more keys (0 batches within one event loop iteration)"
+    )
+{%- endif %}
+    DB_REPLICA_URLS: list[str] = Field(
+        default=[],
+        description="Read replica SQLAlchemy URLs, comma separated (empty reads from the primary)"
+    )
+    DB_REPLICA_SELECTION: str = Field(default="round_robin", description="Replica selection: round_robin, least_busy")
+    DB_REPLICA_HEALTH_INTERVAL: float = Field(
+        default=10.0,
+        gt=0.0,
+        description="Seconds between replica health checks"
+    )
+    DB_CONNECTION_BUDGET: int = Field(
+        default=0,
+        ge=0,
+        description="Total connections allowed across all workers and replicas (0 sizes pools per process)"
+    )
+    DB_EXPECTED_WORKERS: int = Field(
+        default=0,
+        ge=0,
+        description="Worker processes per replica sharing the budget (0 uses the configured worker count)"
+    )
+    DB_EXPECTED_REPLICAS: int = Field(default=1, ge=1, description="Replicas (pods) sharing the budget")
+    DB_BUDGET_STRICT: bool = Field(
+        default=False,
+        description="Fail startup instead of warning when the connection budget cannot be honored"
+    )
 
 {% endif -%}
     # Logging Settings
@@ -75,6 +206,73 @@ class Settings(BaseSettings):
 {% if cookiecutter.use_structured_logging == "yes" -%}
     LOG_FORMAT: str = Field(default="{{ cookiecutter.log_format[0] }}", description="Log format: json or text")
 {% endif -%}
+    LOG_ASYNC: bool = Field(default=True, description="Write logs from a background thread")
+    LOG_QUEUE_SIZE: int = Field(default=10000, ge=1, description="Max log records buffered for the writer thread")
+    LOG_BATCH_SIZE: int = Field(default=256, ge=1, description="Max log records written per batch")
+    LOG_QUEUE_OVERFLOW: str = Field(
+        default="block",
+        description="Policy when the log queue is full: block, drop_oldest, drop_debug_first"
+    )
+{% if cookiecutter.include_middleware_logging == "yes" -%}
+    LOG_PAYLOAD_MAX_BODY_SIZE: int = Field(
+        default=100 * 1024,
+        ge=0,
+        description="Max request/response body size in bytes captured for payload logging"
+    )
+    LOG_PAYLOAD_SAMPLE_RATE: float = Field(
+        default=1.0,
+        ge=0.0,
+        le=1.0,
+        description="Fraction of requests whose request/response payloads are captured"
+    )
+    LOG_PAYLOAD_ROUTE_SAMPLE_RATES: dict[str, float] = Field(
+        default={},
+        description="Per-route payload sample rates, e.g. /api/v1/auth=1.0,/api/v1/items=0.1"
+    )
+    LOG_PAYLOAD_STATUS_SAMPLE_RATES: dict[str, float] = Field(
+        default={},
+        description="Per-status-class payload sample rates, e.g. 2xx=0.1,4xx=1.0"
+    )
+    LOG_SLOW_REQUEST_MS: float = Field(
+        default=1000.0,
+        ge=0.0,
+        description="Requests slower than this always have captured payloads logged"
+    )
+    LOG_PAYLOAD_WORKERS: int = Field(default=2, ge=1, description="Threads that parse and log captured payloads")
+    LOG_PAYLOAD_MAX_PENDING: int = Field(
+        default=1000,
+        ge=1,
+        description="Max payload log jobs queued before payloads are skipped"
+    )
+    LOG_REDACT_KEYS: list[str] = Field(default=[], description="Extra key fragments redacted from logged payloads")
+    LOG_REDACT_MAX_DEPTH: int = Field(default=8, ge=1, description="Max nesting depth of logged payloads")
+    LOG_REDACT_MAX_ITEMS: int = Field(default=50, ge=1, description="Max items logged per payload list or object")
+    LOG_REDACT_MAX_STRING_LENGTH: int = Field(
+        default=1000,
+        ge=1,
+        description="Max length of string values in logged payloads"
+    )
+    REQUEST_ID_TRUST_UPSTREAM: bool = Field(
+        default=True,
+        description="Reuse a well-formed X-Request-ID from the client or gateway"
+    )
+    SERVER_TIMING: str = Field(
+        default="off",
+        description="Server-Timing breakdown: off, opt_in (per X-Server-Timing request header) or always"
+    )
+{% endif -%}
+
+    # Metrics Settings
+    METRICS_ENABLED: bool = Field(default=True, description="Expose Prometheus metrics at /metrics")
+    METRICS_MULTIPROC_DIR: str = Field(
+        default="",
+        description="Directory shared by worker processes to aggregate metrics (empty disables)"
+    )
+    METRICS_FLUSH_INTERVAL: float = Field(
+        default=5.0,
+        gt=0.0,
+        description="Seconds between metric snapshot writes in multi-process mode"
+    )
 
 {% if cookiecutter.use_jwt == "yes" -%}
     # JWT Settings
@@ -87,6 +285,9 @@ class Settings(BaseSettings):
     JWT_REFRESH_TOKEN_EXPIRE_DAYS: int = Field(default=7, ge=1, description="Refresh token expiration time in days")
 
 {% endif -%}
+    # Admin Settings
+    ADMIN_TOKEN: str = Field(default="", description="Token required by /admin endpoints (empty disables them)")
+
     # File Upload Settings
     MAX_FILE_SIZE: int = Field(default=50, description="Max file size in megabytes")
 
@@ -97,6 +298,51 @@ class Settings(BaseSettings):
             v = v.split(',')
         return [x.strip() for x in v]
 
+{% if cookiecutter.use_database == "yes" -%}
+    @field_validator('DB_REPLICA_URLS', mode='before')
+    @classmethod
+    def decode_replica_urls(cls, v: str | list[str]) -> list[str]:
+        if isinstance(v, str):
+            v = v.split(',')
+        return [x.strip() for x in v if x.strip()]
+
+{% if cookiecutter.database_type == "SQLite" -%}
+    @field_validator('SQLITE_JOURNAL_MODE', mode='before')
+    @classmethod
+    def validate_sqlite_journal_mode(cls, v: str) -> str:
+        allowed_modes = ['WAL', 'DELETE', 'TRUNCATE', 'PERSIST', 'MEMORY']
+        if v.upper() not in allowed_modes:
+            raise ValueError(f'Invalid SQLite journal mode. Must be one of: {allowed_modes}')
+        return v.upper()
+
+    @field_validator('SQLITE_SYNCHRONOUS', mode='before')
+    @classmethod
+    def validate_sqlite_synchronous(cls, v: str) -> str:
+        allowed_modes = ['OFF', 'NORMAL', 'FULL', 'EXTRA']
+        if v.upper() not in allowed_modes:
+            raise ValueError(f'Invalid SQLite synchronous mode. Must be one of: {allowed_modes}')
+        return v.upper()
+
+{% endif -%}
+{% if cookiecutter.database_type == "PostgreSQL" and cookiecutter.use_async_database == "yes" -%}
+    @field_validator('DB_DRIVER', mode='before')
+    @classmethod
+    def validate_db_driver(cls, v: str) -> str:
+        allowed_drivers = ['psycopg', 'asyncpg']
+        if v not in allowed_drivers:
+            raise ValueError(f'Invalid database driver. Must be one of: {allowed_drivers}')
+        return v
+
+{% endif -%}
+    @field_validator('DB_REPLICA_SELECTION', mode='before')
+    @classmethod
+    def validate_replica_selection(cls, v: str) -> str:
+        allowed_strategies = ['round_robin', 'least_busy']
+        if v not in allowed_strategies:
+            raise ValueError(f'Invalid replica selection. Must be one of: {allowed_strategies}')
+        return v
+
+{% endif -%}
 {% if cookiecutter.include_cors == "yes" -%}
     @field_validator('ALLOWED_ORIGINS', mode='before')
     @classmethod
@@ -122,6 +368,46 @@ class Settings(BaseSettings):
             raise ValueError(f'Invalid log level. Must be one of: {allowed_levels}')
         return v.upper()
 
+    @field_validator('LOG_QUEUE_OVERFLOW', mode='before')
+    @classmethod
+    def validate_log_queue_overflow(cls, v: str) -> str:
+        allowed_policies = ['block', 'drop_oldest', 'drop_debug_first']
+        if v not in allowed_policies:
+            raise ValueError(f'Invalid log queue overflow policy. Must be one of: {allowed_policies}')
+        return v
+
+{% if cookiecutter.include_middleware_logging == "yes" -%}
+    @field_validator('LOG_REDACT_KEYS', mode='before')
+    @classmethod
+    def decode_redact_keys(cls, v: str | list[str]) -> list[str]:
+        if isinstance(v, str):
+            v = v.split(',')
+        return [x.strip() for x in v if x.strip()]
+
+    @field_validator('LOG_PAYLOAD_ROUTE_SAMPLE_RATES', mode='before')
+    @classmethod
+    def decode_route_sample_rates(cls, v: str | dict[str, float]) -> dict[str, float]:
+        return _decode_rate_map(v)
+
+    @field_validator('LOG_PAYLOAD_STATUS_SAMPLE_RATES', mode='before')
+    @classmethod
+    def decode_status_sample_rates(cls, v: str | dict[str, float]) -> dict[str, float]:
+        rates = _decode_rate_map(v)
+        allowed_classes = ['1xx', '2xx', '3xx', '4xx', '5xx']
+        for status_class in rates:
+            if status_class not in allowed_classes:
+                raise ValueError(f'Invalid status class. Must be one of: {allowed_classes}')
+        return rates
+
+    @field_validator('SERVER_TIMING', mode='before')
+    @classmethod
+    def validate_server_timing(cls, v: str) -> str:
+        allowed_modes = ['off', 'opt_in', 'always']
+        if v not in allowed_modes:
+            raise ValueError(f'Invalid server timing mode. Must be one of: {allowed_modes}')
+        return v
+
+{% endif -%}
 {% if cookiecutter.use_structured_logging == "yes" -%}
     @field_validator('LOG_FORMAT', mode='before')
     @classmethod
@@ -148,5 +434,106 @@ class Settings(BaseSettings):
         """Check if the application is running in development environment."""
         return self.APP_ENV in ['local', 'development']
 
+    @property
+    def worker_count(self) -> int:
+        """Number of worker processes: WORKERS, or the CPUs available to this process."""
+        if self.DEBUG:
+            # Development runs a single auto-reloading process
+            return 1
+        if self.WORKERS:
+            return self.WORKERS
+        try:
+            return len(os.sched_getaffinity(0))
+        except AttributeError:
+            return os.cpu_count() or 1
+
+
+{% if cookiecutter.include_middleware_logging == "yes" -%}
+def _decode_rate_map(v: str | dict[str, float]) -> dict[str, float]:
+    """Decode a ``key=rate,key=rate`` string into a dict of sample rates."""
+    if isinstance(v, str):
+        v = dict(item.split('=', 1) for item in v.split(',') if item.strip())
+    rates = {key.strip(): float(rate) for key, rate in v.items()}
+    for key, rate in rates.items():
+        if not 0.0 <= rate <= 1.0:
+            raise ValueError(f'Invalid sample rate for {key}. Must be between 0 and 1')
+    return rates
+
+
+{% endif -%}
+class SettingsProxy:
+    """
+    Read-through view of the current settings snapshot.
+
+    Every attribute read goes to the snapshot active at that moment, so modules
+    holding ``from src.config import settings`` see reloaded values, and a
+    reload swaps the whole snapshot at once. Code reading several values per
+    request or per query takes ``snapshot()`` once and reads from that, which
+    also keeps the values consistent across a concurrent reload.
+    """
+    __slots__ = ("_snapshot",)
+
+    def __init__(self, snapshot: Settings) -> None:
+        object.__setattr__(self, "_snapshot", snapshot)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._snapshot, name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("Settings are read-only, use reload_settings() to apply changes")
+
+    def snapshot(self) -> Settings:
+        """Get the current settings snapshot."""
+        return self._snapshot
+
+
+settings = SettingsProxy(Settings())
+
+_subscribers: dict[Callable[[Settings, Settings], Any], frozenset[str]] = {}
+_reload_lock = asyncio.Lock()
+
+
+def subscribe(fields: Iterable[str], callback: Callable[[Settings, Settings], Any]) -> None:
+    """
+    Call ``callback(old, new)`` after a reload that changes any of ``fields``.
+
+    The callback may return an awaitable, which is awaited before the reload
+    completes. Subscribing the same callback again replaces its fields.
+    """
+    _subscribers[callback] = frozenset(fields)
+
+
+def unsubscribe(callback: Callable[[Settings, Settings], Any]) -> None:
+    """Stop calling ``callback`` on reloads; unknown callbacks are ignored."""
+    _subscribers.pop(callback, None)
+
+
+async def reload_settings() -> dict[str, list[str]]:
+    """
+    Re-read the environment and .env file and swap in the new settings.
+
+    The new values are validated before anything changes; on a validation
+    error the current snapshot stays active and the error is raised.
+    Returns the changed field names and the subscribers that failed to apply them.
+    """
+    async with _reload_lock:
+        Settings.cache_clear()
+        new = Settings()
+        old = settings.snapshot()
+
+        old_values, new_values = old.model_dump(), new.model_dump()
+        changed = {name for name, value in new_values.items() if old_values.get(name) != value}
+        object.__setattr__(settings, "_snapshot", new)
+
+        failed = []
+        for callback, fields in list(_subscribers.items()):
+            if not fields & changed:
+                continue
+            try:
+                result = callback(old, new)
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as exc:
+                failed.append(f"{getattr(callback, '__qualname__', repr(callback))}: {exc}")
 
-settings = Settings()
+        return {"changed": sorted(changed), "failed": failed}
@@ -0,0 +1,47 @@
+from fastapi import APIRouter, Depends{% if cookiecutter.use_database == "yes" %}, Query{% endif %}
+
+{% if cookiecutter.use_database == "yes" -%}
+from src.database.client import client as db_client
+{% endif -%}
+from src.dependencies.admin import require_admin_token
+from src.helper.response import JsonResponse
+from src.helper.settings_reload import reload_and_log
+from src.schemas.admin import {% if cookiecutter.use_database == "yes" %}QueryStats, QueryStatsResponse, {% endif %}SettingsReloadResponse
+
+admin_router = APIRouter(
+    prefix="/admin",
+    tags=["Admin"],
+    include_in_schema=False,
+    dependencies=[Depends(require_admin_token)],
+)
+
+
+@admin_router.post(path="/settings/reload", response_model=JsonResponse[SettingsReloadResponse])
+async def reload_runtime_settings() -> JsonResponse[SettingsReloadResponse]:
+    """Re-read environment variables and .env, and apply them without a restart."""
+    result = await reload_and_log("admin_endpoint")
+    return JsonResponse(
+        data=SettingsReloadResponse(**result),
+        message="Settings reloaded",
+    )
+{% if cookiecutter.use_database == "yes" %}
+
+
+@admin_router.get(path="/db/queries", response_model=JsonResponse[QueryStatsResponse])
+async def query_stats(
+    limit: int = Query(default=50, ge=1, le=1000),
+    reset: bool = Query(default=False, description="Clear the aggregates after reading them"),
+) -> JsonResponse[QueryStatsResponse]:
+    """Per-fingerprint statement timings of this worker process, by total time spent."""
+    monitor = db_client.query_monitor
+    result = QueryStatsResponse(
+        queries=[QueryStats(**row) for row in monitor.stats(limit)],
+        dropped=monitor.dropped,
+    )
+    if reset:
+        monitor.reset()
+    return JsonResponse(
+        data=result,
+        message="Ok",
+    )
+{% endif -%}
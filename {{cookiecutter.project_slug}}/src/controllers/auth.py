@@ -1,6 +1,10 @@
 from fastapi import APIRouter, Depends
 
-from src.dependencies.database import DBConnection
+{% if cookiecutter.use_async_database == "yes" -%}
+from src.dependencies.database import DBUnitOfWork
+{% else -%}
+from src.dependencies.database import DBConnection, DBUnitOfWork
+{% endif -%}
 from src.dependencies.auth import get_auth_service, get_current_user
 from src.services.auth import AuthService
 from src.schemas.auth import (
@@ -13,19 +17,31 @@ from src.schemas.auth import (
 from src.helper.response import JsonResponse
 
 auth_router = APIRouter(prefix="{{ cookiecutter.api_prefix }}/auth", tags=["Authentication"])
+{% if cookiecutter.use_async_database != "yes" -%}
+# Endpoints using the database are plain def: Starlette runs them in its
+# threadpool, so the blocking pool checkout and queries don't stall the loop
+{% endif -%}
 
 
 @auth_router.post("/register", response_model=JsonResponse[UserResponse])
+{% if cookiecutter.use_async_database == "yes" -%}
 async def register(
+{% else -%}
+def register(
+{% endif -%}
     request: RegisterRequest,
-    conn: DBConnection,
+    unit_of_work: DBUnitOfWork,
     auth_service: AuthService = Depends(get_auth_service),
 ) -> JsonResponse[UserResponse]:
     """Register a new user."""
 {% if cookiecutter.use_async_database == "yes" -%}
-    user = await auth_service.register(conn, request)
+    user = await auth_service.register(unit_of_work.connection, request)
+    # Commit before serializing rather than at dependency teardown
+    await unit_of_work.commit()
 {% else -%}
-    user = auth_service.register(conn, request)
+    user = auth_service.register(unit_of_work.connection, request)
+    # Commit before serializing rather than at dependency teardown
+    unit_of_work.commit()
 {% endif -%}
     return JsonResponse(
         data=user,
@@ -34,14 +50,19 @@ async def register(
 
 
 @auth_router.post("/login", response_model=JsonResponse[TokenResponse])
+{% if cookiecutter.use_async_database == "yes" -%}
 async def login(
     request: LoginRequest,
+{% else -%}
+def login(
+    request: LoginRequest,
     conn: DBConnection,
+{% endif -%}
     auth_service: AuthService = Depends(get_auth_service),
 ) -> JsonResponse[TokenResponse]:
     """Login and get access/refresh tokens."""
 {% if cookiecutter.use_async_database == "yes" -%}
-    tokens = await auth_service.login(conn, request)
+    tokens = await auth_service.login(request)
 {% else -%}
     tokens = auth_service.login(conn, request)
 {% endif -%}
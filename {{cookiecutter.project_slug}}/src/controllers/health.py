@@ -2,28 +2,42 @@ from fastapi import APIRouter, Request
 {% if cookiecutter.use_database == "yes" -%}
 from sqlalchemy import select
 
+from src.database.client import client as db_client
 from src.dependencies.database import DBConnection
 {% endif -%}
 from src.config import settings
 from src.helper.response import JsonResponse
-from src.schemas.health import HealthResponse{% if cookiecutter.use_database == "yes" %}, Status{% endif %}
+from src.schemas.health import HealthResponse{% if cookiecutter.use_database == "yes" %}, PoolStatus, Status{% endif %}
 from src.version import VERSION
 
 health_router = APIRouter(tags=["Health"])
 
 
+{% if cookiecutter.use_database == "yes" and cookiecutter.use_async_database != "yes" -%}
+# Plain def: the sync driver's checkout and query run in Starlette's threadpool
+@health_router.get(path="/health")
+def health_check(
+{% else -%}
 @health_router.get(path="/health")
 async def health_check(
+{% endif -%}
     request: Request
 {% if cookiecutter.use_database == "yes" -%}
     , conn: DBConnection
 {% endif -%}
 ) -> JsonResponse[HealthResponse]:
 {% if cookiecutter.use_database == "yes" -%}
+{% if cookiecutter.use_async_database == "yes" -%}
     db_health = await conn.execute(select(1))
+{% else -%}
+    db_health = conn.execute(select(1))
+{% endif -%}
     health_result = db_health.scalar()
 
-    status = Status(database=(health_result == 1))
+    status = Status(
+        database=(health_result == 1),
+        pool=PoolStatus(**db_client.pool_monitor.snapshot()),
+    )
 
     result = HealthResponse(
         name=settings.APP_NAME,
@@ -0,0 +1,12 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from src.helper.metrics import CONTENT_TYPE, registry
+
+metrics_router = APIRouter(tags=["Metrics"])
+
+
+@metrics_router.get(path="/metrics", include_in_schema=False)
+def metrics() -> PlainTextResponse:
+    """Expose metrics in the Prometheus text format (runs in the threadpool: may read shared files)."""
+    return PlainTextResponse(registry.render(), media_type=CONTENT_TYPE)
@@ -0,0 +1,114 @@
+{% if cookiecutter.use_database == "yes" -%}
+{% if cookiecutter.use_async_database == "yes" -%}
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+{% else -%}
+import threading
+from contextlib import contextmanager
+from typing import Iterator, Optional
+{% endif -%}
+
+from src.config import settings
+from src.exceptions.database import DatabaseUnavailableError
+from src.helper.metrics import db_admission_rejections_total
+
+
+class AdmissionController:
+    """
+    Fail-fast admission in front of primary pool checkout.
+
+    At most ``capacity`` requests (the pool size plus overflow) hold a primary
+    connection at once. Further requests wait in a queue of at most
+    ``DB_ADMISSION_MAX_QUEUE`` for up to ``DB_ADMISSION_MAX_WAIT`` seconds,
+    and are rejected with ``DatabaseUnavailableError`` (503 with Retry-After)
+    when the queue is full or the wait runs out, rather than piling up on the
+    pool for ``DB_POOL_TIMEOUT``.
+    """
+
+    def __init__(self) -> None:
+        self.capacity = 0
+        self.waiting = 0
+        self.rejected = 0
+{% if cookiecutter.use_async_database == "yes" -%}
+        self._semaphore: Optional[asyncio.Semaphore] = None
+{% else -%}
+        self._semaphore: Optional[threading.Semaphore] = None
+        self._lock = threading.Lock()
+{% endif -%}
+
+    def configure(self, capacity: int) -> None:
+        """
+        Admit up to ``capacity`` concurrent connections.
+
+        Requests already admitted release the slot they acquired, so resizing
+        along with a rebuilt pool is safe.
+        """
+        self.capacity = capacity
+{% if cookiecutter.use_async_database == "yes" -%}
+        self._semaphore = asyncio.Semaphore(capacity)
+{% else -%}
+        self._semaphore = threading.Semaphore(capacity)
+{% endif -%}
+
+{% if cookiecutter.use_async_database == "yes" -%}
+    @asynccontextmanager
+    async def admit(self) -> AsyncIterator[None]:
+        """Hold an admission slot for the lifetime of one connection."""
+        semaphore = self._semaphore
+        current = settings.snapshot()
+        if semaphore is None or not current.DB_ADMISSION_CONTROL:
+            yield
+            return
+
+        if semaphore.locked():
+            if self.waiting >= current.DB_ADMISSION_MAX_QUEUE:
+                self._reject("queue_full")
+            self.waiting += 1
+            try:
+                await asyncio.wait_for(semaphore.acquire(), current.DB_ADMISSION_MAX_WAIT)
+            except asyncio.TimeoutError:
+                self._reject("wait_timeout")
+            finally:
+                self.waiting -= 1
+        else:
+            await semaphore.acquire()
+        try:
+            yield
+        finally:
+            semaphore.release()
+{% else -%}
+    @contextmanager
+    def admit(self) -> Iterator[None]:
+        """Hold an admission slot for the lifetime of one connection."""
+        semaphore = self._semaphore
+        current = settings.snapshot()
+        if semaphore is None or not current.DB_ADMISSION_CONTROL:
+            yield
+            return
+
+        if not semaphore.acquire(blocking=False):
+            with self._lock:
+                queue_full = self.waiting >= current.DB_ADMISSION_MAX_QUEUE
+                if not queue_full:
+                    self.waiting += 1
+            if queue_full:
+                self._reject("queue_full")
+            try:
+                admitted = semaphore.acquire(timeout=current.DB_ADMISSION_MAX_WAIT)
+            finally:
+                with self._lock:
+                    self.waiting -= 1
+            if not admitted:
+                self._reject("wait_timeout")
+        try:
+            yield
+        finally:
+            semaphore.release()
+{% endif -%}
+
+    def _reject(self, reason: str) -> None:
+        self.rejected += 1
+        db_admission_rejections_total.inc(reason=reason)
+        raise DatabaseUnavailableError(retry_after=settings.DB_ADMISSION_RETRY_AFTER)
+{% endif -%}
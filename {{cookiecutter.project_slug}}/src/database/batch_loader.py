@@ -0,0 +1,86 @@
+{% if cookiecutter.use_database == "yes" and cookiecutter.use_async_database == "yes" -%}
+import asyncio
+import contextvars
+from typing import Awaitable, Callable, Generic, Hashable, Optional, TypeVar
+
+from src.config import settings
+from src.database.query_monitor import add_to_query_tracking, start_query_tracking
+from src.helper.metrics import db_batch_load_keys
+from src.helper.timing import add_to_request_timing, start_request_timing
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class BatchLoader(Generic[K, V]):
+    """
+    Coalesces concurrent single-key lookups into one query.
+
+    Keys requested in the same event loop iteration, or within
+    ``DB_BATCH_WINDOW_MS`` of the first, are deduplicated and passed to
+    ``fetch`` together, at most ``DB_BATCH_MAX_SIZE`` at a time. Each caller
+    gets the value ``fetch`` returned for its key, or None when it returned
+    none; if ``fetch`` raises, every caller in the batch gets the error.
+
+    Batches run in a context of their own rather than that of whichever
+    request came first. Once a batch resolves, its phase timings and
+    statements are added to every caller's request, so the ``db`` phase and
+    query count of each request include the lookup it shared.
+    """
+
+    def __init__(self, name: str, fetch: Callable[[list[K]], Awaitable[dict[K, V]]]) -> None:
+        self.name = name
+        self._fetch = fetch
+        self._pending: dict[K, list[asyncio.Future]] = {}
+        self._handle: Optional[asyncio.Handle] = None
+        self._tasks: set[asyncio.Task] = set()
+
+    async def load(self, key: K) -> Optional[V]:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.setdefault(key, []).append(future)
+        if len(self._pending) >= settings.DB_BATCH_MAX_SIZE:
+            self._dispatch()
+        elif self._handle is None:
+            window = settings.DB_BATCH_WINDOW_MS / 1000
+            if window:
+                self._handle = loop.call_later(window, self._dispatch)
+            else:
+                self._handle = loop.call_soon(self._dispatch)
+        value, timings, queries = await future
+        add_to_request_timing(timings)
+        add_to_query_tracking(queries)
+        return value
+
+    def _dispatch(self) -> None:
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        batch, self._pending = self._pending, {}
+        if not batch:
+            return
+        task = asyncio.get_running_loop().create_task(self._run(batch), context=contextvars.Context())
+        # The loop only keeps weak references to tasks
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: dict[K, list[asyncio.Future]]) -> None:
+        db_batch_load_keys.observe(len(batch), loader=self.name)
+        waiters = [(key, future) for key, futures in batch.items() for future in futures]
+        # Set in the batch's own context, reported back to the callers
+        timings, _ = start_request_timing()
+        queries, _ = start_query_tracking()
+        try:
+            values = await self._fetch(list(batch))
+            for key, future in waiters:
+                if not future.done():
+                    future.set_result((values.get(key), timings, queries))
+        except Exception as exc:
+            for _, future in waiters:
+                if not future.done():
+                    future.set_exception(exc)
+        finally:
+            # Cancelled mid-fetch: don't leave callers waiting forever
+            for _, future in waiters:
+                future.cancel()
+{% endif -%}
@@ -0,0 +1,69 @@
+{% if cookiecutter.use_database == "yes" -%}
+from dataclasses import dataclass
+from typing import Optional
+
+
+class ConnectionBudgetError(ValueError):
+    """Raised in strict mode when the connection budget cannot be honored."""
+
+
+@dataclass(frozen=True, slots=True)
+class PoolPlan:
+    """Per-process pool sizing derived from the cluster-wide connection budget."""
+    pool_size: int
+    max_overflow: int
+    processes: int
+    budget: Optional[int] = None
+
+    @property
+    def max_connections(self) -> int:
+        """Worst-case connections opened across all processes."""
+        return (self.pool_size + self.max_overflow) * self.processes
+
+    @property
+    def within_budget(self) -> bool:
+        return self.budget is None or self.max_connections <= self.budget
+
+
+def plan_pool(
+    pool_size: int,
+    max_overflow: int,
+    budget: Optional[int] = None,
+    workers: int = 1,
+    replicas: int = 1,
+    strict: bool = False,
+) -> PoolPlan:
+    """
+    Derive one process's pool size and overflow from a total connection budget.
+
+    The budget is split evenly across ``workers * replicas`` processes, and each
+    share is divided between pool and overflow in the configured
+    ``pool_size : max_overflow`` ratio. The configured sizes are an upper bound,
+    so a generous budget never grows the pool. When the budget leaves less than
+    one connection per process, every process still gets one, which exceeds
+    the budget: ``strict`` raises instead.
+    """
+    processes = workers * replicas
+    if budget is None:
+        return PoolPlan(pool_size=pool_size, max_overflow=max_overflow, processes=processes)
+
+    share = budget // processes
+    if share < 1:
+        if strict:
+            raise ConnectionBudgetError(
+                f"Connection budget {budget} is smaller than the {processes} expected processes "
+                f"({workers} workers x {replicas} replicas)"
+            )
+        return PoolPlan(pool_size=1, max_overflow=0, processes=processes, budget=budget)
+
+    if share >= pool_size + max_overflow:
+        return PoolPlan(pool_size=pool_size, max_overflow=max_overflow, processes=processes, budget=budget)
+
+    derived_pool_size = max(1, share * pool_size // (pool_size + max_overflow))
+    return PoolPlan(
+        pool_size=derived_pool_size,
+        max_overflow=share - derived_pool_size,
+        processes=processes,
+        budget=budget,
+    )
+{% endif -%}
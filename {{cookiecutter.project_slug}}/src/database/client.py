@@ -1,37 +1,121 @@
 {% if cookiecutter.use_database == "yes" -%}
 import asyncio
-from typing import Optional
-
-{% if cookiecutter.use_cloud_sql == "yes" -%}
-from google.cloud.sql.connector import Connector, create_async_connector
+import itertools
+{% if cookiecutter.use_async_database != "yes" -%}
+from concurrent.futures import ThreadPoolExecutor
 {% endif -%}
-from sqlalchemy import MetaData
+from dataclasses import dataclass
+from typing import Optional{% if cookiecutter.use_cloud_sql == "yes" %}, TYPE_CHECKING{% endif %}
+
+from sqlalchemy import MetaData, make_url, text
 {% if cookiecutter.use_async_database == "yes" -%}
-from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, create_async_engine
 {% else -%}
-from sqlalchemy import create_engine, Engine
+from sqlalchemy import Connection, create_engine, Engine
+{% endif -%}
+{% if cookiecutter.database_type == "SQLite" -%}
+from sqlalchemy.pool import {% if cookiecutter.use_async_database == "yes" %}AsyncAdaptedQueuePool{% else %}QueuePool{% endif %}
 {% endif -%}
 
-from src.config import settings
+from src.config import settings, subscribe
+from src.database.admission import AdmissionController
+from src.database.budget import PoolPlan, plan_pool
+{% if cookiecutter.database_type == "PostgreSQL" and cookiecutter.use_async_database == "yes" -%}
+from src.database.driver import connect_args, driver_name
+{% endif -%}
+{% if cookiecutter.database_type == "SQLite" -%}
+from src.database.sqlite_profile import apply_sqlite_profile
+{% endif -%}
+from src.database.pool_monitor import PoolMonitor
+from src.database.query_monitor import QueryMonitor
 from src.helper.generator import build_connection_url
+from src.helper.logger import get_logger
+from src.helper.metrics import db_pool_connections
+{% if cookiecutter.use_cloud_sql == "yes" -%}
+
+if TYPE_CHECKING:
+    from google.cloud.sql.connector import Connector
+{% endif -%}
+
+# Settings whose reload rebuilds the engine
+ENGINE_SETTINGS = (
+    "DB_POOL_SIZE",
+    "DB_MAX_OVERFLOW",
+    "DB_POOL_RECYCLE",
+    "DB_POOL_TIMEOUT",
+    "DB_POOL_PRE_PING",
+    "DB_CONNECTION_BUDGET",
+    "DB_EXPECTED_WORKERS",
+    "DB_EXPECTED_REPLICAS",
+    "DB_REPLICA_URLS",
+{%- if cookiecutter.database_type == "PostgreSQL" %}
+{%- if cookiecutter.use_async_database == "yes" %}
+    "DB_DRIVER",
+    "DB_STATEMENT_CACHE_SIZE",
+    "DB_PGBOUNCER",
+{%- endif %}
+    "POSTGRES_USER",
+    "POSTGRES_PASSWORD",
+    "POSTGRES_HOST",
+    "POSTGRES_PORT",
+    "POSTGRES_DB",
+{%- elif cookiecutter.database_type == "MySQL" %}
+    "MYSQL_USER",
+    "MYSQL_PASSWORD",
+    "MYSQL_HOST",
+    "MYSQL_PORT",
+    "MYSQL_DB",
+{%- elif cookiecutter.database_type == "SQLite" %}
+    "SQLITE_DB_PATH",
+    "SQLITE_JOURNAL_MODE",
+    "SQLITE_SYNCHRONOUS",
+    "SQLITE_BUSY_TIMEOUT",
+    "SQLITE_MMAP_SIZE",
+    "SQLITE_CACHE_SIZE",
+{%- endif %}
+)
+
+logger = get_logger(__name__)
+
+
+@dataclass(slots=True)
+class Replica:
+    """A read replica engine and its last known health."""
+    name: str
+{% if cookiecutter.use_async_database == "yes" -%}
+    engine: AsyncEngine
+{% else -%}
+    engine: Engine
+{% endif -%}
+    healthy: bool = True
 
 
 class DatabaseClient:
     def __init__(self, use_cloud_sql: bool = False):
         self.use_cloud_sql = use_cloud_sql
 {% if cookiecutter.use_cloud_sql == "yes" -%}
-        self.connector: Optional[Connector] = None
+        self.connector: Optional["Connector"] = None
 {% endif -%}
 {% if cookiecutter.use_async_database == "yes" -%}
         self._engine: Optional[AsyncEngine] = None
 {% else -%}
         self._engine: Optional[Engine] = None
 {% endif -%}
+        self.pool_plan: Optional[PoolPlan] = None
+        self.pool_monitor = PoolMonitor()
+        self.query_monitor = QueryMonitor()
+        self.admission = AdmissionController()
+        self.replicas: list[Replica] = []
+        self._replica_turn = itertools.count()
+        self._replica_monitor: Optional[asyncio.Task] = None
 
 {% if cookiecutter.use_cloud_sql == "yes" -%}
     async def init_connector(self):
         """Initialize the Cloud SQL connector using create_async_connector"""
         if self.use_cloud_sql and self.connector is None:
+            # Imported on first use: only Cloud SQL deployments pay for it
+            from google.cloud.sql.connector import Connector
+
             # Get the running event loop and pass it to Connector
             loop = asyncio.get_running_loop()
             self.connector = Connector(loop=loop)
@@ -68,78 +152,302 @@ class DatabaseClient:
     def create_engine(self) -> Engine:
 {% endif -%}
         """Create SQLAlchemy {% if cookiecutter.use_async_database == "yes" %}async {% endif %}engine"""
-        if self._engine is not None:
-            return self._engine
+        if self._engine is None:
+            self._engine = self._build_engine()
+            self.pool_monitor.attach(self._engine.pool)
+            self.query_monitor.attach(self._engine)
+            self.admission.configure(self.pool_plan.pool_size + self.pool_plan.max_overflow)
+            self.replicas = self._build_replicas()
+        return self._engine
+
+    @property
+{% if cookiecutter.use_async_database == "yes" -%}
+    def engine(self) -> AsyncEngine:
+{% else -%}
+    def engine(self) -> Engine:
+{% endif -%}
+        """Current engine; replaced when connection settings are reloaded."""
+        return self.create_engine()
+
+{% if cookiecutter.use_async_database == "yes" -%}
+    def _build_engine(self) -> AsyncEngine:
+{% else -%}
+    def _build_engine(self) -> Engine:
+{% endif -%}
+        # Size this process's pool from the cluster-wide connection budget
+        self.pool_plan = plan = plan_pool(
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            budget=settings.DB_CONNECTION_BUDGET or None,
+            workers=settings.DB_EXPECTED_WORKERS or settings.worker_count,
+            replicas=settings.DB_EXPECTED_REPLICAS,
+            strict=settings.DB_BUDGET_STRICT,
+        )
 
 {% if cookiecutter.use_cloud_sql == "yes" -%}
         if self.use_cloud_sql:
             # Use async_creator for Cloud SQL connector
-            self._engine = create_async_engine(
+            return create_async_engine(
 {%- if cookiecutter.database_type == "PostgreSQL" %}
                 "postgresql+asyncpg://",
 {%- elif cookiecutter.database_type == "MySQL" %}
                 "mysql+asyncmy://",
 {%- endif %}
                 async_creator=self.get_connection_callable,
-                pool_size=settings.DB_POOL_SIZE,
-                max_overflow=settings.DB_MAX_OVERFLOW,
+                pool_size=plan.pool_size,
+                max_overflow=plan.max_overflow,
                 pool_recycle=settings.DB_POOL_RECYCLE,
                 pool_timeout=settings.DB_POOL_TIMEOUT,
                 pool_pre_ping=settings.DB_POOL_PRE_PING,
             )
-        else:
+
 {% endif -%}
 {%- if cookiecutter.database_type == "PostgreSQL" %}
-            connection_url = build_connection_url(
+        connection_url = build_connection_url(
 {% if cookiecutter.use_async_database == "yes" -%}
-                driver_name="postgresql+psycopg",
+            driver_name=driver_name(),
 {% else -%}
-                driver_name="postgresql+psycopg2",
+            driver_name="postgresql+psycopg2",
 {% endif -%}
-                username=settings.POSTGRES_USER,
-                password=settings.POSTGRES_PASSWORD,
-                host=settings.POSTGRES_HOST,
-                port=settings.POSTGRES_PORT,
-                database=settings.POSTGRES_DB,
-            )
+            username=settings.POSTGRES_USER,
+            password=settings.POSTGRES_PASSWORD,
+            host=settings.POSTGRES_HOST,
+            port=settings.POSTGRES_PORT,
+            database=settings.POSTGRES_DB,
+        )
 {%- elif cookiecutter.database_type == "MySQL" %}
-            connection_url = build_connection_url(
+        connection_url = build_connection_url(
 {% if cookiecutter.use_async_database == "yes" -%}
-                driver_name="mysql+asyncmy",
+            driver_name="mysql+asyncmy",
 {% else -%}
-                driver_name="mysql+pymysql",
+            driver_name="mysql+pymysql",
 {% endif -%}
-                username=settings.MYSQL_USER,
-                password=settings.MYSQL_PASSWORD,
-                host=settings.MYSQL_HOST,
-                port=settings.MYSQL_PORT,
-                database=settings.MYSQL_DB,
-            )
+            username=settings.MYSQL_USER,
+            password=settings.MYSQL_PASSWORD,
+            host=settings.MYSQL_HOST,
+            port=settings.MYSQL_PORT,
+            database=settings.MYSQL_DB,
+        )
 {%- elif cookiecutter.database_type == "SQLite" %}
-            connection_url = f"sqlite{% if cookiecutter.use_async_database == "yes" %}+aiosqlite{% endif %}:///{settings.SQLITE_DB_PATH}"
+        connection_url = f"sqlite{% if cookiecutter.use_async_database == "yes" %}+aiosqlite{% endif %}:///{settings.SQLITE_DB_PATH}"
 {%- endif %}
 
+{% if cookiecutter.database_type == "SQLite" -%}
+        # Keep connections open: each holds its PRAGMAs, page cache and memory
+        # map. A file has no server to drop them, so no pre-ping or recycling.
 {% if cookiecutter.use_async_database == "yes" -%}
-            self._engine = create_async_engine(
+        engine = create_async_engine(
+            url=connection_url,
+            poolclass=AsyncAdaptedQueuePool,
 {% else -%}
-            self._engine = create_engine(
+        engine = create_engine(
+            url=connection_url,
+            poolclass=QueuePool,
 {% endif -%}
-                url=connection_url,
-                pool_size=settings.DB_POOL_SIZE,
-                max_overflow=settings.DB_MAX_OVERFLOW,
-                pool_recycle=settings.DB_POOL_RECYCLE,
-                pool_timeout=settings.DB_POOL_TIMEOUT,
-                pool_pre_ping=settings.DB_POOL_PRE_PING,
+            pool_size=plan.pool_size,
+            max_overflow=plan.max_overflow,
+            pool_timeout=settings.DB_POOL_TIMEOUT,
+        )
+        apply_sqlite_profile(engine)
+        return engine
+{% else -%}
+{% if cookiecutter.use_async_database == "yes" -%}
+        return create_async_engine(
+{% else -%}
+        return create_engine(
+{% endif -%}
+            url=connection_url,
+            pool_size=plan.pool_size,
+            max_overflow=plan.max_overflow,
+            pool_recycle=settings.DB_POOL_RECYCLE,
+            pool_timeout=settings.DB_POOL_TIMEOUT,
+            pool_pre_ping=settings.DB_POOL_PRE_PING,
+{% if cookiecutter.database_type == "PostgreSQL" and cookiecutter.use_async_database == "yes" -%}
+            connect_args=connect_args(settings.DB_DRIVER),
+{% endif -%}
+        )
+{% endif -%}
+
+    def _build_replicas(self) -> list[Replica]:
+        """Build one engine per DB_REPLICA_URLS entry, each pooled like the primary."""
+        plan = self.pool_plan
+        replicas = [
+            Replica(
+                name=make_url(url).render_as_string(hide_password=True),
+{% if cookiecutter.use_async_database == "yes" -%}
+                engine=create_async_engine(
+{% else -%}
+                engine=create_engine(
+{% endif -%}
+                    url=url,
+                    pool_size=plan.pool_size,
+                    max_overflow=plan.max_overflow,
+                    pool_recycle=settings.DB_POOL_RECYCLE,
+                    pool_timeout=settings.DB_POOL_TIMEOUT,
+                    pool_pre_ping=settings.DB_POOL_PRE_PING,
+{% if cookiecutter.database_type == "PostgreSQL" and cookiecutter.use_async_database == "yes" -%}
+                    connect_args=connect_args(make_url(url).get_driver_name()),
+{% endif -%}
+                ),
             )
+            for url in settings.DB_REPLICA_URLS
+        ]
+        for replica in replicas:
+            self.query_monitor.attach(replica.engine)
+{% if cookiecutter.database_type == "SQLite" -%}
+            apply_sqlite_profile(replica.engine)
+{% endif -%}
+        return replicas
 
-        return self._engine
+    def select_replica(self) -> Optional[Replica]:
+        """Pick a healthy replica per DB_REPLICA_SELECTION, or None to read from the primary."""
+        healthy = [replica for replica in self.replicas if replica.healthy]
+        if not healthy:
+            return None
+        if settings.DB_REPLICA_SELECTION == "least_busy":
+            return min(healthy, key=_checked_out)
+        return healthy[next(self._replica_turn) % len(healthy)]
+
+    def mark_replica_unhealthy(self, replica: Replica, error: Exception) -> None:
+        """Take a replica out of rotation until a health check succeeds."""
+        if not replica.healthy:
+            return
+        replica.healthy = False
+        logger.warning(
+            "Database replica removed from rotation",
+            event_type="db_replica_unhealthy",
+            replica=replica.name,
+            error=str(error) or type(error).__name__,
+        )
+
+{% if cookiecutter.use_async_database == "yes" -%}
+    async def check_replicas(self) -> None:
+{% else -%}
+    def check_replicas(self) -> None:
+{% endif -%}
+        """Ping every replica, removing failing ones from rotation and restoring recovered ones."""
+        for replica in self.replicas:
+            try:
+{% if cookiecutter.use_async_database == "yes" -%}
+                connection = await _open_checked(replica.engine)
+                await connection.close()
+{% else -%}
+                _open_checked(replica.engine).close()
+{% endif -%}
+            except Exception as exc:
+                self.mark_replica_unhealthy(replica, exc)
+                continue
+            if not replica.healthy:
+                replica.healthy = True
+                logger.info("Database replica restored", event_type="db_replica_restored", replica=replica.name)
+
+    def start_replica_monitor(self) -> None:
+        """Health-check replicas every DB_REPLICA_HEALTH_INTERVAL seconds on the running loop."""
+        if self.replicas and self._replica_monitor is None:
+            self._replica_monitor = asyncio.get_running_loop().create_task(self._monitor_replicas())
+
+    async def _monitor_replicas(self) -> None:
+        while True:
+            await asyncio.sleep(settings.DB_REPLICA_HEALTH_INTERVAL)
+{% if cookiecutter.use_async_database == "yes" -%}
+            await self.check_replicas()
+{% else -%}
+            await asyncio.to_thread(self.check_replicas)
+{% endif -%}
+
+    async def rebuild_engine(self, *_) -> None:
+        """
+        Replace the engine after connection settings change.
+
+        New requests check out connections from the new pool right away. The old
+        pool is disposed: idle connections are closed now, and connections still
+        checked out finish their work and are closed when returned.
+{%- if cookiecutter.use_async_database != "yes" %}
+        Closing connections blocks, so disposal runs in a worker thread rather
+        than on the event loop that applies the reload.
+{%- endif %}
+        """
+        old_engine = self._engine
+        if old_engine is None:
+            return
+        old_replicas = self.replicas
+        self._engine = self._build_engine()
+        self.pool_monitor.attach(self._engine.pool)
+        self.query_monitor.attach(self._engine)
+        self.admission.configure(self.pool_plan.pool_size + self.pool_plan.max_overflow)
+        self.replicas = self._build_replicas()
+        for engine in [old_engine, *(replica.engine for replica in old_replicas)]:
+{% if cookiecutter.use_async_database == "yes" -%}
+            await engine.dispose()
+{% else -%}
+            await asyncio.to_thread(engine.dispose)
+{% endif -%}
+
+{% if cookiecutter.use_async_database == "yes" -%}
+    async def warm_up(self, connections: int) -> int:
+{% else -%}
+    def warm_up(self, connections: int) -> int:
+{% endif -%}
+        """
+        Open pool connections concurrently and return them to the pool.
+
+        Each connection runs its connect-time setup and a ``SELECT 1`` round
+        trip, so the first requests after startup skip the handshakes. The count
+        is capped at the pool size, since overflow connections are discarded
+        when returned. Returns the number of connections warmed.
+        """
+        engine = self.engine
+        count = min(connections, self.pool_plan.pool_size)
+        if count <= 0:
+            return 0
+
+{% if cookiecutter.use_async_database == "yes" -%}
+        results = await asyncio.gather(*(_open_checked(engine) for _ in range(count)), return_exceptions=True)
+{% else -%}
+        with ThreadPoolExecutor(max_workers=count, thread_name_prefix="db-warmup") as executor:
+            futures = [executor.submit(_open_checked, engine) for _ in range(count)]
+        results = [future.exception() or future.result() for future in futures]
+{% endif -%}
+        opened = [result for result in results if not isinstance(result, BaseException)]
+        for connection in opened:
+{% if cookiecutter.use_async_database == "yes" -%}
+            await connection.close()
+{% else -%}
+            connection.close()
+{% endif -%}
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        return len(opened)
+
+    def pool_stats(self) -> dict[tuple[str, ...], float]:
+        """Get connection pool usage by state, for the pool gauge."""
+        if self._engine is None:
+            return {}
+        pool = self._engine.pool
+        stats = {}
+        for state in ("size", "checkedin", "checkedout", "overflow"):
+            reader = getattr(pool, state, None)
+            if callable(reader):
+                stats[(state,)] = float(reader())
+        stats[("waiting",)] = float(self.pool_monitor.waiting)
+        return stats
 
 {% if cookiecutter.use_async_database == "yes" -%}
     async def close(self):
 {% else -%}
     def close(self):
 {% endif -%}
-        """Close the database engine and connector"""
+        """Close the database engines and connector"""
+        if self._replica_monitor is not None:
+            self._replica_monitor.cancel()
+            self._replica_monitor = None
+        for replica in self.replicas:
+{% if cookiecutter.use_async_database == "yes" -%}
+            await replica.engine.dispose()
+{% else -%}
+            replica.engine.dispose()
+{% endif -%}
         if self._engine:
 {% if cookiecutter.use_async_database == "yes" -%}
             await self._engine.dispose()
@@ -154,11 +462,39 @@ class DatabaseClient:
 {% endif -%}
 
 
+def _checked_out(replica: Replica) -> int:
+    reader = getattr(replica.engine.pool, "checkedout", None)
+    return reader() if callable(reader) else 0
+
+
+{% if cookiecutter.use_async_database == "yes" -%}
+async def _open_checked(engine: AsyncEngine) -> AsyncConnection:
+    connection = await engine.connect()
+    try:
+        await connection.execute(text("SELECT 1"))
+    except BaseException:
+        await connection.close()
+        raise
+    return connection
+{% else -%}
+def _open_checked(engine: Engine) -> Connection:
+    connection = engine.connect()
+    try:
+        connection.execute(text("SELECT 1"))
+    except BaseException:
+        connection.close()
+        raise
+    return connection
+{% endif -%}
+
+
 {% if cookiecutter.use_cloud_sql == "yes" -%}
 client = DatabaseClient(use_cloud_sql=settings.USE_CLOUD_SQL)
 {% else -%}
 client = DatabaseClient()
 {% endif -%}
-engine = client.create_engine()
+db_pool_connections.set_function(client.pool_stats)
+# Rebuild the pool when connection or pool settings are reloaded
+subscribe(ENGINE_SETTINGS, client.rebuild_engine)
 metadata = MetaData()
 {% endif -%}
@@ -0,0 +1,45 @@
+{% if cookiecutter.use_database == "yes" and cookiecutter.database_type == "PostgreSQL" and cookiecutter.use_async_database == "yes" -%}
+from typing import Any
+from uuid import uuid4
+
+from src.config import settings
+
+# SQLAlchemy driver name for each DB_DRIVER
+DRIVER_NAMES = {
+    "psycopg": "postgresql+psycopg",
+    "asyncpg": "postgresql+asyncpg",
+}
+
+
+def driver_name() -> str:
+    """SQLAlchemy driver name for the configured DB_DRIVER."""
+    return DRIVER_NAMES[settings.DB_DRIVER]
+
+
+def connect_args(driver: str) -> dict[str, Any]:
+    """
+    Driver connect arguments for prepared statement reuse.
+
+    asyncpg prepares every statement and keeps the last
+    ``DB_STATEMENT_CACHE_SIZE`` per connection, so repeated query shapes skip
+    parsing and planning. With ``DB_PGBOUNCER``, consecutive transactions may
+    run on different server connections, so server-side prepared statements are
+    disabled (asyncpg still prepares, under unique names, which is safe).
+    """
+    if driver == "asyncpg":
+        if settings.DB_PGBOUNCER:
+            return {
+                "prepared_statement_cache_size": 0,
+                "statement_cache_size": 0,
+                "prepared_statement_name_func": _unique_statement_name,
+            }
+        return {"prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE}
+    if driver == "psycopg" and settings.DB_PGBOUNCER:
+        # psycopg prepares a query after its fifth execution by default
+        return {"prepare_threshold": None}
+    return {}
+
+
+def _unique_statement_name() -> str:
+    return f"__asyncpg_{uuid4()}__"
+{% endif -%}
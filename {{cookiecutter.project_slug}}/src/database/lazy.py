@@ -0,0 +1,124 @@
+{% if cookiecutter.use_database == "yes" -%}
+{% if cookiecutter.use_async_database == "yes" -%}
+from contextlib import AbstractAsyncContextManager, AsyncExitStack
+from typing import Any, Callable, Optional
+
+from sqlalchemy import Result
+from sqlalchemy.ext.asyncio import AsyncConnection
+{% else -%}
+from contextlib import AbstractContextManager, ExitStack
+from typing import Any, Callable, Optional
+
+from sqlalchemy import Connection, Result
+{% endif -%}
+
+
+class LazyConnection:
+    """
+    Connection proxy checking out a pooled connection on first use.
+
+    The first ``execute`` opens a connection through ``opener``. ``commit`` and
+    ``rollback`` end the transaction and hand the connection back at once, and
+    ``release`` hands it back explicitly once the caller's database work is
+    done, so the pool slot is not held across password hashing, token signing
+    or response serialization. A later ``execute`` checks out a new connection.
+
+    Exposes the part of the connection API repositories use; anything else goes
+    through ``connection()``.
+    """
+
+{% if cookiecutter.use_async_database == "yes" -%}
+    def __init__(self, opener: Callable[[], AbstractAsyncContextManager[AsyncConnection]]) -> None:
+        self._opener = opener
+        self._stack: Optional[AsyncExitStack] = None
+        self._connection: Optional[AsyncConnection] = None
+        self.checkouts = 0
+
+    @property
+    def acquired(self) -> bool:
+        return self._connection is not None
+
+    async def connection(self) -> AsyncConnection:
+        """The underlying connection, checked out now if not held yet."""
+        if self._connection is None:
+            stack = AsyncExitStack()
+            self._connection = await stack.enter_async_context(self._opener())
+            self._stack = stack
+            self.checkouts += 1
+        return self._connection
+
+    async def execute(self, statement: Any, parameters: Any = None, **kwargs: Any) -> Result:
+        connection = await self.connection()
+        return await connection.execute(statement, parameters, **kwargs)
+
+    async def scalar(self, statement: Any, parameters: Any = None, **kwargs: Any) -> Any:
+        connection = await self.connection()
+        return await connection.scalar(statement, parameters, **kwargs)
+
+    async def commit(self) -> None:
+        if self._connection is not None:
+            await self._connection.commit()
+            await self.release()
+
+    async def rollback(self) -> None:
+        if self._connection is not None:
+            await self._connection.rollback()
+            await self.release()
+
+    async def release(self) -> None:
+        """Return the connection to the pool, rolling back any open transaction."""
+        stack = self._stack
+        if stack is None:
+            return
+        self._stack = self._connection = None
+        await stack.aclose()
+{% else -%}
+    def __init__(self, opener: Callable[[], AbstractContextManager[Connection]]) -> None:
+        self._opener = opener
+        self._stack: Optional[ExitStack] = None
+        self._connection: Optional[Connection] = None
+        self.checkouts = 0
+
+    @property
+    def acquired(self) -> bool:
+        return self._connection is not None
+
+    def connection(self) -> Connection:
+        """The underlying connection, checked out now if not held yet."""
+        if self._connection is None:
+            stack = ExitStack()
+            self._connection = stack.enter_context(self._opener())
+            self._stack = stack
+            self.checkouts += 1
+        return self._connection
+
+    def execute(self, statement: Any, parameters: Any = None, **kwargs: Any) -> Result:
+        return self.connection().execute(statement, parameters, **kwargs)
+
+    def scalar(self, statement: Any, parameters: Any = None, **kwargs: Any) -> Any:
+        return self.connection().scalar(statement, parameters, **kwargs)
+
+    def commit(self) -> None:
+        if self._connection is not None:
+            self._connection.commit()
+            self.release()
+
+    def rollback(self) -> None:
+        if self._connection is not None:
+            self._connection.rollback()
+            self.release()
+
+    def release(self) -> None:
+        """
+        Return the connection to the pool, rolling back any open transaction.
+
+        Consume results before releasing: unlike the async driver, sync results
+        read rows from the open cursor.
+        """
+        stack = self._stack
+        if stack is None:
+            return
+        self._stack = self._connection = None
+        stack.close()
+{% endif -%}
+{% endif -%}
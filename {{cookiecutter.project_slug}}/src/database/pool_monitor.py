@@ -0,0 +1,102 @@
+{% if cookiecutter.use_database == "yes" -%}
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Iterator
+
+from sqlalchemy import event
+from sqlalchemy.pool import Pool
+
+from src.config import settings
+from src.helper.logger import get_logger
+from src.helper.metrics import db_pool_checkout_wait_seconds, db_pool_connection_events_total
+
+logger = get_logger(__name__)
+
+# Pool events counted, by the name they are reported under
+POOL_EVENTS = {
+    "connect": "created",
+    "close": "closed",
+    "invalidate": "invalidated",
+    "soft_invalidate": "soft_invalidated",
+}
+
+
+class PoolMonitor:
+    """
+    Connection pool instrumentation.
+
+    Counts connections created, closed and invalidated through pool events,
+    times every checkout (the wait on ``DB_POOL_TIMEOUT`` included) into the
+    ``db_pool_checkout_wait_seconds`` histogram, and logs a ``db_pool_saturated``
+    event, at most once per ``DB_POOL_SATURATION_LOG_INTERVAL``, when more than
+    ``DB_POOL_SATURATION_WAITERS`` callers wait for a connection at once.
+    """
+
+    def __init__(self) -> None:
+        self.pool: Pool | None = None
+        self.waiting = 0
+        self.events = dict.fromkeys(POOL_EVENTS.values(), 0)
+        self._lock = threading.Lock()
+        self._last_saturation_log = 0.0
+
+    def attach(self, pool: Pool) -> None:
+        """Listen to the events of ``pool``; counters carry over from a previous pool."""
+        self.pool = pool
+        for event_name, counted_as in POOL_EVENTS.items():
+            event.listen(pool, event_name, self._counter(counted_as))
+
+    def _counter(self, counted_as: str) -> Any:
+        def on_event(*_: Any) -> None:
+            with self._lock:
+                self.events[counted_as] += 1
+            db_pool_connection_events_total.inc(event=counted_as)
+        return on_event
+
+    @contextmanager
+    def checkout(self) -> Iterator[None]:
+        """Time a connection checkout and track how many callers are waiting."""
+        with self._lock:
+            self.waiting += 1
+            waiting = self.waiting
+        if waiting > settings.DB_POOL_SATURATION_WAITERS:
+            self._log_saturation(waiting)
+
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            db_pool_checkout_wait_seconds.observe(time.perf_counter() - start)
+            with self._lock:
+                self.waiting -= 1
+
+    def _log_saturation(self, waiting: int) -> None:
+        now = time.monotonic()
+        if now - self._last_saturation_log < settings.DB_POOL_SATURATION_LOG_INTERVAL:
+            return
+        self._last_saturation_log = now
+        logger.warning(
+            "Database pool saturated",
+            event_type="db_pool_saturated",
+            waiting=waiting,
+            **self.usage(),
+        )
+
+    def usage(self) -> dict[str, int]:
+        """Current pool usage: configured size, checked out, idle and overflow connections."""
+        usage = {}
+        for name, state in (("pool_size", "size"), ("checked_out", "checkedout"),
+                            ("idle", "checkedin"), ("overflow", "overflow")):
+            reader = getattr(self.pool, state, None)
+            if callable(reader):
+                usage[name] = reader()
+        if "overflow" in usage:
+            # QueuePool counts overflow from -pool_size while the pool fills up
+            usage["overflow"] = max(usage["overflow"], 0)
+        return usage
+
+    def snapshot(self) -> dict[str, int]:
+        """Pool usage, callers waiting for a connection and connection event counts."""
+        with self._lock:
+            return {**self.usage(), "waiting": self.waiting, **self.events}
+{% endif -%}
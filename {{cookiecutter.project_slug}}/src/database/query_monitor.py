@@ -0,0 +1,195 @@
+{% if cookiecutter.use_database == "yes" -%}
+import re
+import threading
+import time
+from collections import deque
+from contextvars import ContextVar, Token
+from functools import lru_cache
+from typing import Any, Optional
+
+from sqlalchemy import event
+
+from src.config import settings
+from src.helper.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Recent durations kept per fingerprint for percentiles
+SAMPLES_PER_FINGERPRINT = 512
+# Distinct fingerprints aggregated; statements beyond this are only counted as dropped
+MAX_FINGERPRINTS = 2000
+
+_WHITESPACE = re.compile(r"\s+")
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_PLACEHOLDER = re.compile(r"%\(\w+\)s|%s|\$\d+|(?<!:):\w+|\?")
+_NUMBER_LITERAL = re.compile(r"(?<![\w.])\d+(?:\.\d+)?\b")
+_VALUE_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_REPEATED_VALUE_LISTS = re.compile(r"\(\.\.\.\)(?:\s*,\s*\(\.\.\.\))+")
+
+
+@lru_cache(maxsize=4096)
+def fingerprint(statement: str) -> str:
+    """
+    Normalize a statement so executions differing only in values share a fingerprint.
+
+    Literals and bound parameters become ``?``, and value lists (``IN``
+    lists, multi-row ``VALUES``) collapse to ``(...)`` whatever their length.
+    """
+    normalized = _WHITESPACE.sub(" ", statement).strip()
+    normalized = _STRING_LITERAL.sub("?", normalized)
+    normalized = _PLACEHOLDER.sub("?", normalized)
+    normalized = _NUMBER_LITERAL.sub("?", normalized)
+    normalized = _VALUE_LIST.sub("(...)", normalized)
+    return _REPEATED_VALUE_LISTS.sub("(...)", normalized)
+
+
+class RequestQueries:
+    """Statements executed while handling one request, by fingerprint."""
+    __slots__ = ("count", "duration_ms", "by_fingerprint")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.duration_ms = 0.0
+        self.by_fingerprint: dict[str, int] = {}
+
+    def add(self, key: str, duration_ms: float) -> int:
+        """Record one execution and return how many times ``key`` has run in this request."""
+        self.count += 1
+        self.duration_ms += duration_ms
+        executions = self.by_fingerprint.get(key, 0) + 1
+        self.by_fingerprint[key] = executions
+        return executions
+
+
+_request_queries: ContextVar[Optional[RequestQueries]] = ContextVar("request_queries", default=None)
+
+
+def start_query_tracking() -> tuple[RequestQueries, Token]:
+    """Count the statements executed by the current request."""
+    queries = RequestQueries()
+    return queries, _request_queries.set(queries)
+
+
+def stop_query_tracking(token: Token) -> None:
+    """Stop the counting started by ``start_query_tracking``."""
+    _request_queries.reset(token)
+
+
+def add_to_query_tracking(queries: RequestQueries) -> None:
+    """Count statements run on the current request's behalf elsewhere, such as in a shared batch."""
+    current = _request_queries.get()
+    if current is None:
+        return
+    current.count += queries.count
+    current.duration_ms += queries.duration_ms
+    for key, executions in queries.by_fingerprint.items():
+        current.by_fingerprint[key] = current.by_fingerprint.get(key, 0) + executions
+
+
+class FingerprintStats:
+    """Aggregate timings of one statement fingerprint."""
+    __slots__ = ("count", "total_ms", "max_ms", "samples")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.samples: deque[float] = deque(maxlen=SAMPLES_PER_FINGERPRINT)
+
+    def add(self, duration_ms: float) -> None:
+        self.count += 1
+        self.total_ms += duration_ms
+        self.max_ms = max(self.max_ms, duration_ms)
+        self.samples.append(duration_ms)
+
+    def as_dict(self, key: str) -> dict[str, Any]:
+        samples = sorted(self.samples)
+        return {
+            "fingerprint": key,
+            "count": self.count,
+            "total_ms": round(self.total_ms, 2),
+            "mean_ms": round(self.total_ms / self.count, 2),
+            "p95_ms": round(samples[min(len(samples) - 1, int(len(samples) * 0.95))], 2),
+            "max_ms": round(self.max_ms, 2),
+        }
+
+
+class QueryMonitor:
+    """
+    Statement timing from SQLAlchemy cursor execution events.
+
+    Every statement is timed and aggregated under its fingerprint. Statements
+    slower than ``DB_SLOW_QUERY_MS`` log a ``db_slow_query`` event, and a
+    fingerprint running more than ``DB_N_PLUS_ONE_THRESHOLD`` times in one
+    request logs a ``db_n_plus_one_detected`` event once for that request.
+    Both carry the request context of the log line (request ID, route).
+    """
+
+    def __init__(self) -> None:
+        self.dropped = 0
+        self._stats: dict[str, FingerprintStats] = {}
+        self._lock = threading.Lock()
+
+    def attach(self, engine: Any) -> None:
+        """Time the statements executed through ``engine``."""
+        # Async engines emit execution events on their sync counterpart
+        target = getattr(engine, "sync_engine", engine)
+        event.listen(target, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(target, "after_cursor_execute", self._after_cursor_execute)
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        context._query_started = time.perf_counter()
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        started = getattr(context, "_query_started", None)
+        if started is not None:
+            self.record(statement, (time.perf_counter() - started) * 1000)
+
+    def record(self, statement: str, duration_ms: float) -> None:
+        """Aggregate one execution and report it if slow or repeated within the request."""
+        key = fingerprint(statement)
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None and len(self._stats) < MAX_FINGERPRINTS:
+                stats = self._stats[key] = FingerprintStats()
+            if stats is None:
+                self.dropped += 1
+            else:
+                stats.add(duration_ms)
+
+        current = settings.snapshot()
+        if current.DB_SLOW_QUERY_MS and duration_ms >= current.DB_SLOW_QUERY_MS:
+            logger.warning(
+                "Slow database query",
+                event_type="db_slow_query",
+                fingerprint=key,
+                duration_ms=round(duration_ms, 2),
+            )
+
+        queries = _request_queries.get()
+        if queries is None:
+            return
+        executions = queries.add(key, duration_ms)
+        threshold = current.DB_N_PLUS_ONE_THRESHOLD
+        if threshold and executions == threshold + 1:
+            logger.warning(
+                "Query repeated within one request",
+                event_type="db_n_plus_one_detected",
+                fingerprint=key,
+                executions=executions,
+                threshold=threshold,
+            )
+
+    def stats(self, limit: Optional[int] = None) -> list[dict[str, Any]]:
+        """Per-fingerprint aggregates, by total time spent, highest first."""
+        with self._lock:
+            rows = [stats.as_dict(key) for key, stats in self._stats.items()]
+        rows.sort(key=lambda row: row["total_ms"], reverse=True)
+        return rows[:limit] if limit else rows
+
+    def reset(self) -> None:
+        """Drop every aggregate."""
+        with self._lock:
+            self._stats.clear()
+            self.dropped = 0
+{% endif -%}
@@ -0,0 +1,59 @@
+{% if cookiecutter.use_database == "yes" and cookiecutter.database_type == "SQLite" -%}
+from typing import Any
+
+from sqlalchemy import event
+
+from src.config import settings
+
+
+def sqlite_pragmas() -> list[tuple[str, str | int]]:
+    """PRAGMAs applied to every new SQLite connection, from the SQLITE_* settings."""
+    return [
+        ("journal_mode", settings.SQLITE_JOURNAL_MODE),
+        ("synchronous", settings.SQLITE_SYNCHRONOUS),
+        ("busy_timeout", settings.SQLITE_BUSY_TIMEOUT),
+        ("mmap_size", settings.SQLITE_MMAP_SIZE),
+        # A negative cache_size is in KiB rather than pages
+        ("cache_size", -settings.SQLITE_CACHE_SIZE),
+        ("temp_store", "MEMORY"),
+    ]
+
+
+def apply_sqlite_profile(engine: Any) -> None:
+    """
+    Apply the SQLite profile to each connection ``engine`` opens.
+
+    WAL lets readers run alongside the single writer, and with it
+    ``synchronous=NORMAL`` is still safe against corruption, syncing at
+    checkpoints instead of every commit. The PRAGMAs are per connection, so
+    they are set from a pool ``connect`` event.
+
+    SQLAlchemy also emits ``BEGIN`` itself rather than leaving it to the
+    driver, which only begins before DML: otherwise a savepoint opened first
+    starts the transaction and commits it when released.
+    """
+    # Async engines emit pool and connection events on their sync counterpart
+    sync_engine = getattr(engine, "sync_engine", engine)
+    event.listen(sync_engine, "connect", _on_connect)
+    event.listen(sync_engine, "begin", _on_begin)
+
+
+def _on_connect(dbapi_connection: Any, _: Any) -> None:
+    dbapi_connection.isolation_level = None
+    cursor = dbapi_connection.cursor()
+    try:
+        for name, value in sqlite_pragmas():
+            cursor.execute(f"PRAGMA {name}={value}")
+    finally:
+        cursor.close()
+
+
+def _on_begin(conn: Any) -> None:
+    # On the DBAPI connection, like the BEGIN other drivers send implicitly,
+    # so statement instrumentation doesn't count it
+    cursor = conn.connection.dbapi_connection.cursor()
+    try:
+        cursor.execute("BEGIN")
+    finally:
+        cursor.close()
+{% endif -%}
@@ -0,0 +1,57 @@
+{% if cookiecutter.use_database == "yes" -%}
+{% if cookiecutter.use_async_database == "yes" -%}
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+{% else -%}
+from contextlib import contextmanager
+from typing import Iterator
+{% endif -%}
+
+from src.database.lazy import LazyConnection
+
+
+class UnitOfWork:
+    """
+    One transaction for all of a request's writes.
+
+    Repositories execute on ``connection`` without committing. The request
+    commits once, through ``commit`` or when the endpoint returns, and rolls
+    back if it raises. ``savepoint`` wraps a step that may fail without
+    discarding the writes around it.
+
+    Don't ``release`` the connection with writes pending: releasing rolls
+    them back.
+    """
+
+    def __init__(self, connection: LazyConnection) -> None:
+        self.connection = connection
+
+{% if cookiecutter.use_async_database == "yes" -%}
+    @asynccontextmanager
+    async def savepoint(self) -> AsyncIterator[None]:
+        """Nested transaction, rolled back alone if the block raises."""
+        connection = await self.connection.connection()
+        async with connection.begin_nested():
+            yield
+
+    async def commit(self) -> None:
+        """Commit and return the connection; a no-op without pending work."""
+        await self.connection.commit()
+
+    async def rollback(self) -> None:
+        await self.connection.rollback()
+{% else -%}
+    @contextmanager
+    def savepoint(self) -> Iterator[None]:
+        """Nested transaction, rolled back alone if the block raises."""
+        with self.connection.connection().begin_nested():
+            yield
+
+    def commit(self) -> None:
+        """Commit and return the connection; a no-op without pending work."""
+        self.connection.commit()
+
+    def rollback(self) -> None:
+        self.connection.rollback()
+{% endif -%}
+{% endif -%}
@@ -0,0 +1,13 @@
+import secrets
+
+from fastapi import Header
+
+from src.config import settings
+from src.exceptions.admin import InvalidAdminTokenError
+
+
+def require_admin_token(x_admin_token: str = Header(default="", description="Admin token")) -> None:
+    """Allow the request only when it carries the configured admin token."""
+    expected = settings.ADMIN_TOKEN
+    if not expected or not secrets.compare_digest(x_admin_token.encode(), expected.encode()):
+        raise InvalidAdminTokenError()
@@ -1,27 +1,74 @@
+{% if cookiecutter.use_async_database == "yes" -%}
+from typing import Awaitable, Callable, Sequence
+
+from fastapi import Depends, Header, Request
+from sqlalchemy.engine.row import RowMapping
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from src.database.batch_loader import BatchLoader
+from src.dependencies.database import read_connection, reads_from_primary
+{% else -%}
 from fastapi import Depends, Header
 
-from src.dependencies.database import DBConnection
+from src.dependencies.database import DBReadConnection
+{% endif -%}
 from src.repositories.user import UserRepositories
+{% if cookiecutter.use_async_database == "yes" -%}
+from src.services.auth import AuthService, UserLoaders
+{% else -%}
 from src.services.auth import AuthService
+{% endif -%}
 from src.helper.jwt_token import JWTHelper
+from src.helper.request_context import bind_user_id
 from src.exceptions.auth import UnauthorizedError
 from src.schemas.auth import UserResponse
 
 
+{% if cookiecutter.use_async_database == "yes" -%}
+def _user_loader(
+    name: str,
+    fetch_many: Callable[[AsyncConnection, Sequence[str]], Awaitable[dict[str, RowMapping]]],
+    use_primary: bool,
+) -> BatchLoader[str, RowMapping]:
+    async def fetch(keys: list[str]) -> dict[str, RowMapping]:
+        async with read_connection(use_primary) as conn:
+            return await fetch_many(conn, keys)
+
+    return BatchLoader(name, fetch)
+
+
+_user_repo = UserRepositories()
+# Module level, so lookups from concurrent requests land in the same batch.
+# Lookups by id may read a replica unless the request must read its own
+# writes; email lookups back login, so they read the primary.
+user_loaders = UserLoaders(
+    by_id=_user_loader("user_by_id", _user_repo.get_many_by_id, use_primary=False),
+    by_id_primary=_user_loader("user_by_id_primary", _user_repo.get_many_by_id, use_primary=True),
+    by_email=_user_loader("user_by_email", _user_repo.get_many_by_email, use_primary=True),
+)
+
+
+def get_auth_service() -> AuthService:
+    """Get authentication service instance."""
+    jwt_helper = JWTHelper()
+    return AuthService(user_repo=_user_repo, jwt_helper=jwt_helper, user_loaders=user_loaders)
+{% else -%}
 def get_auth_service() -> AuthService:
     """Get authentication service instance."""
     jwt_helper = JWTHelper()
     user_repo = UserRepositories()
     return AuthService(user_repo=user_repo, jwt_helper=jwt_helper)
+{% endif -%}
 
 
 {% if cookiecutter.use_async_database == "yes" -%}
 async def get_current_user(
+    request: Request,
 {% else -%}
 def get_current_user(
+    conn: DBReadConnection,
 {% endif -%}
     authorization: str = Header(..., description="Bearer token"),
-    conn: DBConnection = Depends(),
     auth_service: AuthService = Depends(get_auth_service),
 ) -> UserResponse:
     """Get current authenticated user from Bearer token."""
@@ -33,8 +80,9 @@ def get_current_user(
 
     # Get user from token
 {% if cookiecutter.use_async_database == "yes" -%}
-    user = await auth_service.get_current_user(conn, token)
+    user = await auth_service.get_current_user(token, read_primary=reads_from_primary(request))
 {% else -%}
     user = auth_service.get_current_user(conn, token)
 {% endif -%}
+    bind_user_id(user.id)
     return user
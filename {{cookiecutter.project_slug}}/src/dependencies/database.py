@@ -1,29 +1,200 @@
 {% if cookiecutter.use_database == "yes" -%}
+{% if cookiecutter.use_async_database == "yes" -%}
+from contextlib import asynccontextmanager
+{% else -%}
+from contextlib import contextmanager
+{% endif -%}
+from functools import partial
+{% if cookiecutter.use_async_database == "yes" -%}
 from typing import Annotated, AsyncIterator
+{% else -%}
+from typing import Annotated, Iterator
+{% endif -%}
 
-from fastapi import Depends
+from fastapi import Depends, Request
 {% if cookiecutter.use_async_database == "yes" -%}
 from sqlalchemy.ext.asyncio import AsyncConnection
 {% else -%}
 from sqlalchemy import Connection
 {% endif -%}
+from sqlalchemy.exc import SQLAlchemyError
+
+from src.database.client import client
+from src.database.lazy import LazyConnection
+from src.database.unit_of_work import UnitOfWork
+from src.helper.timing import timed
 
-from src.database.client import engine
+
+def reads_from_primary(request: Request) -> bool:
+    """Whether this request's reads must see its writes, set by ``get_connection``."""
+    return getattr(request.state, "db_primary", False)
 
 
 {% if cookiecutter.use_async_database == "yes" -%}
-async def get_connection() -> AsyncIterator[AsyncConnection]:
-    async with engine.connect() as connection:
+@asynccontextmanager
+async def primary_connection() -> AsyncIterator[AsyncConnection]:
+    """Connection on the primary, checked out through admission control."""
+    # Admission fails fast with a 503 instead of queueing for DB_POOL_TIMEOUT
+    async with client.admission.admit():
+        with timed("db_connect"), client.pool_monitor.checkout():
+            connection = await client.engine.connect()
+        try:
+            yield connection
+        finally:
+            await connection.close()
+
+
+async def get_connection(request: Request) -> AsyncIterator[LazyConnection]:
+    """
+    Primary connection, checked out on the first query rather than here.
+
+    Services release it once their database work is done; whatever is still
+    held is released when the endpoint returns, before the response is sent.
+    """
+    # Reads later in this request go to the primary too (read-your-writes)
+    request.state.db_primary = True
+    connection = LazyConnection(primary_connection)
+    try:
+        yield connection
+    finally:
+        await connection.release()
+
+
+@asynccontextmanager
+async def read_connection(use_primary: bool = False) -> AsyncIterator[AsyncConnection]:
+    """Connection on a healthy replica, falling back to the primary."""
+    replica = None if use_primary else client.select_replica()
+    if replica is not None:
+        try:
+            with timed("db_connect"):
+                connection = await replica.engine.connect()
+        except (SQLAlchemyError, OSError) as exc:
+            client.mark_replica_unhealthy(replica, exc)
+        else:
+            try:
+                yield connection
+            finally:
+                await connection.close()
+            return
+
+    async with primary_connection() as connection:
+        yield connection
+
+
+async def get_read_connection(request: Request) -> AsyncIterator[LazyConnection]:
+    """
+    Connection for read-only queries: a healthy replica, or the primary when no
+    replica is configured or healthy, or when this request already holds a
+    primary connection. Declare ``DBConnection`` first in endpoints that write.
+    Checked out lazily like ``get_connection``.
+    """
+    connection = LazyConnection(partial(read_connection, reads_from_primary(request)))
+    try:
         yield connection
+    finally:
+        await connection.release()
 
 
-DBConnection: type[AsyncConnection] = Annotated[AsyncConnection, Depends(get_connection)]
+# Function scope releases before the response is sent, not after
+DBConnection: type[LazyConnection] = Annotated[LazyConnection, Depends(get_connection, scope="function")]
+DBReadConnection: type[LazyConnection] = Annotated[LazyConnection, Depends(get_read_connection, scope="function")]
+
+
+async def get_unit_of_work(conn: DBConnection) -> AsyncIterator[UnitOfWork]:
+    """
+    Request transaction on the primary: committed once when the endpoint
+    returns, or rolled back if it raises.
+    """
+    unit_of_work = UnitOfWork(conn)
+    try:
+        yield unit_of_work
+    except BaseException:
+        await unit_of_work.rollback()
+        raise
+    await unit_of_work.commit()
+
+
+DBUnitOfWork: type[UnitOfWork] = Annotated[UnitOfWork, Depends(get_unit_of_work, scope="function")]
 {% else -%}
-def get_connection() -> Iterator[Connection]:
-    with engine.connect() as connection:
+@contextmanager
+def primary_connection() -> Iterator[Connection]:
+    """Connection on the primary, checked out through admission control."""
+    # Admission fails fast with a 503 instead of queueing for DB_POOL_TIMEOUT
+    with client.admission.admit():
+        with timed("db_connect"), client.pool_monitor.checkout():
+            connection = client.engine.connect()
+        with connection:
+            yield connection
+
+
+def get_connection(request: Request) -> Iterator[LazyConnection]:
+    """
+    Primary connection, checked out on the first query rather than here.
+
+    Services release it once their database work is done; whatever is still
+    held is released when the endpoint returns, before the response is sent.
+    """
+    # Reads later in this request go to the primary too (read-your-writes)
+    request.state.db_primary = True
+    connection = LazyConnection(primary_connection)
+    try:
+        yield connection
+    finally:
+        connection.release()
+
+
+@contextmanager
+def read_connection(use_primary: bool = False) -> Iterator[Connection]:
+    """Connection on a healthy replica, falling back to the primary."""
+    replica = None if use_primary else client.select_replica()
+    if replica is not None:
+        try:
+            with timed("db_connect"):
+                connection = replica.engine.connect()
+        except (SQLAlchemyError, OSError) as exc:
+            client.mark_replica_unhealthy(replica, exc)
+        else:
+            with connection:
+                yield connection
+            return
+
+    with primary_connection() as connection:
+        yield connection
+
+
+def get_read_connection(request: Request) -> Iterator[LazyConnection]:
+    """
+    Connection for read-only queries: a healthy replica, or the primary when no
+    replica is configured or healthy, or when this request already holds a
+    primary connection. Declare ``DBConnection`` first in endpoints that write.
+    Checked out lazily like ``get_connection``.
+    """
+    connection = LazyConnection(partial(read_connection, reads_from_primary(request)))
+    try:
         yield connection
+    finally:
+        connection.release()
+
+
+# Function scope releases before the response is sent, not after
+DBConnection: type[LazyConnection] = Annotated[LazyConnection, Depends(get_connection, scope="function")]
+DBReadConnection: type[LazyConnection] = Annotated[LazyConnection, Depends(get_read_connection, scope="function")]
+
+
+def get_unit_of_work(conn: DBConnection) -> Iterator[UnitOfWork]:
+    """
+    Request transaction on the primary: committed once when the endpoint
+    returns, or rolled back if it raises.
+    """
+    unit_of_work = UnitOfWork(conn)
+    try:
+        yield unit_of_work
+    except BaseException:
+        unit_of_work.rollback()
+        raise
+    unit_of_work.commit()
 
 
-DBConnection: type[Connection] = Annotated[Connection, Depends(get_connection)]
+DBUnitOfWork: type[UnitOfWork] = Annotated[UnitOfWork, Depends(get_unit_of_work, scope="function")]
 {% endif -%}
 {% endif -%}
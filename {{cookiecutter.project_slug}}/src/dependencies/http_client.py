@@ -1,14 +1,19 @@
 {% if cookiecutter.include_middleware_logging == "yes" -%}
-import httpx
-from typing import AsyncGenerator
+from typing import AsyncGenerator, TYPE_CHECKING
 
+if TYPE_CHECKING:
+    import httpx
 
-_http_client: httpx.AsyncClient = None
 
+_http_client: "httpx.AsyncClient" = None
 
-async def get_http_client() -> AsyncGenerator[httpx.AsyncClient, None]:
+
+async def get_http_client() -> AsyncGenerator["httpx.AsyncClient", None]:
     global _http_client
     if _http_client is None:
+        # Imported on first use to keep httpx off the startup path
+        import httpx
+
         _http_client = httpx.AsyncClient(
             timeout=30.0,
             limits=httpx.Limits(max_keepalive_connections=20, max_connections=100)
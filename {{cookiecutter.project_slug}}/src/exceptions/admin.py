@@ -0,0 +1,24 @@
+"""Admin endpoint exceptions."""
+
+from src.exceptions.base import BaseCustomException
+from fastapi import status
+
+
+class InvalidAdminTokenError(BaseCustomException):
+    """Raised when the admin token is missing, invalid or admin endpoints are disabled."""
+    def __init__(self, message: str = "Invalid admin token"):
+        super().__init__(
+            message=message,
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            error_code="INVALID_ADMIN_TOKEN"
+        )
+
+
+class SettingsReloadError(BaseCustomException):
+    """Raised when reloaded settings fail validation."""
+    def __init__(self, message: str = "Settings reload failed"):
+        super().__init__(
+            message=message,
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            error_code="SETTINGS_RELOAD_FAILED"
+        )
@@ -14,9 +14,10 @@ class BaseCustomException(HTTPException):
             message: str | list[str],
             status_code: int = 500,
             error_code: str = None,
-            details: dict = None
+            details: dict = None,
+            headers: dict[str, str] = None
     ):
-        super().__init__(status_code=status_code, detail=message)
+        super().__init__(status_code=status_code, detail=message, headers=headers)
         self.message = message
         self.error_code = error_code
         self.details = details
@@ -92,6 +93,7 @@ def create_exception_handler(
         code = status_code
         detail = message or str(exc)
         error_code = "InternalServerError"
+        headers = None
 
         # 1. FastAPI validation
         if isinstance(exc, RequestValidationError):
@@ -104,6 +106,7 @@ def create_exception_handler(
             code = exc.status_code
             detail = exc.detail
             error_code = type(exc).__name__
+            headers = exc.headers
 
         # 3. Custom attribute check
         elif hasattr(exc, "message"):
@@ -120,6 +123,6 @@ def create_exception_handler(
             status_code=code
         ).model_dump(exclude_none=True, exclude_unset=True)
 
-        return ORJSONResponse(error_result, status_code=code)
+        return ORJSONResponse(error_result, status_code=code, headers=headers)
 
     return handler
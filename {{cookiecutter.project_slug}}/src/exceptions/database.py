@@ -0,0 +1,17 @@
+{% if cookiecutter.use_database == "yes" -%}
+"""Database exceptions."""
+
+from src.exceptions.base import BaseCustomException
+from fastapi import status
+
+
+class DatabaseUnavailableError(BaseCustomException):
+    """Raised when a request is refused a database connection because the pool is saturated."""
+    def __init__(self, message: str = "Database is busy, retry shortly", retry_after: int = 1):
+        super().__init__(
+            message=message,
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            error_code="DATABASE_UNAVAILABLE",
+            headers={"Retry-After": str(retry_after)},
+        )
+{% endif -%}
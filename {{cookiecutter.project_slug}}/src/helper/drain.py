@@ -0,0 +1,142 @@
+import asyncio
+import os
+import signal
+import time
+from functools import partial
+from types import FrameType
+from typing import Any, Optional
+
+from src.config import settings
+from src.helper.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class RequestDrainer:
+    """
+    In-flight request tracking for graceful shutdown.
+
+    Once draining starts, new requests are rejected (see ``DrainMiddleware``)
+    and ``wait`` returns when the requests already running have finished or
+    the drain deadline has passed, whichever comes first.
+    """
+
+    def __init__(self) -> None:
+        self.in_flight = 0
+        self.draining = False
+        self.drain_started_at: Optional[float] = None
+        self.drain_seconds: Optional[float] = None
+        self._idle: Optional[asyncio.Event] = None
+
+    def enter(self) -> None:
+        self.in_flight += 1
+
+    def exit(self) -> None:
+        self.in_flight -= 1
+        if self.in_flight == 0 and self._idle is not None:
+            self._idle.set()
+
+    def start(self) -> None:
+        """Enter the draining state. Idempotent."""
+        if self.draining:
+            return
+        self.draining = True
+        self.drain_started_at = time.monotonic()
+        self._idle = asyncio.Event()
+        if self.in_flight == 0:
+            self._idle.set()
+
+    async def wait(self, timeout: float) -> int:
+        """
+        Drain for at most ``timeout`` seconds after draining started.
+
+        Returns the number of requests still in flight at the deadline.
+        """
+        self.start()
+        remaining = self.drain_started_at + timeout - time.monotonic()
+        if self.in_flight and remaining > 0:
+            try:
+                await asyncio.wait_for(self._idle.wait(), remaining)
+            except asyncio.TimeoutError:
+                pass
+        if self.drain_seconds is None:
+            self.drain_seconds = time.monotonic() - self.drain_started_at
+        return self.in_flight
+
+    def reset(self) -> None:
+        """Leave the draining state, for an application started again in the same process."""
+        self.__init__()
+
+
+drainer = RequestDrainer()
+
+_previous_sigterm_handler: Any = None
+# Keep a reference to the signal-triggered drain until it finishes
+_pending_drains: set[asyncio.Task] = set()
+
+
+def install_drain_signal_handler() -> bool:
+    """
+    Drain in-flight requests on SIGTERM before passing the signal on to the server.
+
+    The server's own handler (uvicorn's, for instance) runs once the drain
+    finishes, so readiness fails and new requests are rejected while running
+    ones complete. Returns False where signal handlers are unavailable.
+    """
+    global _previous_sigterm_handler
+    loop = asyncio.get_running_loop()
+    try:
+        previous = signal.signal(signal.SIGTERM, partial(_on_sigterm, loop))
+    except ValueError:
+        # Not on the main thread (e.g. test clients)
+        return False
+    _previous_sigterm_handler = previous
+    return True
+
+
+def remove_drain_signal_handler() -> None:
+    """Restore the SIGTERM handler replaced by ``install_drain_signal_handler``."""
+    global _previous_sigterm_handler
+    if _previous_sigterm_handler is None:
+        return
+    try:
+        signal.signal(signal.SIGTERM, _previous_sigterm_handler)
+    except ValueError:
+        return
+    _previous_sigterm_handler = None
+
+
+def _on_sigterm(loop: asyncio.AbstractEventLoop, signum: int, frame: Optional[FrameType]) -> None:
+    if drainer.draining:
+        # A second SIGTERM skips what is left of the drain
+        _forward_signal(signum, frame)
+        return
+    drainer.start()
+    loop.call_soon_threadsafe(_schedule_drain, signum)
+
+
+def _schedule_drain(signum: int) -> None:
+    task = asyncio.ensure_future(_drain_then_forward(signum))
+    _pending_drains.add(task)
+    task.add_done_callback(_pending_drains.discard)
+
+
+async def _drain_then_forward(signum: int) -> None:
+    logger.info(
+        "Draining in-flight requests",
+        event_type="app_drain_started",
+        in_flight=drainer.in_flight,
+        drain_timeout_seconds=settings.DRAIN_TIMEOUT,
+    )
+    await drainer.wait(settings.DRAIN_TIMEOUT)
+    _forward_signal(signum, None)
+
+
+def _forward_signal(signum: int, frame: Optional[FrameType]) -> None:
+    previous = _previous_sigterm_handler
+    if callable(previous):
+        previous(signum, frame)
+    elif previous in (signal.SIG_DFL, None):
+        remove_drain_signal_handler()
+        signal.signal(signum, signal.SIG_DFL)
+        os.kill(os.getpid(), signum)
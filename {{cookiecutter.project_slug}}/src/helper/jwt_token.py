@@ -2,14 +2,18 @@ import hashlib
 import secrets
 from datetime import datetime, timedelta, timezone
 
-import jwt
-
 from src.config import settings
 from src.exceptions.jwt_token import TokenExpiredError, InvalidTokenError, InvalidTokenTypeError
+from src.helper.timing import timed
 
 
 class JWTHelper:
-    """JWT token helper for generating and validating tokens."""
+    """
+    JWT token helper for generating and validating tokens.
+
+    PyJWT is imported on first use, so processes that never handle a token
+    (migrations, scripts) do not load it and its crypto backends.
+    """
 
     @staticmethod
     def create_access_token(payload: dict, expires_delta: timedelta = None) -> str:
@@ -23,16 +27,20 @@ class JWTHelper:
         Returns:
             Encoded JWT token string
         """
+        current = settings.snapshot()
         to_encode = payload.copy()
 
         if expires_delta:
             expire = datetime.now(timezone.utc) + expires_delta
         else:
-            expire = datetime.now(timezone.utc) + timedelta(minutes=settings.JWT_ACCESS_TOKEN_EXPIRE_MINUTES)
+            expire = datetime.now(timezone.utc) + timedelta(minutes=current.JWT_ACCESS_TOKEN_EXPIRE_MINUTES)
 
         to_encode.update({"exp": expire, "type": "access"})
 
-        return jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.JWT_ALGORITHM)
+        import jwt
+
+        with timed("jwt"):
+            return jwt.encode(to_encode, current.SECRET_KEY, algorithm=current.JWT_ALGORITHM)
 
     @staticmethod
     def create_refresh_token(payload: dict, expires_delta: timedelta = None) -> str:
@@ -46,16 +54,20 @@ class JWTHelper:
         Returns:
             Encoded JWT token string
         """
+        current = settings.snapshot()
         to_encode = payload.copy()
 
         if expires_delta:
             expire = datetime.now(timezone.utc) + expires_delta
         else:
-            expire = datetime.now(timezone.utc) + timedelta(days=settings.JWT_REFRESH_TOKEN_EXPIRE_DAYS)
+            expire = datetime.now(timezone.utc) + timedelta(days=current.JWT_REFRESH_TOKEN_EXPIRE_DAYS)
 
         to_encode.update({"exp": expire, "type": "refresh", "jti": secrets.token_urlsafe(32)})
 
-        return jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.JWT_ALGORITHM)
+        import jwt
+
+        with timed("jwt"):
+            return jwt.encode(to_encode, current.SECRET_KEY, algorithm=current.JWT_ALGORITHM)
 
     @staticmethod
     def verify_token(token: str, token_type: str = "access") -> dict:
@@ -74,8 +86,12 @@ class JWTHelper:
             InvalidTokenError: If token is malformed or invalid
             InvalidTokenTypeError: If token type doesn't match expected type
         """
+        import jwt
+
+        current = settings.snapshot()
         try:
-            payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.JWT_ALGORITHM])
+            with timed("jwt"):
+                payload = jwt.decode(token, current.SECRET_KEY, algorithms=[current.JWT_ALGORITHM])
 
             # Check token type
             received_type = payload.get("type")
@@ -0,0 +1,164 @@
+import collections
+import logging
+import sys
+import threading
+from typing import TextIO
+
+OVERFLOW_BLOCK = "block"
+OVERFLOW_DROP_OLDEST = "drop_oldest"
+OVERFLOW_DROP_DEBUG_FIRST = "drop_debug_first"
+OVERFLOW_POLICIES = (OVERFLOW_BLOCK, OVERFLOW_DROP_OLDEST, OVERFLOW_DROP_DEBUG_FIRST)
+
+
+class BackgroundLogHandler(logging.Handler):
+    """
+    Logging handler that writes records from a dedicated writer thread.
+
+    Records are appended to a bounded in-memory queue and the writer thread
+    formats and writes them in batches (one ``write`` call per batch), so
+    callers on the event loop never wait on a slow stdout pipe.
+
+    Overflow policies when the queue is full:
+    - ``block``: wait until the writer frees a slot (no loss, applies backpressure)
+    - ``drop_oldest``: discard the oldest queued record
+    - ``drop_debug_first``: discard DEBUG records first, then the oldest record
+    """
+
+    terminator = "\n"
+
+    def __init__(
+        self,
+        stream: TextIO | None = None,
+        max_queue_size: int = 10000,
+        batch_size: int = 256,
+        overflow_policy: str = OVERFLOW_BLOCK,
+    ) -> None:
+        if overflow_policy not in OVERFLOW_POLICIES:
+            raise ValueError(f"Invalid overflow policy. Must be one of: {list(OVERFLOW_POLICIES)}")
+
+        super().__init__()
+        self.stream = stream or sys.stdout
+        self.max_queue_size = max_queue_size
+        self.batch_size = batch_size
+        self.overflow_policy = overflow_policy
+
+        self._queue: collections.deque[logging.LogRecord] = collections.deque()
+        self._debug_pending = 0
+        self._writing = False
+        self._closing = False
+
+        self._mutex = threading.Lock()
+        self._not_empty = threading.Condition(self._mutex)
+        self._not_full = threading.Condition(self._mutex)
+        self._drained = threading.Condition(self._mutex)
+
+        # Counters
+        self.queued = 0
+        self.dropped = 0
+        self.written = 0
+
+        self._thread = threading.Thread(target=self._run, name="log-writer", daemon=True)
+        self._thread.start()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        with self._mutex:
+            if len(self._queue) >= self.max_queue_size and not self._make_room(record):
+                self.dropped += 1
+                return
+
+            self._queue.append(record)
+            if record.levelno <= logging.DEBUG:
+                self._debug_pending += 1
+            self.queued += 1
+            self._not_empty.notify()
+
+    def _make_room(self, record: logging.LogRecord) -> bool:
+        """Apply the overflow policy. Must be called with the mutex held."""
+        if self.overflow_policy == OVERFLOW_BLOCK:
+            while len(self._queue) >= self.max_queue_size and not self._closing:
+                self._not_full.wait()
+            return not self._closing
+
+        if self.overflow_policy == OVERFLOW_DROP_DEBUG_FIRST:
+            if record.levelno <= logging.DEBUG:
+                return False
+            if self._debug_pending:
+                for index, queued in enumerate(self._queue):
+                    if queued.levelno <= logging.DEBUG:
+                        del self._queue[index]
+                        self._debug_pending -= 1
+                        self.dropped += 1
+                        return True
+
+        # drop_oldest, and the fallback for drop_debug_first
+        oldest = self._queue.popleft()
+        if oldest.levelno <= logging.DEBUG:
+            self._debug_pending -= 1
+        self.dropped += 1
+        return True
+
+    def _run(self) -> None:
+        while True:
+            with self._mutex:
+                while not self._queue and not self._closing:
+                    self._not_empty.wait()
+                if not self._queue:
+                    return
+
+                batch = [self._queue.popleft() for _ in range(min(len(self._queue), self.batch_size))]
+                self._debug_pending -= sum(1 for record in batch if record.levelno <= logging.DEBUG)
+                self._writing = True
+                self._not_full.notify_all()
+
+            self._write_batch(batch)
+
+            with self._mutex:
+                self._writing = False
+                self.written += len(batch)
+                if not self._queue:
+                    self._drained.notify_all()
+
+    def _write_batch(self, batch: list[logging.LogRecord]) -> None:
+        lines = []
+        for record in batch:
+            try:
+                lines.append(self.format(record) + self.terminator)
+            except Exception:
+                self.handleError(record)
+
+        if not lines:
+            return
+
+        try:
+            self.stream.write("".join(lines))
+            self.stream.flush()
+        except Exception:
+            self.handleError(batch[-1])
+
+    def flush(self, timeout: float | None = 5.0) -> bool:
+        """Wait until every queued record has been written. Returns False on timeout."""
+        with self._mutex:
+            if not self._thread.is_alive():
+                return not self._queue
+            self._not_empty.notify()
+            return self._drained.wait_for(lambda: not self._queue and not self._writing, timeout)
+
+    def close(self) -> None:
+        """Flush pending records and stop the writer thread."""
+        self.flush()
+        with self._mutex:
+            self._closing = True
+            self._not_empty.notify_all()
+            self._not_full.notify_all()
+        self._thread.join(timeout=5.0)
+        super().close()
+
+    def stats(self) -> dict[str, int]:
+        """Return queue counters."""
+        with self._mutex:
+            return {
+                "queued": self.queued,
+                "pending": len(self._queue),
+                "dropped": self.dropped,
+                "written": self.written,
+            }
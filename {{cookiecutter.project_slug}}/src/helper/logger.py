@@ -2,17 +2,19 @@
 import logging
 import logging.config
 import sys
-from typing import Any, Dict
+from typing import Any
 
+import orjson
 import structlog
-from pythonjsonlogger.json import JsonFormatter
 
-from src.config import settings
+from src.config import Settings, settings, subscribe
+from src.helper.log_writer import BackgroundLogHandler
+from src.helper.request_context import RequestContextFilter, add_request_context
 from src.version import VERSION
 
 
 def setup_logging() -> None:
-    """Configure logging with JSON format using structlog and python-json-logger."""
+    """Configure logging with JSON format using structlog and orjson."""
 
     # Configure standard library logging
     _configure_stdlib_logging()
@@ -20,55 +22,28 @@ def setup_logging() -> None:
     # Configure structlog
     _configure_structlog()
 
+    # Follow LOG_LEVEL changes on settings reload
+    subscribe(("LOG_LEVEL",), _apply_log_level)
+
 
 def _configure_stdlib_logging() -> None:
-    """Configure standard library logging with JSON formatter."""
-
-    # Create custom JSON formatter
-    class CustomJsonFormatter(JsonFormatter):
-        def add_fields(self, log_record: Dict[str, Any], record: logging.LogRecord,
-                       message_dict: Dict[str, Any]) -> None:
-            super().add_fields(log_record, record, message_dict)
-
-            # Add standard fields
-            log_record['timestamp'] = record.created
-            log_record['level'] = record.levelname
-            log_record['logger'] = record.name
-            log_record['module'] = record.module
-            log_record['function'] = record.funcName
-            log_record['line'] = record.lineno
-            log_record['app_name'] = settings.APP_NAME
-            log_record['app_env'] = settings.APP_ENV
-            log_record['app_version'] = VERSION
-
-            # Extract structured data from JSON message
-            if isinstance(log_record.get('message'), str):
-                try:
-                    import json
-                    message_data = json.loads(log_record['message'])
-                    if isinstance(message_data, dict):
-                        # Extract event_type to root level
-                        if 'event_type' in message_data:
-                            log_record['event_type'] = message_data.pop('event_type')
-
-                        # Use the human-readable 'event' as the message
-                        if 'event' in message_data:
-                            log_record['message'] = message_data.pop('event')
-
-                        # Add remaining structured fields to log record
-                        for key, value in message_data.items():
-                            if key not in ['logger', 'level', 'timestamp']:  # Skip duplicates
-                                log_record[key] = value
-                except (json.JSONDecodeError, TypeError):
-                    # If it's not JSON, leave as is
-                    pass
+    """Configure standard library logging with a single-pass JSON formatter."""
 
     # Configure handler
-    handler = logging.StreamHandler(sys.stdout)
+    handler = _create_handler()
 
     if settings.LOG_FORMAT == "json":
-        formatter = CustomJsonFormatter(
-            fmt='%(timestamp)s %(level)s %(logger)s %(module)s %(function)s %(line)s %(message)s'
+        formatter = structlog.stdlib.ProcessorFormatter(
+            # Records from standard library loggers keep their `extra` fields
+            foreign_pre_chain=[structlog.stdlib.ExtraAdder()],
+            processors=[
+                structlog.processors.format_exc_info,
+                OrjsonRenderer(static_fields={
+                    'app_name': settings.APP_NAME,
+                    'app_env': settings.APP_ENV,
+                    'app_version': VERSION,
+                }),
+            ],
         )
     else:
         formatter = logging.Formatter(
@@ -77,10 +52,11 @@ def _configure_stdlib_logging() -> None:
         )
 
     handler.setFormatter(formatter)
+    handler.addFilter(RequestContextFilter())
 
     # Configure root logger
     root_logger = logging.getLogger()
-    root_logger.handlers.clear()
+    _close_handlers(root_logger)
     root_logger.addHandler(handler)
     root_logger.setLevel(settings.LOG_LEVEL)
 
@@ -91,23 +67,107 @@ def _configure_stdlib_logging() -> None:
 {% endif -%}
 
 
+def _apply_log_level(_: Settings, new: Settings) -> None:
+    """Apply a reloaded LOG_LEVEL to the root logger."""
+    logging.getLogger().setLevel(new.LOG_LEVEL)
+
+
+class OrjsonRenderer:
+    """
+    Final processor rendering a log event to a JSON line with a single orjson pass.
+
+    Record fields (timestamp, level, logger, module, function, line) are read
+    from the standard library record, and the static application fields are
+    encoded once at setup and spliced into every line.
+    """
+
+    _RECORD_KEYS = ('timestamp', 'level', 'logger')
+
+    def __init__(self, static_fields: dict[str, Any]) -> None:
+        self.static_fields = static_fields
+        self._static_json = orjson.dumps(static_fields)[1:-1]
+
+    def __call__(self, _: Any, __: str, event_dict: dict[str, Any]) -> str:
+        record: logging.LogRecord = event_dict.pop('_record')
+        event_dict.pop('_from_structlog', None)
+        for key in self._RECORD_KEYS:
+            event_dict.pop(key, None)
+
+        log_record = {
+            'timestamp': record.created,
+            'level': record.levelname,
+            'logger': record.name,
+            'module': record.module,
+            'function': record.funcName,
+            'line': record.lineno,
+            'message': event_dict.pop('event', None),
+        }
+        log_record.update(event_dict)
+
+        if not self._static_json or not self.static_fields.keys() & log_record.keys():
+            rendered = orjson.dumps(log_record, default=repr)
+            if self._static_json:
+                rendered = rendered[:-1] + b',' + self._static_json + b'}'
+        else:
+            # An event field shadows a static field: merge, the event wins
+            rendered = orjson.dumps({**self.static_fields, **log_record}, default=repr)
+        return rendered.decode()
+
+
+def _create_handler() -> logging.Handler:
+    """Create the root log handler, writing from a background thread when LOG_ASYNC is enabled."""
+    if not settings.LOG_ASYNC:
+        return logging.StreamHandler(sys.stdout)
+
+    return BackgroundLogHandler(
+        stream=sys.stdout,
+        max_queue_size=settings.LOG_QUEUE_SIZE,
+        batch_size=settings.LOG_BATCH_SIZE,
+        overflow_policy=settings.LOG_QUEUE_OVERFLOW,
+    )
+
+
+def _close_handlers(root_logger: logging.Logger) -> None:
+    """Detach and close existing root handlers so background writers are stopped."""
+    for handler in root_logger.handlers[:]:
+        root_logger.removeHandler(handler)
+        handler.close()
+
+
+def shutdown_logging() -> None:
+    """Flush queued log records and stop the background writer."""
+    _close_handlers(logging.getLogger())
+
+
+def get_log_queue_stats() -> dict[str, int] | None:
+    """Get counters of the background log writer, or None when logging synchronously."""
+    for handler in logging.getLogger().handlers:
+        if isinstance(handler, BackgroundLogHandler):
+            return handler.stats()
+    return None
+
+
 def _configure_structlog() -> None:
     """Configure structlog for structured logging."""
 
     processors = [
         structlog.stdlib.filter_by_level,
-        structlog.stdlib.add_logger_name,
-        structlog.stdlib.add_log_level,
+        add_request_context,
         structlog.stdlib.PositionalArgumentsFormatter(),
-        structlog.processors.TimeStamper(fmt="iso"),
         structlog.processors.StackInfoRenderer(),
         structlog.processors.format_exc_info,
     ]
 
     if settings.LOG_FORMAT == "json":
-        processors.append(structlog.processors.JSONRenderer())
+        # Handed to the handler's formatter as a dict and rendered there, once
+        processors.append(structlog.stdlib.ProcessorFormatter.wrap_for_formatter)
     else:
-        processors.append(structlog.dev.ConsoleRenderer())
+        processors.extend([
+            structlog.stdlib.add_logger_name,
+            structlog.stdlib.add_log_level,
+            structlog.processors.TimeStamper(fmt="iso"),
+            structlog.dev.ConsoleRenderer(),
+        ])
 
     structlog.configure(
         processors=processors,
@@ -129,33 +189,90 @@ logger = get_logger(__name__)
 import logging
 import sys
 
-from src.config import settings
+from src.config import Settings, settings, subscribe
+from src.helper.log_writer import BackgroundLogHandler
+from src.helper.request_context import RequestContextFilter
 
 
 def setup_logging() -> None:
     """Configure basic logging."""
 
     # Configure handler
-    handler = logging.StreamHandler(sys.stdout)
+    handler = _create_handler()
     formatter = logging.Formatter(
-        fmt='%(asctime)s - %(name)s - %(levelname)s - %(module)s:%(funcName)s:%(lineno)d - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
+        fmt='%(asctime)s - %(name)s - %(levelname)s - %(module)s:%(funcName)s:%(lineno)d - %(request_id)s - %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S',
+        defaults={'request_id': '-'}
     )
     handler.setFormatter(formatter)
+    handler.addFilter(RequestContextFilter())
 
     # Configure root logger
     root_logger = logging.getLogger()
-    root_logger.handlers.clear()
+    _close_handlers(root_logger)
     root_logger.addHandler(handler)
     root_logger.setLevel(settings.LOG_LEVEL)
 
     # Reduce noise from third-party libraries
     logging.getLogger("uvicorn.access").setLevel(logging.WARNING)
 
+    # Follow LOG_LEVEL changes on settings reload
+    subscribe(("LOG_LEVEL",), _apply_log_level)
+
+
+def _apply_log_level(_: Settings, new: Settings) -> None:
+    """Apply a reloaded LOG_LEVEL to the root logger."""
+    logging.getLogger().setLevel(new.LOG_LEVEL)
+
+
+def _create_handler() -> logging.Handler:
+    """Create the root log handler, writing from a background thread when LOG_ASYNC is enabled."""
+    if not settings.LOG_ASYNC:
+        return logging.StreamHandler(sys.stdout)
+
+    return BackgroundLogHandler(
+        stream=sys.stdout,
+        max_queue_size=settings.LOG_QUEUE_SIZE,
+        batch_size=settings.LOG_BATCH_SIZE,
+        overflow_policy=settings.LOG_QUEUE_OVERFLOW,
+    )
+
+
+def _close_handlers(root_logger: logging.Logger) -> None:
+    """Detach and close existing root handlers so background writers are stopped."""
+    for handler in root_logger.handlers[:]:
+        root_logger.removeHandler(handler)
+        handler.close()
+
+
+def shutdown_logging() -> None:
+    """Flush queued log records and stop the background writer."""
+    _close_handlers(logging.getLogger())
+
+
+def get_log_queue_stats() -> dict[str, int] | None:
+    """Get counters of the background log writer, or None when logging synchronously."""
+    for handler in logging.getLogger().handlers:
+        if isinstance(handler, BackgroundLogHandler):
+            return handler.stats()
+    return None
+
+
+class KeywordLoggerAdapter(logging.LoggerAdapter):
+    """Logger accepting structlog-style keyword fields, passed to the record as ``extra``."""
+
+    _LOGGING_KWARGS = frozenset(('exc_info', 'stack_info', 'stacklevel', 'extra'))
+
+    def process(self, msg, kwargs):
+        fields = {key: kwargs.pop(key) for key in list(kwargs) if key not in self._LOGGING_KWARGS}
+        if fields:
+            kwargs['extra'] = {**fields, **(kwargs.get('extra') or {})}
+        return msg, kwargs
+
 
-def get_logger(name: str = None):
+def get_logger(name: str = None) -> KeywordLoggerAdapter:
     """Get a logger instance."""
-    return logging.getLogger(name)
+    return KeywordLoggerAdapter(logging.getLogger(name))
 
 
 # Create application logger instance
@@ -0,0 +1,435 @@
+import fcntl
+import glob
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterator, Optional
+
+import orjson
+
+from src.config import settings
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+DEFAULT_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# Totals of exited workers, next to the per-worker snapshots
+AGGREGATE_FILE = "metrics_aggregate.json"
+# Held shared while scraping and exclusively while compacting
+LOCK_FILE = "metrics.lock"
+
+
+class MetricsRegistry:
+    """
+    In-process metrics registry rendering the Prometheus text exposition format.
+
+    When ``multiproc_dir`` is set, every worker process periodically writes its
+    snapshot to ``<multiproc_dir>/metrics_<pid>.json`` and a scrape of any
+    worker merges all snapshots, so one scrape covers the whole pod. When a
+    worker exits, ``mark_process_dead`` folds its counters and histograms into
+    ``<multiproc_dir>/metrics_aggregate.json`` and deletes its snapshot; its
+    gauges are dropped unless their ``multiprocess_mode`` is ``max``.
+    """
+
+    def __init__(self, multiproc_dir: str = "") -> None:
+        self.multiproc_dir = multiproc_dir
+        self._metrics: dict[str, "_Metric"] = {}
+        self._flusher: Optional[threading.Thread] = None
+        self._flusher_pid: Optional[int] = None
+        self._flush_lock = threading.Lock()
+        self._stop = threading.Event()
+
+    def register(self, metric: "_Metric") -> None:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} is already registered")
+        self._metrics[metric.name] = metric
+
+    def snapshot(self) -> dict[str, dict]:
+        return {name: metric.snapshot() for name, metric in self._metrics.items()}
+
+    def flush(self) -> None:
+        """Write this process's snapshot to the shared directory."""
+        if not self.multiproc_dir:
+            return
+        os.makedirs(self.multiproc_dir, exist_ok=True)
+        path = os.path.join(self.multiproc_dir, f"metrics_{os.getpid()}.json")
+        tmp_path = f"{path}.tmp"
+        with self._flush_lock:
+            with open(tmp_path, "wb") as f:
+                f.write(orjson.dumps(self.snapshot()))
+            os.replace(tmp_path, path)
+
+    def start_flusher(self, interval: float) -> None:
+        """Start a background thread flushing snapshots every ``interval`` seconds."""
+        if not self.multiproc_dir or self._flusher_pid == os.getpid():
+            return
+
+        self._stop.clear()
+        self._flusher_pid = os.getpid()
+        self._flusher = threading.Thread(target=self._flush_loop, args=(interval,), name="metrics-flush", daemon=True)
+        self._flusher.start()
+
+    def stop_flusher(self) -> None:
+        """Stop the flusher thread and write a final snapshot."""
+        self._stop.set()
+        if self._flusher is not None and self._flusher_pid == os.getpid():
+            self._flusher.join(timeout=5.0)
+        self._flusher = None
+        self._flusher_pid = None
+        self.flush()
+
+    def _flush_loop(self, interval: float) -> None:
+        while not self._stop.wait(interval):
+            try:
+                self.flush()
+            except OSError:
+                pass
+
+    def collect(self) -> list[tuple[Optional[int], dict[str, dict]]]:
+        """Get (pid, snapshot) pairs for every process sharing the registry; the aggregate has pid None."""
+        if not self.multiproc_dir:
+            return [(os.getpid(), self.snapshot())]
+
+        self.flush()
+        snapshots = []
+        with self._locked(fcntl.LOCK_SH):
+            for path in glob.glob(os.path.join(self.multiproc_dir, "metrics_*.json")):
+                name = os.path.basename(path)
+                try:
+                    pid = None if name == AGGREGATE_FILE else int(name[len("metrics_"):-len(".json")])
+                    with open(path, "rb") as f:
+                        snapshots.append((pid, orjson.loads(f.read())))
+                except (OSError, ValueError):
+                    continue
+        return snapshots
+
+    def mark_process_dead(self, pid: int) -> None:
+        """
+        Fold the snapshot of an exited worker into the aggregate and delete it.
+
+        Called by the supervisor as it reaps the worker, so scrapes parse one
+        file per live worker plus the aggregate, and a worker reusing the PID
+        starts from its own counters.
+        """
+        if not self.multiproc_dir:
+            return
+        path = os.path.join(self.multiproc_dir, f"metrics_{pid}.json")
+        aggregate_path = os.path.join(self.multiproc_dir, AGGREGATE_FILE)
+        with self._locked(fcntl.LOCK_EX):
+            try:
+                with open(path, "rb") as f:
+                    snapshots = [(pid, orjson.loads(f.read()))]
+            except FileNotFoundError:
+                return
+            try:
+                with open(aggregate_path, "rb") as f:
+                    snapshots.insert(0, (None, orjson.loads(f.read())))
+            except FileNotFoundError:
+                pass
+
+            merged = _merge(snapshots, dead={pid})
+            aggregate = {
+                name: {**metric, "values": [[list(key), value] for key, value in metric["values"].items()]}
+                for name, metric in merged.items()
+            }
+            tmp_path = f"{aggregate_path}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(orjson.dumps(aggregate))
+            os.replace(tmp_path, aggregate_path)
+            os.remove(path)
+
+    @contextmanager
+    def _locked(self, operation: int) -> Iterator[None]:
+        os.makedirs(self.multiproc_dir, exist_ok=True)
+        with open(os.path.join(self.multiproc_dir, LOCK_FILE), "ab") as f:
+            fcntl.flock(f, operation)
+            try:
+                yield
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+    def render(self) -> str:
+        """Render all metrics, merged across processes, in the Prometheus text format."""
+        merged = _merge(self.collect())
+        lines = []
+        for name, metric in sorted(merged.items()):
+            lines.append(f"# HELP {name} {metric['help']}")
+            lines.append(f"# TYPE {name} {metric['type']}")
+            labelnames = metric["labelnames"]
+            for key, value in sorted(metric["values"].items()):
+                labels = list(zip(labelnames, key))
+                if metric["type"] == "histogram":
+                    lines.extend(_render_histogram(name, labels, metric["buckets"], value))
+                else:
+                    lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry(multiproc_dir=settings.METRICS_MULTIPROC_DIR)
+
+
+class _Metric:
+    type_name = ""
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        registry: MetricsRegistry = registry,
+    ) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self._lock = threading.Lock()
+        self._values: dict[tuple[str, ...], object] = {}
+        registry.register(self)
+
+    def _key(self, labels: dict[str, str]) -> tuple[str, ...]:
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            values = [[list(key), value] for key, value in self._values.items()]
+        return {
+            "type": self.type_name,
+            "help": self.documentation,
+            "labelnames": list(self.labelnames),
+            "values": values,
+        }
+
+
+class Counter(_Metric):
+    """Monotonically increasing counter."""
+    type_name = "counter"
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+
+class Gauge(_Metric):
+    """
+    Gauge that can go up and down, or be read from a callback at collection time.
+
+    ``multiprocess_mode`` controls aggregation across worker processes:
+    ``livesum`` sums live processes, ``max`` keeps the largest value and
+    ``all`` keeps one series per process under a ``pid`` label.
+    """
+    type_name = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        multiprocess_mode: str = "livesum",
+        registry: MetricsRegistry = registry,
+    ) -> None:
+        super().__init__(name, documentation, labelnames, registry)
+        self.multiprocess_mode = multiprocess_mode
+        self._function: Optional[Callable[[], dict[tuple[str, ...], float]]] = None
+
+    def set(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: str) -> None:
+        self.inc(-amount, **labels)
+
+    def set_function(self, function: Callable[[], dict[tuple[str, ...], float]]) -> None:
+        """Read values from ``function`` (label values tuple -> value) at collection time."""
+        self._function = function
+
+    def snapshot(self) -> dict:
+        if self._function is not None:
+            try:
+                values = self._function()
+            except Exception:
+                values = {}
+            with self._lock:
+                self._values = dict(values)
+        data = super().snapshot()
+        data["mode"] = self.multiprocess_mode
+        return data
+
+
+class Histogram(_Metric):
+    """Fixed-bucket histogram."""
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS,
+        registry: MetricsRegistry = registry,
+    ) -> None:
+        super().__init__(name, documentation, labelnames, registry)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        index = len(self.buckets)
+        for position, bound in enumerate(self.buckets):
+            if value <= bound:
+                index = position
+                break
+
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                # Per-bucket counts (last one is +Inf), then sum
+                state = self._values[key] = [0] * (len(self.buckets) + 1) + [0.0]
+            state[index] += 1
+            state[-1] += value
+
+    @contextmanager
+    def time(self, **labels: str) -> Iterator[None]:
+        """Observe the duration of the block in seconds."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            values = [[list(key), list(state)] for key, state in self._values.items()]
+        return {
+            "type": self.type_name,
+            "help": self.documentation,
+            "labelnames": list(self.labelnames),
+            "buckets": list(self.buckets),
+            "values": values,
+        }
+
+
+def _merge(
+    snapshots: list[tuple[Optional[int], dict[str, dict]]],
+    dead: frozenset[int] | set[int] = frozenset(),
+) -> dict[str, dict]:
+    merged: dict[str, dict] = {}
+    for pid, snapshot in snapshots:
+        # The aggregate (pid None) only holds values that outlive their process
+        alive = pid is None or (pid not in dead and _pid_alive(pid))
+        for name, metric in snapshot.items():
+            target = merged.setdefault(name, {**metric, "values": {}})
+            mode = metric.get("mode")
+            if metric["type"] == "gauge" and mode != "max" and not alive:
+                continue
+            labelnames = metric["labelnames"]
+            if mode == "all":
+                target["labelnames"] = [*labelnames, "pid"]
+            for key, value in metric["values"]:
+                key = tuple(key) + ((str(pid),) if mode == "all" else ())
+                current = target["values"].get(key)
+                if current is None:
+                    target["values"][key] = value
+                elif metric["type"] == "histogram":
+                    target["values"][key] = [a + b for a, b in zip(current, value)]
+                elif mode == "max":
+                    target["values"][key] = max(current, value)
+                else:
+                    target["values"][key] = current + value
+    return merged
+
+
+def _pid_alive(pid: int) -> bool:
+    if pid == os.getpid():
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _render_histogram(name: str, labels: list[tuple[str, str]], buckets: list[float], state: list) -> list[str]:
+    lines = []
+    cumulative = 0
+    for bound, count in zip([*buckets, float("inf")], state[:-1]):
+        cumulative += count
+        le = "+Inf" if bound == float("inf") else _format_value(bound)
+        lines.append(f"{name}_bucket{_format_labels([*labels, ('le', le)])} {cumulative}")
+    lines.append(f"{name}_sum{_format_labels(labels)} {_format_value(state[-1])}")
+    lines.append(f"{name}_count{_format_labels(labels)} {cumulative}")
+    return lines
+
+
+def _format_labels(labels: list[tuple[str, str]]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels) + "}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_value(value: float) -> str:
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+# Application metrics
+http_requests_total = Counter(
+    "http_requests_total",
+    "Total HTTP requests by route template and status class",
+    ("method", "route", "status_class"),
+)
+http_request_duration_seconds = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template",
+    ("method", "route"),
+)
+auth_operation_duration_seconds = Histogram(
+    "auth_operation_duration_seconds",
+    "Duration of password hashing, verification and token operations",
+    ("operation",),
+)
+{% if cookiecutter.use_database == "yes" -%}
+db_pool_connections = Gauge(
+    "db_pool_connections",
+    "Database pool connections by state",
+    ("state",),
+)
+db_pool_checkout_wait_seconds = Histogram(
+    "db_pool_checkout_wait_seconds",
+    "Time spent waiting for a database pool connection",
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
+)
+db_pool_connection_events_total = Counter(
+    "db_pool_connection_events_total",
+    "Database connections created, closed and invalidated by the pool",
+    ("event",),
+)
+db_admission_rejections_total = Counter(
+    "db_admission_rejections_total",
+    "Requests refused a database connection by admission control",
+    ("reason",),
+)
+db_queries_per_request = Histogram(
+    "db_queries_per_request",
+    "Database statements executed per HTTP request",
+    buckets=(0, 1, 2, 5, 10, 20, 50, 100, 250),
+)
+{% if cookiecutter.use_async_database == "yes" -%}
+db_batch_load_keys = Histogram(
+    "db_batch_load_keys",
+    "Keys fetched per batched lookup query",
+    ("loader",),
+    buckets=(1, 2, 5, 10, 20, 50, 100, 250, 500),
+)
+{% endif -%}
+{% endif -%}
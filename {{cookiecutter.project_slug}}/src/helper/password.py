@@ -1,18 +1,29 @@
-from argon2 import PasswordHasher
-from argon2.exceptions import VerifyMismatchError
+from functools import lru_cache
 
-pwd_hasher = PasswordHasher()
+from src.helper.timing import timed
+
+
+@lru_cache(maxsize=1)
+def _get_hasher():
+    """Create the Argon2 hasher on first use, keeping argon2 off the startup path."""
+    from argon2 import PasswordHasher
+
+    return PasswordHasher()
 
 
 def hash_password(password: str) -> str:
     """Hash a password using Argon2."""
-    return pwd_hasher.hash(password)
+    with timed("argon2"):
+        return _get_hasher().hash(password)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against a hash using Argon2."""
+    from argon2.exceptions import VerifyMismatchError
+
     try:
-        pwd_hasher.verify(hashed_password, plain_password)
+        with timed("argon2"):
+            _get_hasher().verify(hashed_password, plain_password)
         return True
     except VerifyMismatchError:
         return False
@@ -0,0 +1,107 @@
+import itertools
+import logging
+import os
+import re
+import secrets
+import time
+from contextvars import ContextVar, Token
+from dataclasses import dataclass
+from typing import Any, Optional
+
+_VALID_REQUEST_ID = re.compile(r"[A-Za-z0-9._:-]{1,128}")
+
+
+@dataclass(slots=True)
+class RequestContext:
+    """Correlation fields attached to every log line emitted while handling a request."""
+    request_id: str
+    method: str
+    route: str
+    user_id: Optional[str] = None
+
+
+_request_context: ContextVar[Optional[RequestContext]] = ContextVar("request_context", default=None)
+
+
+def bind_request_context(request_id: str, method: str, route: str) -> Token:
+    """Bind a new request context to the current task."""
+    return _request_context.set(RequestContext(request_id=request_id, method=method, route=route))
+
+
+def reset_request_context(token: Token) -> None:
+    """Restore the context that was active before ``bind_request_context``."""
+    _request_context.reset(token)
+
+
+def get_request_context() -> Optional[RequestContext]:
+    """Get the context of the request being handled, if any."""
+    return _request_context.get()
+
+
+def bind_user_id(user_id: str) -> None:
+    """
+    Attach the authenticated user to the current request context.
+
+    The context object is shared with the middleware that bound it, so this is
+    visible to later log lines even when called from a threadpool dependency.
+    """
+    context = _request_context.get()
+    if context is not None:
+        context.user_id = str(user_id)
+
+
+# Request IDs: 12 hex digits of milliseconds, 8 of per-process node, 12 of counter.
+# IDs sort by creation time and are unique across worker processes without locking.
+_node = ""
+_counter = itertools.count()
+
+
+def _reseed() -> None:
+    global _node, _counter
+    _node = secrets.token_hex(4)
+    _counter = itertools.count(secrets.randbelow(1 << 24))
+
+
+_reseed()
+os.register_at_fork(after_in_child=_reseed)
+
+
+def new_request_id() -> str:
+    """Generate a time-ordered, process-unique request ID."""
+    return f"{time.time_ns() // 1_000_000:012x}{_node}{next(_counter) & 0xFFFFFFFFFFFF:012x}"
+
+
+def resolve_request_id(upstream: Optional[bytes]) -> str:
+    """Reuse a well-formed upstream request ID, or generate a new one."""
+    if upstream:
+        try:
+            request_id = upstream.decode("ascii")
+        except UnicodeDecodeError:
+            request_id = ""
+        if _VALID_REQUEST_ID.fullmatch(request_id):
+            return request_id
+    return new_request_id()
+
+
+def add_request_context(_: Any, __: str, event_dict: dict[str, Any]) -> dict[str, Any]:
+    """Structlog processor adding the request context to the event."""
+    context = _request_context.get()
+    if context is not None:
+        event_dict.setdefault("request_id", context.request_id)
+        event_dict.setdefault("route", context.route)
+        if context.user_id is not None:
+            event_dict.setdefault("user_id", context.user_id)
+    return event_dict
+
+
+class RequestContextFilter(logging.Filter):
+    """Logging filter adding the request context to standard library records."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        context = _request_context.get()
+        if context is not None:
+            record.request_id = context.request_id
+            record.route = context.route
+            if context.user_id is not None:
+                record.user_id = context.user_id
+        return True
@@ -1,8 +1,11 @@
-from typing import Generic, TypeVar
+from typing import Any, Generic, TypeVar
 
 from fastapi import status
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 
+from src.helper.timing import timed
+
 T = TypeVar("T")
 
 
@@ -21,3 +24,11 @@ class JsonResponse(BaseModel, Generic[T]):
     status_code: int = status.HTTP_200_OK
     timestamp: str | None = None
     error_code: str | None = None
+
+
+class TimedORJSONResponse(ORJSONResponse):
+    """ORJSON response recording its rendering time as the ``serialize`` phase."""
+
+    def render(self, content: Any) -> bytes:
+        with timed("serialize"):
+            return super().render(content)
@@ -0,0 +1,71 @@
+import asyncio
+import signal
+
+from pydantic import ValidationError
+
+from src.config import reload_settings
+from src.exceptions.admin import SettingsReloadError
+from src.helper.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Keep references to signal-triggered reloads until they finish
+_pending_reloads: set[asyncio.Task] = set()
+
+
+async def reload_and_log(trigger: str) -> dict[str, list[str]]:
+    """Reload settings, logging the outcome. Raises SettingsReloadError on invalid settings."""
+    try:
+        result = await reload_settings()
+    except ValidationError as exc:
+        logger.error(
+            "Settings reload rejected",
+            event_type="settings_reload_failed",
+            trigger=trigger,
+            error=str(exc),
+        )
+        raise SettingsReloadError(f"Invalid settings: {exc.error_count()} validation error(s)") from exc
+
+    logger.info(
+        "Settings reloaded",
+        event_type="settings_reloaded",
+        trigger=trigger,
+        changed=result["changed"],
+        failed=result["failed"],
+    )
+    return result
+
+
+def install_reload_signal_handler() -> bool:
+    """Reload settings on SIGHUP. Returns False where signal handlers are unavailable."""
+    if not hasattr(signal, "SIGHUP"):
+        return False
+    try:
+        asyncio.get_running_loop().add_signal_handler(signal.SIGHUP, _on_sighup)
+    except (NotImplementedError, RuntimeError, ValueError):
+        # Not on the main thread (e.g. test clients) or unsupported event loop
+        return False
+    return True
+
+
+def remove_reload_signal_handler() -> None:
+    """Remove the SIGHUP handler installed by ``install_reload_signal_handler``."""
+    if hasattr(signal, "SIGHUP"):
+        try:
+            asyncio.get_running_loop().remove_signal_handler(signal.SIGHUP)
+        except (NotImplementedError, RuntimeError, ValueError):
+            pass
+
+
+def _on_sighup() -> None:
+    task = asyncio.ensure_future(_reload_from_signal())
+    _pending_reloads.add(task)
+    task.add_done_callback(_pending_reloads.discard)
+
+
+async def _reload_from_signal() -> None:
+    try:
+        await reload_and_log("SIGHUP")
+    except SettingsReloadError:
+        # Already logged; the previous settings stay active
+        pass
@@ -0,0 +1,144 @@
+import importlib.abc
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Iterator
+
+# Slowest modules listed in the startup report
+SLOWEST_IMPORTS = 10
+
+
+class _TimedLoader:
+    """Loader proxy timing ``exec_module`` of one module."""
+    __slots__ = ("loader", "profiler", "name")
+
+    def __init__(self, loader: Any, profiler: "ImportProfiler", name: str) -> None:
+        self.loader = loader
+        self.profiler = profiler
+        self.name = name
+
+    def create_module(self, spec: Any) -> Any:
+        return self.loader.create_module(spec)
+
+    def exec_module(self, module: Any) -> None:
+        # Modules keep a reference to their real loader, not the proxy
+        module.__loader__ = self.loader
+        if module.__spec__ is not None:
+            module.__spec__.loader = self.loader
+        self.profiler.run(self.name, self.loader.exec_module, module)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.loader, name)
+
+
+class ImportProfiler(importlib.abc.MetaPathFinder):
+    """
+    Meta path finder recording how long each module takes to import.
+
+    Times are self times: a module's time excludes the modules it imports,
+    so the slowest entries point at the module actually doing the work.
+    Threads import concurrently, so the nesting state is kept per thread.
+    """
+
+    def __init__(self) -> None:
+        self.timings: dict[str, float] = {}
+        self._local = threading.local()
+
+    @property
+    def _children(self) -> list[float]:
+        children = getattr(self._local, "children", None)
+        if children is None:
+            children = self._local.children = []
+        return children
+
+    @property
+    def _resolving(self) -> set[str]:
+        resolving = getattr(self._local, "resolving", None)
+        if resolving is None:
+            resolving = self._local.resolving = set()
+        return resolving
+
+    def install(self) -> None:
+        if self not in sys.meta_path:
+            sys.meta_path.insert(0, self)
+
+    def uninstall(self) -> None:
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+
+    def find_spec(self, fullname: str, path: Any, target: Any = None) -> Any:
+        resolving = self._resolving
+        if fullname in resolving:
+            return None
+        resolving.add(fullname)
+        try:
+            for finder in sys.meta_path:
+                if finder is self or not hasattr(finder, "find_spec"):
+                    continue
+                spec = finder.find_spec(fullname, path, target)
+                if spec is not None:
+                    break
+            else:
+                return None
+        finally:
+            resolving.discard(fullname)
+
+        if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+            spec.loader = _TimedLoader(spec.loader, self, fullname)
+        return spec
+
+    def run(self, name: str, exec_module: Any, module: Any) -> None:
+        stack = self._children
+        stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            exec_module(module)
+        finally:
+            elapsed = time.perf_counter() - start
+            children = stack.pop()
+            if stack:
+                stack[-1] += elapsed
+            self.timings[name] = (elapsed - children) * 1000
+
+    def total_ms(self) -> float:
+        return sum(self.timings.values())
+
+    def slowest(self, count: int = SLOWEST_IMPORTS) -> dict[str, float]:
+        ranked = sorted(self.timings.items(), key=lambda item: item[1], reverse=True)[:count]
+        return {name: round(duration, 2) for name, duration in ranked}
+
+
+class StartupProfile:
+    """Import times and lifespan phase durations reported once startup completes."""
+
+    def __init__(self) -> None:
+        self.imports = ImportProfiler()
+        self.phases: dict[str, float] = {}
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time a startup phase, in milliseconds."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = self.phases.get(name, 0.0) + (time.perf_counter() - start) * 1000
+
+    def finish(self, slowest: int = SLOWEST_IMPORTS) -> dict[str, Any]:
+        """Stop profiling imports and return the report, resetting phases for the next startup."""
+        self.imports.uninstall()
+        report = {
+            "phases_ms": {name: round(duration, 2) for name, duration in self.phases.items()},
+            "imports_ms": round(self.imports.total_ms(), 2),
+            "slowest_imports_ms": self.imports.slowest(slowest),
+        }
+        self.phases = {}
+        return report
+
+
+startup_profile = StartupProfile()
+# Settings load after the imports being profiled, so the flag comes from the environment
+if os.environ.get("PROFILE_STARTUP_IMPORTS", "").lower() in ("1", "true", "yes"):
+    startup_profile.imports.install()
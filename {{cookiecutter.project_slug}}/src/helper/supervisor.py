@@ -0,0 +1,339 @@
+import asyncio
+import glob
+import logging
+import os
+import random
+import signal
+import socket
+import time
+from dataclasses import dataclass
+from typing import Any, Optional
+
+import uvicorn
+
+from src.config import reload_settings, settings
+from src.helper.logger import get_logger, setup_logging, shutdown_logging
+from src.helper.metrics import registry
+
+logger = get_logger(__name__)
+
+# uvicorn's default listen backlog
+LISTEN_BACKLOG = 2048
+# Seconds between supervision passes
+TICK_INTERVAL = 0.5
+# A worker failing sooner than this after its start counts as a crash loop
+MIN_HEALTHY_UPTIME = 10.0
+# Delay before restarting a crashed worker, doubled per consecutive crash
+RESTART_BACKOFF_BASE = 0.5
+# uvicorn's exit code when the application fails to start
+STARTUP_FAILURE = 3
+
+
+@dataclass(slots=True)
+class WorkerProcess:
+    """A forked worker process as tracked by the supervisor."""
+    pid: int
+    generation: int
+    started_at: float
+    stopping: bool = False
+    kill_at: float = 0.0
+    # Retired for a failure (memory limit right after start): its exit does not reset the backoff
+    failed: bool = False
+
+
+class Supervisor:
+    """
+    Pre-fork process supervisor for production.
+
+    The application is imported once in the supervisor, then ``WORKERS``
+    processes are forked and serve it with uvicorn from a single shared
+    listening socket, so the kernel balances connections between them.
+
+    - Crashed workers are restarted; consecutive crashes back off exponentially
+      up to ``WORKER_RESTART_BACKOFF_MAX``.
+    - Workers are recycled after ``WORKER_MAX_REQUESTS`` requests (plus up to
+      ``WORKER_MAX_REQUESTS_JITTER``) or once their resident memory exceeds
+      ``WORKER_MAX_RSS_MB``. Memory recycles are restarted on the crash
+      backoff schedule, so a worker over the limit right after starting is
+      not respawned in a loop.
+    - SIGHUP reloads settings and replaces workers one at a time; SIGTERM and
+      SIGINT stop every worker gracefully, allowing ``DRAIN_TIMEOUT`` plus
+      ``WORKER_GRACEFUL_TIMEOUT`` before killing it.
+    """
+
+    def __init__(self, app: Any, host: Optional[str] = None, port: Optional[int] = None) -> None:
+        self.app = app
+        self.host = host or settings.HOST
+        self.port = port or settings.PORT
+        self._socket: Optional[socket.socket] = None
+        self._workers: dict[int, WorkerProcess] = {}
+        self._generation = 0
+        self._consecutive_crashes = 0
+        self._next_spawn_at = 0.0
+        self._stop_requested = False
+        self._restart_requested = False
+
+    def run(self) -> None:
+        """Serve the application until SIGTERM or SIGINT."""
+        setup_logging()
+        self._clear_stale_metrics()
+        self._socket = self._bind()
+        self._install_signal_handlers()
+
+        logger.info(
+            "Supervisor started",
+            event_type="supervisor_started",
+            host=self.host,
+            port=self.port,
+            workers=settings.worker_count,
+        )
+
+        try:
+            while not self._stop_requested:
+                if self._restart_requested:
+                    self._restart_requested = False
+                    self._rolling_restart()
+                self._reap()
+                self._recycle_oversized()
+                self._maintain()
+                time.sleep(TICK_INTERVAL)
+        finally:
+            self._stop()
+            self._socket.close()
+            logger.info("Supervisor stopped", event_type="supervisor_stopped")
+            shutdown_logging()
+
+    def _bind(self) -> socket.socket:
+        family = socket.AF_INET6 if ":" in self.host else socket.AF_INET
+        sock = socket.socket(family, socket.SOCK_STREAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.bind((self.host, self.port))
+        sock.listen(LISTEN_BACKLOG)
+        return sock
+
+    def _install_signal_handlers(self) -> None:
+        signal.signal(signal.SIGTERM, self._on_stop_signal)
+        signal.signal(signal.SIGINT, self._on_stop_signal)
+        signal.signal(signal.SIGHUP, self._on_restart_signal)
+
+    def _on_stop_signal(self, *_: Any) -> None:
+        self._stop_requested = True
+
+    def _on_restart_signal(self, *_: Any) -> None:
+        self._restart_requested = True
+
+    def _clear_stale_metrics(self) -> None:
+        """Drop metric snapshots left by the workers of a previous run."""
+        if not settings.METRICS_MULTIPROC_DIR:
+            return
+        for path in glob.glob(os.path.join(settings.METRICS_MULTIPROC_DIR, "metrics_*.json*")):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def _spawn(self) -> None:
+        # Drain the log queue so no lock is held by the writer thread at fork time
+        for handler in logging.getLogger().handlers:
+            handler.flush()
+
+        pid = os.fork()
+        if pid == 0:
+            exit_code = 1
+            try:
+                exit_code = self._serve()
+            finally:
+                os._exit(exit_code)
+
+        self._workers[pid] = WorkerProcess(pid=pid, generation=self._generation, started_at=time.monotonic())
+        logger.info("Worker started", event_type="worker_started", pid=pid, generation=self._generation)
+
+    def _serve(self) -> int:
+        """Run uvicorn in a freshly forked worker. Returns the process exit code."""
+        for signum in (signal.SIGTERM, signal.SIGINT, signal.SIGHUP):
+            signal.signal(signum, signal.SIG_DFL)
+        random.seed()
+
+        # The inherited handlers write from the supervisor's thread, which does
+        # not exist in this process; the lifespan sets up the worker's own logging
+        logging.getLogger().handlers.clear()
+
+        limit_max_requests = None
+        if settings.WORKER_MAX_REQUESTS:
+            limit_max_requests = settings.WORKER_MAX_REQUESTS + random.randint(0, settings.WORKER_MAX_REQUESTS_JITTER)
+
+        config = uvicorn.Config(
+            self.app,
+            limit_max_requests=limit_max_requests,
+            timeout_graceful_shutdown=int(settings.WORKER_GRACEFUL_TIMEOUT),
+            log_config=None,
+        )
+        server = uvicorn.Server(config)
+        server.run(sockets=[self._socket])
+        return 0 if server.started else STARTUP_FAILURE
+
+    def _retire(self, worker: WorkerProcess, reason: str) -> None:
+        """Ask a worker to finish in-flight requests and exit."""
+        if worker.stopping:
+            return
+        worker.stopping = True
+        # The worker drains in-flight requests first, then uvicorn shuts down
+        worker.kill_at = time.monotonic() + settings.DRAIN_TIMEOUT + settings.WORKER_GRACEFUL_TIMEOUT
+        logger.info("Stopping worker", event_type="worker_stopping", pid=worker.pid, reason=reason)
+        _signal(worker.pid, signal.SIGTERM)
+
+    def _reap(self) -> None:
+        """Collect exited workers and schedule restarts of crashed ones."""
+        now = time.monotonic()
+        while self._workers:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                return
+            if pid == 0:
+                break
+
+            worker = self._workers.pop(pid, None)
+            if worker is None:
+                continue
+            self._compact_metrics(pid)
+
+            exit_code = os.waitstatus_to_exitcode(status)
+            uptime = now - worker.started_at
+            if worker.stopping or exit_code == 0:
+                # Retired, or recycled after its request limit
+                if not worker.failed:
+                    self._consecutive_crashes = 0
+                logger.info("Worker exited", event_type="worker_exited", pid=pid, exit_code=exit_code)
+                continue
+
+            delay = self._schedule_restart(uptime, now)
+            logger.error(
+                "Worker crashed",
+                event_type="worker_crashed",
+                pid=pid,
+                exit_code=exit_code,
+                uptime_seconds=round(uptime, 2),
+                restart_delay_seconds=delay,
+            )
+
+        # Force out workers that outlived their graceful shutdown
+        for worker in self._workers.values():
+            if worker.stopping and now >= worker.kill_at:
+                logger.warning("Killing unresponsive worker", event_type="worker_killed", pid=worker.pid)
+                _signal(worker.pid, signal.SIGKILL)
+                worker.kill_at = float("inf")
+
+    def _compact_metrics(self, pid: int) -> None:
+        """Fold an exited worker's metrics into the aggregate before its PID can be reused."""
+        try:
+            registry.mark_process_dead(pid)
+        except (OSError, ValueError) as exc:
+            logger.warning("Metrics compaction failed", event_type="metrics_compaction_failed", pid=pid, error=str(exc))
+
+    def _schedule_restart(self, uptime: float, now: float) -> float:
+        """Delay the next spawn after a worker failure, doubling per consecutive fast failure."""
+        if uptime < MIN_HEALTHY_UPTIME:
+            self._consecutive_crashes += 1
+        else:
+            self._consecutive_crashes = 1
+        delay = min(
+            settings.WORKER_RESTART_BACKOFF_MAX,
+            RESTART_BACKOFF_BASE * 2 ** (self._consecutive_crashes - 1),
+        )
+        self._next_spawn_at = max(self._next_spawn_at, now + delay)
+        return delay
+
+    def _recycle_oversized(self) -> None:
+        """Retire workers whose resident memory exceeds WORKER_MAX_RSS_MB; ``_maintain`` replaces them."""
+        if not settings.WORKER_MAX_RSS_MB:
+            return
+        now = time.monotonic()
+        limit = settings.WORKER_MAX_RSS_MB * 1024 * 1024
+        for worker in list(self._workers.values()):
+            if worker.stopping:
+                continue
+            rss = _rss_bytes(worker.pid)
+            if rss is not None and rss > limit:
+                uptime = now - worker.started_at
+                worker.failed = uptime < MIN_HEALTHY_UPTIME
+                delay = self._schedule_restart(uptime, now)
+                logger.info(
+                    "Worker memory limit exceeded",
+                    event_type="worker_rss_exceeded",
+                    pid=worker.pid,
+                    rss_mb=round(rss / 1024 / 1024, 1),
+                    limit_mb=settings.WORKER_MAX_RSS_MB,
+                    uptime_seconds=round(uptime, 2),
+                    restart_delay_seconds=delay,
+                )
+                self._retire(worker, "max_rss")
+
+    def _maintain(self) -> None:
+        """Converge on the configured worker count, one rolling replacement at a time."""
+        now = time.monotonic()
+        active = sorted(
+            (worker for worker in self._workers.values() if not worker.stopping),
+            key=lambda worker: worker.started_at,
+        )
+        target = settings.worker_count
+
+        if len(active) > target:
+            for worker in active[:len(active) - target]:
+                self._retire(worker, "scaled_down")
+            return
+
+        if len(active) < target:
+            if now >= self._next_spawn_at:
+                for _ in range(target - len(active)):
+                    self._spawn()
+            return
+
+        # Replace the next outdated worker once the previous replacement has settled
+        outdated = [worker for worker in active if worker.generation < self._generation]
+        settling = any(
+            now - worker.started_at < MIN_HEALTHY_UPTIME
+            for worker in active if worker.generation == self._generation
+        )
+        if outdated and not settling:
+            self._spawn()
+            self._retire(outdated[0], "rolling_restart")
+
+    def _rolling_restart(self) -> None:
+        try:
+            result = asyncio.run(reload_settings())
+        except Exception as exc:
+            logger.error("Settings reload failed", event_type="settings_reload_failed", error=str(exc))
+            return
+
+        self._generation += 1
+        logger.info(
+            "Rolling restart requested",
+            event_type="supervisor_rolling_restart",
+            generation=self._generation,
+            changed=result["changed"],
+        )
+
+    def _stop(self) -> None:
+        """Stop every worker, waiting up to WORKER_GRACEFUL_TIMEOUT for in-flight requests."""
+        for worker in self._workers.values():
+            self._retire(worker, "shutdown")
+        while self._workers:
+            self._reap()
+            time.sleep(TICK_INTERVAL / 5)
+
+
+def _signal(pid: int, signum: int) -> None:
+    try:
+        os.kill(pid, signum)
+    except ProcessLookupError:
+        pass
+
+
+def _rss_bytes(pid: int) -> Optional[int]:
+    """Resident set size of a process, or None where /proc is unavailable."""
+    try:
+        with open(f"/proc/{pid}/statm", "rb") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
@@ -0,0 +1,81 @@
+import time
+from contextvars import ContextVar, Token
+from typing import Optional
+
+
+class RequestTimings:
+    """Accumulated per-phase durations of one request, in milliseconds."""
+    __slots__ = ("phases",)
+
+    def __init__(self) -> None:
+        self.phases: dict[str, float] = {}
+
+    def add(self, phase: str, duration_ms: float) -> None:
+        self.phases[phase] = self.phases.get(phase, 0.0) + duration_ms
+
+    def as_dict(self) -> dict[str, float]:
+        return {phase: round(duration, 2) for phase, duration in self.phases.items()}
+
+    def header_value(self) -> str:
+        """Format phases as a ``Server-Timing`` header value."""
+        return ", ".join(f"{phase};dur={duration:.2f}" for phase, duration in self.phases.items())
+
+
+class _PhaseTimer:
+    __slots__ = ("timings", "phase", "start")
+
+    def __init__(self, timings: RequestTimings, phase: str) -> None:
+        self.timings = timings
+        self.phase = phase
+
+    def __enter__(self) -> None:
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc_info) -> None:
+        self.timings.add(self.phase, (time.perf_counter() - self.start) * 1000)
+
+
+class _NoopTimer:
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *exc_info) -> None:
+        return None
+
+
+_NOOP_TIMER = _NoopTimer()
+_request_timings: ContextVar[Optional[RequestTimings]] = ContextVar("request_timings", default=None)
+
+
+def start_request_timing() -> tuple[RequestTimings, Token]:
+    """Enable phase timing for the current request context."""
+    timings = RequestTimings()
+    return timings, _request_timings.set(timings)
+
+
+def stop_request_timing(token: Token) -> None:
+    """Disable phase timing enabled by ``start_request_timing``."""
+    _request_timings.reset(token)
+
+
+def add_to_request_timing(timings: RequestTimings) -> None:
+    """Add phases timed on the current request's behalf elsewhere, such as in a shared batch."""
+    current = _request_timings.get()
+    if current is not None:
+        for phase, duration in timings.phases.items():
+            current.add(phase, duration)
+
+
+def timed(phase: str) -> _PhaseTimer | _NoopTimer:
+    """
+    Time a block into the current request's ``phase``.
+
+    Outside a timed request this returns a shared no-op context manager, so
+    instrumented code costs one context variable lookup when timing is off.
+    """
+    timings = _request_timings.get()
+    if timings is None:
+        return _NOOP_TIMER
+    return _PhaseTimer(timings, phase)
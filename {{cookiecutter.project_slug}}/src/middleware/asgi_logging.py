@@ -1,14 +1,38 @@
 {% if cookiecutter.include_middleware_logging == "yes" -%}
 import json
 import time
-import uuid
-from typing import Optional
+from typing import Any, Iterable, Optional
 from starlette.types import ASGIApp, Receive, Scope, Send, Message
 
+from src.config import settings, subscribe
 from src.helper.logger import get_logger
+from src.helper.metrics import http_request_duration_seconds, http_requests_total
+from src.helper.request_context import bind_request_context, new_request_id, reset_request_context, resolve_request_id
+from src.helper.timing import start_request_timing, stop_request_timing
+from src.middleware.payload_processor import payload_processor
+from src.middleware.redaction import DEFAULT_SENSITIVE_KEYS, Redactor
+from src.middleware.route_matcher import UNMATCHED_ROUTE, RouteMatcher, RoutePolicy
+from src.middleware.sampling import PayloadSamplingPolicy, sample
 
 logger = get_logger(__name__)
 
+# Settings applied to running middleware on settings reload
+RELOADABLE_SETTINGS = (
+    "LOG_PAYLOAD_MAX_BODY_SIZE",
+    "LOG_PAYLOAD_SAMPLE_RATE",
+    "LOG_PAYLOAD_ROUTE_SAMPLE_RATES",
+    "LOG_PAYLOAD_STATUS_SAMPLE_RATES",
+    "LOG_SLOW_REQUEST_MS",
+    "LOG_REDACT_KEYS",
+    "LOG_REDACT_MAX_DEPTH",
+    "LOG_REDACT_MAX_ITEMS",
+    "LOG_REDACT_MAX_STRING_LENGTH",
+    "REQUEST_ID_TRUST_UPSTREAM",
+    "SERVER_TIMING",
+)
+# Policies of unmatched paths kept between requests; the memo is reset when full
+MAX_UNMATCHED_POLICIES = 1024
+
 
 class ASGILoggingMiddleware:
     """
@@ -16,42 +40,153 @@ class ASGILoggingMiddleware:
 
     Features:
     - Preserves ContextVars (avoids BaseHTTPMiddleware limitations)
+    - Request context (request ID, route, user ID) bound to every log line of the request
+    - Reuses a well-formed upstream X-Request-ID, otherwise generates a time-ordered ID
     - Request/response payload logging with sanitization
+    - Head-sampled payload logging; errors and slow requests log payloads unsampled
+    - Zero-copy chunk capture, parsed off the event loop after the response is sent
     - Configurable payload size limits
     - Selective path exclusions
+    - Route templates resolved by a matcher compiled at startup, with per-route policies
+    - Request count and latency metrics per route template and status class
+    - Per-phase latency breakdown (db, argon2, jwt, serialize, ...) in a
+      Server-Timing header and the completion log, always or per request
     - Memory-efficient streaming handling
+    - Settings-derived limits follow settings reloads (explicit arguments are kept)
+
+    Per-route policies are keyed by route template, for example:
+
+        app.add_middleware(
+            ASGILoggingMiddleware,
+            route_policies={"/api/v1/files/{file_id}": RoutePolicy(capture_payload=False)},
+        )
     """
 
     def __init__(
         self,
         app: ASGIApp,
-        max_body_size: int = 100 * 1024,  # 100KB default
-        exclude_paths: Optional[list[str]] = None
+        max_body_size: Optional[int] = None,
+        exclude_paths: Optional[list[str]] = None,
+        sampling_policy: Optional[PayloadSamplingPolicy] = None,
+        route_policies: Optional[dict[str, RoutePolicy]] = None,
+        redactor: Optional[Redactor] = None,
+        server_timing: Optional[str] = None,
+        trust_request_id: Optional[bool] = None
     ) -> None:
         self.app = app
-        self.max_body_size = max_body_size
         self.exclude_paths = exclude_paths or ["/health", "/metrics"]
+        self.route_policies = route_policies or {}
+        self._overrides = {
+            "max_body_size": max_body_size,
+            "sampling_policy": sampling_policy,
+            "redactor": redactor,
+            "server_timing": server_timing,
+            "trust_request_id": trust_request_id,
+        }
+        self._configure()
+        self._matcher: Optional[RouteMatcher] = None
+        self._compiled_policies: dict[str, RoutePolicy] = {}
+        self._unmatched_policies: dict[str, RoutePolicy] = {}
+        subscribe(RELOADABLE_SETTINGS, self._on_settings_reload)
+
+    def _configure(self) -> None:
+        """Build settings-derived components, keeping the ones passed explicitly."""
+        overrides = self._overrides
+        self.max_body_size = overrides["max_body_size"] or settings.LOG_PAYLOAD_MAX_BODY_SIZE
+        self.sampling_policy = overrides["sampling_policy"] or PayloadSamplingPolicy(
+            rate=settings.LOG_PAYLOAD_SAMPLE_RATE,
+            route_rates=settings.LOG_PAYLOAD_ROUTE_SAMPLE_RATES,
+            status_rates=settings.LOG_PAYLOAD_STATUS_SAMPLE_RATES,
+            slow_request_ms=settings.LOG_SLOW_REQUEST_MS,
+        )
+        self.redactor = overrides["redactor"] or Redactor(
+            sensitive_keys=[*DEFAULT_SENSITIVE_KEYS, *settings.LOG_REDACT_KEYS],
+            max_depth=settings.LOG_REDACT_MAX_DEPTH,
+            max_items=settings.LOG_REDACT_MAX_ITEMS,
+            max_string_length=settings.LOG_REDACT_MAX_STRING_LENGTH,
+        )
+        self.server_timing = overrides["server_timing"] or settings.SERVER_TIMING
+        self.trust_request_id = (
+            settings.REQUEST_ID_TRUST_UPSTREAM if overrides["trust_request_id"] is None
+            else overrides["trust_request_id"]
+        )
+
+    def _on_settings_reload(self, *_) -> None:
+        self._configure()
+        self._unmatched_policies = {}
+        if self._matcher is not None:
+            # Re-resolve per-route policies against the new defaults, then swap
+            self._compiled_policies = {
+                template: self._resolve_policy(template) for template in self._matcher.templates
+            }
+
+    def compile_routes(self, routes: Iterable[Any]) -> None:
+        """Build the route matcher and resolve the policy of every route template."""
+        matcher = RouteMatcher.from_routes(routes)
+        self._compiled_policies = {template: self._resolve_policy(template) for template in matcher.templates}
+        self._unmatched_policies = {}
+        self._matcher = matcher
+
+    def _resolve_policy(self, route: str) -> RoutePolicy:
+        policy = self.route_policies.get(route, RoutePolicy())
+        return RoutePolicy(
+            exclude=policy.exclude or any(route.startswith(excluded) for excluded in self.exclude_paths),
+            capture_payload=policy.capture_payload,
+            max_body_size=policy.max_body_size or self.max_body_size,
+            sample_rate=policy.sample_rate if policy.sample_rate is not None
+            else self.sampling_policy.route_rate(route),
+        )
+
+    def _match_route(self, scope: Scope) -> tuple[str, RoutePolicy]:
+        if self._matcher is None:
+            # Lifespan was not run (e.g. a bare test client): compile on first request
+            self.compile_routes(getattr(scope.get("app"), "routes", []))
+
+        path = scope["path"]
+        route = self._matcher.match(path)
+        if route is None:
+            # Unknown paths share one bounded label; policy falls back to the raw path
+            policy = self._unmatched_policies.get(path)
+            if policy is None:
+                if len(self._unmatched_policies) >= MAX_UNMATCHED_POLICIES:
+                    self._unmatched_policies = {}
+                policy = self._unmatched_policies[path] = self._resolve_policy(path)
+            return UNMATCHED_ROUTE, policy
+        return route, self._compiled_policies[route]
 
     async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "lifespan":
+            # Routes are registered by now: compile the matcher once at startup
+            self.compile_routes(getattr(scope.get("app"), "routes", []))
+            await self.app(scope, receive, send)
+            return
+
         # Only process HTTP requests
         if scope["type"] != "http":
             await self.app(scope, receive, send)
             return
 
         path = scope["path"]
+        route, policy = self._match_route(scope)
 
-        # Skip logging for excluded paths
-        if any(path.startswith(excluded) for excluded in self.exclude_paths):
+        # Skip logging for excluded routes
+        if policy.exclude:
             await self.app(scope, receive, send)
             return
 
-        # Generate request ID for logging
+        max_body_size = policy.max_body_size
+        scope["route_template"] = route
+
+        # Reuse the gateway's request ID when trusted and well-formed
         headers = dict(scope.get("headers", []))
-        request_id = str(uuid.uuid4())
+        request_id = resolve_request_id(headers.get(b"x-request-id")) if self.trust_request_id else new_request_id()
         start_time = time.time()
 
         # Extract request details from ASGI scope
         method = scope["method"]
+
+        # Bind the request context so every log line of this request carries it
+        context_token = bind_request_context(request_id, method, route)
         query_string = scope.get("query_string", b"").decode()
 
         # Extract client info
@@ -61,29 +196,41 @@ class ASGILoggingMiddleware:
         # Extract user agent
         user_agent = headers.get(b"user-agent", b"unknown").decode()
 
+        # Phase timing is off unless enabled for every request or opted into per request
+        timings = None
+        if self.server_timing == "always" or (self.server_timing == "opt_in" and b"x-server-timing" in headers):
+            timings, timing_token = start_request_timing()
+
+        # Head sampling decision. The request body is buffered either way (up to
+        # the size limit): errors and slow requests log payloads unsampled too
+        capture_payload = policy.capture_payload
+        sampled = capture_payload and sample(policy.sample_rate)
+
         # Check content length early to avoid buffering large payloads
         content_length = headers.get(b"content-length")
-        should_buffer_request = True
-        if content_length:
+        should_buffer_request = capture_payload
+        if should_buffer_request and content_length:
             try:
-                if int(content_length.decode()) > self.max_body_size:
+                if int(content_length.decode()) > max_body_size:
                     should_buffer_request = False
             except (ValueError, UnicodeDecodeError):
                 pass
 
-        # Capture request payload only if needed
-        request_body = b"" if should_buffer_request else None
+        # Capture request payload only if needed, as zero-copy chunks
+        request_chunks: Optional[list[memoryview]] = [] if should_buffer_request else None
+        request_size = 0
 
         async def receive_wrapper():
-            nonlocal request_body
+            nonlocal request_chunks, request_size
             message = await receive()
-            if message["type"] == "http.request" and should_buffer_request:
+            if message["type"] == "http.request" and request_chunks is not None:
                 body = message.get("body", b"")
                 # Stop buffering if exceeds limit
-                if len(request_body) + len(body) <= self.max_body_size:
-                    request_body += body
+                if request_size + len(body) <= max_body_size:
+                    request_chunks.append(memoryview(body))
+                    request_size += len(body)
                 else:
-                    request_body = None  # Stop buffering
+                    request_chunks = None  # Stop buffering
             return message
 
         # Log request start
@@ -92,6 +239,7 @@ class ASGILoggingMiddleware:
             request_id=request_id,
             method=method,
             path=path,
+            route=route,
             query_string=query_string or None,
             client_ip=client_ip,
             user_agent=user_agent,
@@ -103,76 +251,93 @@ class ASGILoggingMiddleware:
         # Variables to capture response info
         status_code = None
         response_headers = {}
-        response_body = b""
-        should_buffer_response = True
+        # Decided at response start, once the status is known
+        response_chunks: Optional[list[memoryview]] = None
+        response_size = 0
 
         async def send_wrapper(message: Message) -> None:
-            nonlocal status_code, response_headers, response_body, should_buffer_response
+            nonlocal status_code, response_headers, response_chunks, response_size
 
             if message["type"] == "http.response.start":
                 status_code = message["status"]
                 response_headers = dict(message.get("headers", []))
+                elapsed_ms = (time.time() - start_time) * 1000
+
+                # Buffer the response body if its payloads may be logged
+                if capture_payload and (sampled or self.sampling_policy.always_logs(status_code, elapsed_ms)):
+                    response_chunks = []
 
                 # Check response size early
                 resp_content_length = response_headers.get(b"content-length")
-                if resp_content_length:
+                if response_chunks is not None and resp_content_length:
                     try:
-                        if int(resp_content_length.decode()) > self.max_body_size:
-                            should_buffer_response = False
+                        if int(resp_content_length.decode()) > max_body_size:
+                            response_chunks = None
                     except (ValueError, UnicodeDecodeError):
                         pass
 
-                # Add request ID to response headers
-                message["headers"] = [
-                    *message.get("headers", []),
-                    (b"x-request-id", request_id.encode())
-                ]
-            elif message["type"] == "http.response.body" and should_buffer_response:
+                # Add request ID (and phase timings, rendered by now) to response headers
+                extra_headers = [(b"x-request-id", request_id.encode())]
+                if timings is not None:
+                    timings_header = timings.header_value()
+                    total = f"total;dur={elapsed_ms:.2f}"
+                    extra_headers.append(
+                        (b"server-timing", f"{timings_header}, {total}".encode() if timings_header else total.encode())
+                    )
+                message["headers"] = [*message.get("headers", []), *extra_headers]
+            elif message["type"] == "http.response.body" and response_chunks is not None:
                 body = message.get("body", b"")
                 # Stop buffering if exceeds limit
-                if len(response_body) + len(body) <= self.max_body_size:
-                    response_body += body
+                if response_size + len(body) <= max_body_size:
+                    response_chunks.append(memoryview(body))
+                    response_size += len(body)
                 else:
-                    should_buffer_response = False
-                    response_body = b""  # Clear to save memory
+                    response_chunks = None  # Drop chunks to save memory
 
             await send(message)
 
         try:
-            # Process the request
-            await self.app(scope, receive_wrapper, send_wrapper)
+            # Process the request (routes not capturing payloads read the body unwrapped)
+            await self.app(scope, receive_wrapper if should_buffer_request else receive, send_wrapper)
 
             # Calculate processing time
             process_time = time.time() - start_time
+            process_time_ms = round(process_time * 1000, 2)
+            self._record_metrics(method, route, status_code, process_time)
 
-            # Parse payloads for logging
-            request_payload = self._safe_parse_payload(
-                request_body,
-                headers.get(b"content-type", b"").decode().lower(),
-                "request"
-            ) if request_body is not None else {"note": "Payload too large or not buffered"}
-
-            response_payload = self._safe_parse_payload(
-                response_body,
-                response_headers.get(b"content-type", b"").decode().lower(),
-                "response"
-            ) if should_buffer_response else {"note": "Response too large or not buffered"}
-
-            # Log successful response
-            logger.info(
-                "HTTP request completed",
-                request_id=request_id,
-                method=method,
-                path=path,
-                status_code=status_code,
-                process_time_ms=round(process_time * 1000, 2),
-                request_payload=request_payload if request_payload else None,
-                response_payload=response_payload if response_payload else None,
+            # The response has been sent; parsing, redaction and the completion
+            # log line run on the payload worker pool, off the event loop
+            log_payloads = capture_payload and self.sampling_policy.should_log_payloads(
+                sampled, status_code, process_time_ms
+            )
+            completed = {
+                "request_id": request_id,
+                "method": method,
+                "path": path,
+                "route": route,
+                "status_code": status_code,
+                "process_time_ms": process_time_ms,
+                "payload_sampled": log_payloads,
+            }
+            if timings is not None:
+                completed["timings"] = timings.as_dict()
+            request_payload = (
+                (request_chunks, headers.get(b"content-type", b""))
+                if log_payloads else None
+            )
+            response_payload = (
+                (response_chunks, response_headers.get(b"content-type", b""))
+                if log_payloads else None
             )
+            if not payload_processor.submit(self._log_completed, completed, request_payload, response_payload):
+                # Worker pool is saturated: log the line without payloads
+                completed["payload_sampled"] = False
+                self._log_completed(completed, None, None)
 
         except Exception as exc:
             # Calculate processing time for failed requests
             process_time = time.time() - start_time
+            self._record_metrics(method, route, None, process_time)
 
             # Log error
             logger.error(
@@ -180,6 +345,7 @@ class ASGILoggingMiddleware:
                 request_id=request_id,
                 method=method,
                 path=path,
+                route=route,
                 process_time_ms=round(process_time * 1000, 2),
                 error=str(exc),
                 error_type=type(exc).__name__
@@ -188,6 +354,47 @@ class ASGILoggingMiddleware:
             # Re-raise the exception
             raise exc
 
+        finally:
+            if timings is not None:
+                stop_request_timing(timing_token)
+            reset_request_context(context_token)
+
+    @staticmethod
+    def _record_metrics(method: str, route: str, status_code: Optional[int], process_time: float) -> None:
+        status_class = f"{status_code // 100}xx" if status_code else "5xx"
+        http_requests_total.inc(method=method, route=route, status_class=status_class)
+        http_request_duration_seconds.observe(process_time, method=method, route=route)
+
+    def _log_completed(
+        self,
+        completed: dict,
+        request_payload: Optional[tuple[Optional[list[memoryview]], bytes]],
+        response_payload: Optional[tuple[Optional[list[memoryview]], bytes]],
+    ) -> None:
+        """Parse captured payloads and emit the completion log line."""
+        logger.info(
+            "HTTP request completed",
+            **completed,
+            request_payload=self._parse_captured(request_payload, "request"),
+            response_payload=self._parse_captured(response_payload, "response"),
+        )
+
+    def _parse_captured(
+        self,
+        captured: Optional[tuple[Optional[list[memoryview]], bytes]],
+        payload_type: str
+    ) -> dict | None:
+        """Join captured chunks once and parse them for logging."""
+        if captured is None:
+            return None
+
+        chunks, content_type = captured
+        if chunks is None:
+            note = "Payload too large or not buffered" if payload_type == "request" else "Response too large or not buffered"
+            return {"note": note}
+
+        return self._safe_parse_payload(b"".join(chunks), content_type.decode().lower(), payload_type) or None
+
     def _safe_parse_payload(self, body: bytes, content_type: str, payload_type: str) -> dict | None:
         """
         Optimized payload parser with single-pass sanitization.
@@ -205,9 +412,9 @@ class ASGILoggingMiddleware:
         # Parse JSON (most common case)
         if "application/json" in content_type:
             try:
-                payload = json.loads(body.decode())
-                # Sanitize in single pass
-                return self._sanitize_payload(payload)
+                payload = json.loads(body)
+                # Redact with bounded depth, items and string length
+                return self.redactor.redact(payload)
             except (json.JSONDecodeError, UnicodeDecodeError) as e:
                 return {"type": "invalid_json", "error": str(e)}
 
@@ -228,31 +435,6 @@ class ASGILoggingMiddleware:
             "content_type": content_type,
         }
 
-    def _sanitize_payload(self, payload: any) -> any:
-        """
-        Optimized single-pass sanitization of sensitive fields.
-        """
-        if isinstance(payload, dict):
-            return {
-                key: "[REDACTED]" if self._is_sensitive_key(key)
-                else self._sanitize_payload(value)
-                for key, value in payload.items()
-            }
-        elif isinstance(payload, list):
-            return [self._sanitize_payload(item) for item in payload]
-        else:
-            return payload
-
-    @staticmethod
-    def _is_sensitive_key(key: str) -> bool:
-        """Check if key contains sensitive information."""
-        key_lower = key.lower()
-        sensitive_keywords = {
-            'password', 'token', 'secret', 'key', 'auth',
-            'credential', 'api_key', 'apikey', 'private'
-        }
-        return any(keyword in key_lower for keyword in sensitive_keywords)
-
 
 def get_request_id_from_scope(scope: Scope) -> str:
     """Get the request ID from ASGI scope."""
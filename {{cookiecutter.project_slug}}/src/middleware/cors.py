@@ -0,0 +1,26 @@
+{% if cookiecutter.include_cors == "yes" -%}
+from typing import Any
+
+from starlette.middleware.cors import CORSMiddleware
+from starlette.types import ASGIApp
+
+from src.config import settings, subscribe
+
+
+class ReloadableCORSMiddleware(CORSMiddleware):
+    """
+    CORS middleware whose allowed origins follow ``ALLOWED_ORIGINS`` across settings reloads.
+
+    Accepts the same arguments as ``CORSMiddleware`` except ``allow_origins``,
+    which is always read from settings.
+    """
+
+    def __init__(self, app: ASGIApp, **options: Any) -> None:
+        self._options = options
+        super().__init__(app, allow_origins=settings.ALLOWED_ORIGINS, **options)
+        subscribe(("ALLOWED_ORIGINS",), self._on_settings_reload)
+
+    def _on_settings_reload(self, *_) -> None:
+        # Recompute origin checks and the precomputed CORS headers in place
+        CORSMiddleware.__init__(self, self.app, allow_origins=settings.ALLOWED_ORIGINS, **self._options)
+{% endif -%}
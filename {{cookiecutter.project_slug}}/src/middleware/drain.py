@@ -0,0 +1,60 @@
+import orjson
+from fastapi import status
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.exceptions.base import error_response
+from src.helper.drain import RequestDrainer, drainer as default_drainer
+
+
+class DrainMiddleware:
+    """
+    Pure ASGI middleware tracking in-flight HTTP requests for graceful shutdown.
+
+    While the application drains, new requests (health checks included, so
+    readiness fails) get a 503 with ``Connection: close``, and responses of
+    requests still running also carry ``Connection: close`` so keep-alive
+    clients reconnect to another instance.
+    """
+
+    def __init__(self, app: ASGIApp, drainer: RequestDrainer = default_drainer) -> None:
+        self.app = app
+        self.drainer = drainer
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        drainer = self.drainer
+        if drainer.draining:
+            await self._reject(send)
+            return
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start" and drainer.draining:
+                message["headers"] = [*message.get("headers", ()), (b"connection", b"close")]
+            await send(message)
+
+        drainer.enter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            drainer.exit()
+
+    async def _reject(self, send: Send) -> None:
+        body = orjson.dumps(error_response(
+            message="Service is shutting down",
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            error_code="SERVICE_DRAINING",
+        ).model_dump(exclude_none=True, exclude_unset=True))
+        await send({
+            "type": "http.response.start",
+            "status": status.HTTP_503_SERVICE_UNAVAILABLE,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+                (b"connection", b"close"),
+                (b"retry-after", b"1"),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
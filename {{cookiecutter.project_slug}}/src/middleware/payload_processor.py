@@ -0,0 +1,90 @@
+{% if cookiecutter.include_middleware_logging == "yes" -%}
+import contextvars
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+from src.config import settings
+
+
+class PayloadLogProcessor:
+    """
+    Bounded worker pool for deferred payload parsing, redaction and log emission.
+
+    At most ``max_pending`` jobs are queued or running at once; further jobs are
+    rejected immediately so memory stays bounded when logging falls behind.
+    """
+
+    def __init__(self, max_workers: int = 2, max_pending: int = 1000) -> None:
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._lock = threading.Lock()
+
+        # Counters
+        self.submitted = 0
+        self.rejected = 0
+
+    def submit(self, fn: Callable[..., Any], *args: Any) -> bool:
+        """
+        Schedule ``fn(*args)`` on the pool. Returns False when the pool is saturated.
+
+        The job runs in a copy of the caller's context, so log lines it emits
+        keep the request context.
+        """
+        if not self._slots.acquire(blocking=False):
+            self.rejected += 1
+            return False
+
+        try:
+            future = self._get_executor().submit(contextvars.copy_context().run, fn, *args)
+        except RuntimeError:
+            # Executor is shutting down
+            self._slots.release()
+            self.rejected += 1
+            return False
+
+        self.submitted += 1
+        future.add_done_callback(self._release_slot)
+        return True
+
+    def _release_slot(self, _: Future) -> None:
+        self._slots.release()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        # Created lazily so each worker process owns its own threads
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_workers,
+                        thread_name_prefix="payload-log"
+                    )
+        return self._executor
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Wait for queued jobs to finish and stop the worker threads."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+    def stats(self) -> dict[str, int]:
+        """Return pool counters."""
+        return {
+            "submitted": self.submitted,
+            "rejected": self.rejected,
+        }
+
+
+payload_processor = PayloadLogProcessor(
+    max_workers=settings.LOG_PAYLOAD_WORKERS,
+    max_pending=settings.LOG_PAYLOAD_MAX_PENDING,
+)
+
+
+def shutdown_payload_processor() -> None:
+    """Drain deferred payload log jobs, called from the application lifespan."""
+    payload_processor.shutdown(wait=True)
+{% endif -%}
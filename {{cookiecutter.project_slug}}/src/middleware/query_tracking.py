@@ -0,0 +1,30 @@
+{% if cookiecutter.use_database == "yes" -%}
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from src.database.query_monitor import start_query_tracking, stop_query_tracking
+from src.helper.metrics import db_queries_per_request
+
+
+class QueryTrackingMiddleware:
+    """
+    Pure ASGI middleware counting the database statements of each HTTP request.
+
+    The counts feed N+1 detection in ``QueryMonitor`` and the
+    ``db_queries_per_request`` histogram.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        queries, token = start_query_tracking()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            stop_query_tracking(token)
+            db_queries_per_request.observe(queries.count)
+{% endif -%}
@@ -0,0 +1,98 @@
+{% if cookiecutter.include_middleware_logging == "yes" -%}
+import re
+from functools import lru_cache
+from typing import Any, Iterable
+
+REDACTED = "[REDACTED]"
+TRUNCATED = "[TRUNCATED]"
+
+DEFAULT_SENSITIVE_KEYS = (
+    'password', 'token', 'secret', 'key', 'auth',
+    'credential', 'api_key', 'apikey', 'private',
+)
+
+DEFAULT_VALUE_PATTERNS = (
+    r"(?i:bearer)\s+\S+",  # Authorization bearer tokens
+    r"eyJ[\w-]+\.eyJ[\w-]+\.[\w-]*",  # JWT-looking strings
+)
+
+
+class Redactor:
+    """
+    Compiled redaction engine for logged payloads.
+
+    Key rules are compiled into a single case-insensitive matcher and every
+    per-key decision is memoized in an LRU cache, so repeated field names cost
+    one dict lookup. String values matching a value pattern (matched at the
+    start of the string) are redacted regardless of their key.
+
+    Work is bounded by hard caps on nesting depth, items per container,
+    string length and total visited nodes; anything beyond a cap is replaced
+    by a truncation marker.
+    """
+
+    def __init__(
+        self,
+        sensitive_keys: Iterable[str] = DEFAULT_SENSITIVE_KEYS,
+        value_patterns: Iterable[str] = DEFAULT_VALUE_PATTERNS,
+        max_depth: int = 8,
+        max_items: int = 50,
+        max_string_length: int = 1000,
+        max_nodes: int = 5000,
+        cache_size: int = 4096,
+    ) -> None:
+        keys = sorted({key.lower() for key in sensitive_keys if key})
+        patterns = list(value_patterns)
+
+        self._key_pattern = re.compile("|".join(re.escape(key) for key in keys), re.IGNORECASE) if keys else None
+        self._value_pattern = re.compile("|".join(f"(?:{pattern})" for pattern in patterns)) if patterns else None
+        self.max_depth = max_depth
+        self.max_items = max_items
+        self.max_string_length = max_string_length
+        self.max_nodes = max_nodes
+        self.is_sensitive_key = lru_cache(maxsize=cache_size)(self._match_key)
+
+    def _match_key(self, key: str) -> bool:
+        return self._key_pattern is not None and self._key_pattern.search(key) is not None
+
+    def redact(self, payload: Any) -> Any:
+        """Return a redacted, size-bounded copy of a decoded JSON payload."""
+        budget = [self.max_nodes]
+        return self._redact(payload, 0, budget)
+
+    def _redact(self, value: Any, depth: int, budget: list[int]) -> Any:
+        budget[0] -= 1
+        if budget[0] < 0:
+            return TRUNCATED
+
+        if isinstance(value, str):
+            return self._redact_string(value)
+
+        if isinstance(value, dict):
+            if depth >= self.max_depth:
+                return TRUNCATED
+            result = {}
+            for index, (key, item) in enumerate(value.items()):
+                if index >= self.max_items:
+                    result[TRUNCATED] = f"{len(value) - index} more keys"
+                    break
+                result[key] = REDACTED if self.is_sensitive_key(key) else self._redact(item, depth + 1, budget)
+            return result
+
+        if isinstance(value, list):
+            if depth >= self.max_depth:
+                return TRUNCATED
+            result = [self._redact(item, depth + 1, budget) for item in value[:self.max_items]]
+            if len(value) > self.max_items:
+                result.append(f"{TRUNCATED} {len(value) - self.max_items} more items")
+            return result
+
+        return value
+
+    def _redact_string(self, value: str) -> str:
+        if self._value_pattern is not None and self._value_pattern.match(value):
+            return REDACTED
+        if len(value) > self.max_string_length:
+            return value[:self.max_string_length] + "... [truncated]"
+        return value
+{% endif -%}
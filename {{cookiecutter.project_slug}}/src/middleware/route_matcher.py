@@ -0,0 +1,119 @@
+{% if cookiecutter.include_middleware_logging == "yes" -%}
+from dataclasses import dataclass
+from typing import Any, Iterable, Optional
+
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+@dataclass(frozen=True, slots=True)
+class RoutePolicy:
+    """
+    Logging policy for a route template.
+
+    ``None`` fields fall back to the middleware-wide defaults.
+    """
+    exclude: bool = False
+    capture_payload: bool = True
+    max_body_size: Optional[int] = None
+    sample_rate: Optional[float] = None
+
+
+class _Node:
+    __slots__ = ("static", "param", "catch_all", "template")
+
+    def __init__(self) -> None:
+        self.static: dict[str, _Node] = {}
+        self.param: Optional[_Node] = None
+        self.catch_all: Optional[str] = None
+        self.template: Optional[str] = None
+
+
+class RouteMatcher:
+    """
+    Segment trie resolving request paths to their route templates.
+
+    Built once from the application's registered routes, it resolves a path
+    such as ``/api/v1/items/42`` to ``/api/v1/items/{item_id}``. Static
+    segments take precedence over ``{param}`` segments, and ``{name:path}``
+    segments match the remainder. When a static branch dead-ends the match
+    backtracks to the ``{param}`` sibling, so a lookup is proportional to the
+    path length only while static and parameter siblings don't both continue;
+    each trie node is still visited at most once per lookup.
+    """
+
+    def __init__(self, templates: Iterable[str]) -> None:
+        self._root = _Node()
+        self.templates: set[str] = set()
+        for template in templates:
+            self.add(template)
+
+    @classmethod
+    def from_routes(cls, routes: Iterable[Any]) -> "RouteMatcher":
+        """Build a matcher from Starlette/FastAPI routes, descending into mounts."""
+        return cls(_collect_templates(routes, prefix=""))
+
+    def add(self, template: str) -> None:
+        node = self._root
+        for segment in _split(template):
+            if segment.startswith("{") and segment.endswith(":path}"):
+                node.catch_all = template
+                break
+            if "{" in segment:
+                if node.param is None:
+                    node.param = _Node()
+                node = node.param
+            else:
+                node = node.static.setdefault(segment, _Node())
+        else:
+            node.template = template
+        self.templates.add(template)
+
+    def match(self, path: str) -> Optional[str]:
+        """Get the route template for a path, or None when no route matches."""
+        return self._match(self._root, _split(path), 0)
+
+    def _match(self, node: _Node, segments: list[str], index: int) -> Optional[str]:
+        if index == len(segments):
+            return node.template or node.catch_all
+
+        segment = segments[index]
+        child = node.static.get(segment)
+        if child is not None:
+            template = self._match(child, segments, index + 1)
+            if template is not None:
+                return template
+
+        if node.param is not None:
+            template = self._match(node.param, segments, index + 1)
+            if template is not None:
+                return template
+
+        return node.catch_all
+
+
+def _split(path: str) -> list[str]:
+    return path.strip("/").split("/") if path.strip("/") else []
+
+
+def _collect_templates(routes: Iterable[Any], prefix: str) -> list[str]:
+    templates = []
+    for route in routes:
+        effective_routes = getattr(route, "effective_route_contexts", None)
+        if callable(effective_routes):
+            # Router included lazily (recent FastAPI): paths already carry the include prefix
+            templates.extend(_collect_templates(effective_routes(), prefix))
+            continue
+        path = getattr(route, "path", None)
+        if path is None:
+            continue
+        sub_routes = getattr(route, "routes", None)
+        if sub_routes:
+            # Mount: register its children under the mount prefix
+            templates.extend(_collect_templates(sub_routes, prefix + path))
+        elif hasattr(route, "app") and not hasattr(route, "endpoint"):
+            # Mounted ASGI app without introspectable routes
+            templates.append(prefix + path + "/{path:path}")
+        else:
+            templates.append(prefix + path)
+    return templates
+{% endif -%}
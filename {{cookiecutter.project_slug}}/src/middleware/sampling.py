@@ -0,0 +1,65 @@
+{% if cookiecutter.include_middleware_logging == "yes" -%}
+import random
+from typing import Optional
+
+
+class PayloadSamplingPolicy:
+    """
+    Head sampling policy for request/response payload logging.
+
+    The middleware resolves ``route_rate`` once per route template when it
+    compiles its routes, and samples that rate when a request starts. Request
+    bodies are buffered for every request up to the size limit, so that errors
+    (5xx) and slow requests, whose payloads are always logged, have them;
+    response bodies are buffered when the request was sampled or
+    ``always_logs`` holds once the response starts. Sampled requests that are
+    neither log their payloads at the rate configured for their status class.
+
+    Rates are probabilities in [0, 1]:
+    - ``rate``: global capture rate
+    - ``route_rates``: per-route capture overrides, keyed by route template prefix (longest match wins)
+    - ``status_rates``: per-status-class overrides, keyed like ``"2xx"`` or ``"4xx"``
+    """
+
+    def __init__(
+        self,
+        rate: float = 1.0,
+        route_rates: Optional[dict[str, float]] = None,
+        status_rates: Optional[dict[str, float]] = None,
+        slow_request_ms: float = 1000.0,
+    ) -> None:
+        self.rate = rate
+        self.slow_request_ms = slow_request_ms
+        # Longest prefix first so the most specific route override wins
+        self.route_rates = sorted((route_rates or {}).items(), key=lambda item: len(item[0]), reverse=True)
+        self.status_rates = {int(key[0]): value for key, value in (status_rates or {}).items()}
+
+    def route_rate(self, path: str) -> float:
+        """Get the capture rate for a route template or request path."""
+        for prefix, rate in self.route_rates:
+            if path.startswith(prefix):
+                return rate
+        return self.rate
+
+    def always_logs(self, status_code: Optional[int], process_time_ms: float) -> bool:
+        """Whether payloads are logged whatever the sampling: errors and slow requests."""
+        return status_code is None or status_code >= 500 or process_time_ms >= self.slow_request_ms
+
+    def should_log_payloads(self, sampled: bool, status_code: Optional[int], process_time_ms: float) -> bool:
+        """Decide, after the response, whether captured payloads are parsed and logged."""
+        if self.always_logs(status_code, process_time_ms):
+            return True
+        if not sampled:
+            return False
+        rate = self.status_rates.get(status_code // 100)
+        return rate is None or sample(rate)
+
+
+def sample(rate: float) -> bool:
+    """Return True with probability ``rate``."""
+    if rate >= 1.0:
+        return True
+    if rate <= 0.0:
+        return False
+    return random.random() < rate
+{% endif -%}
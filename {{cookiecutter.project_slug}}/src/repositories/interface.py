@@ -22,6 +22,10 @@ class UserInterface(Protocol):
 
     async def get_by_id(self, conn: AsyncConnection, user_id: str) -> RowMapping | None: ...
 
+    async def get_many_by_email(self, conn: AsyncConnection, emails: Sequence[str]) -> dict[str, RowMapping]: ...
+
+    async def get_many_by_id(self, conn: AsyncConnection, user_ids: Sequence[str]) -> dict[str, RowMapping]: ...
+
     async def create(self, conn: AsyncConnection, user: UserEntity) -> None: ...
 
     async def update_password(self, conn: AsyncConnection, user_id: str, hashed_password: str) -> None: ...
@@ -48,4 +52,16 @@ class UserInterface(Protocol):
 #     ) -> tuple[Sequence[RowMapping], int]: ...
 #
 #     async def get_item(self, conn: {% if cookiecutter.use_async_database == "yes" %}AsyncConnection{% else %}Connection{% endif %}, item_id: str) -> RowMapping | None: ...
+#
+# Implementations build their statements once, at module level, with bind
+# parameters, and execute them with only the parameters changing:
+#
+# GET_ITEM = select(items).where(items.c.id == bindparam("item_id"))
+#
+# class ExampleRepository(ExampleRepositoryInterface):
+#     {% if cookiecutter.use_async_database == "yes" %}async {% endif %}def get_item(self, conn: {% if cookiecutter.use_async_database == "yes" %}AsyncConnection{% else %}Connection{% endif %}, item_id: str) -> RowMapping | None:
+#         result = {% if cookiecutter.use_async_database == "yes" %}await {% endif %}conn.execute(GET_ITEM, {"item_id": item_id})
+#         return result.mappings().first()
+#
+# Writes don't commit: the request's UnitOfWork commits them all at once.
 {% endif -%}
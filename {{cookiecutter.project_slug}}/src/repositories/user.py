@@ -1,4 +1,8 @@
-from sqlalchemy import select, insert, update
+{% if cookiecutter.use_async_database == "yes" -%}
+from typing import Sequence
+
+{% endif -%}
+from sqlalchemy import bindparam, select, insert, update
 {% if cookiecutter.use_async_database == "yes" -%}
 from sqlalchemy.ext.asyncio import AsyncConnection
 {% else -%}
@@ -8,8 +12,30 @@ from sqlalchemy.engine.row import RowMapping
 
 from src.models.user import users
 from src.entities.user import UserEntity
+from src.helper.timing import timed
 from src.repositories.interface import UserInterface
 
+# Statements are built once: each call only binds parameters, and SQLAlchemy
+# finds the compiled form from the statement's memoized cache key
+GET_USER_BY_EMAIL = select(users).where(users.c.email == bindparam("email"), users.c.deleted_at.is_(None))
+GET_USER_BY_USERNAME = select(users).where(users.c.username == bindparam("username"), users.c.deleted_at.is_(None))
+GET_USER_BY_ID = select(users).where(users.c.id == bindparam("user_id"), users.c.deleted_at.is_(None))
+{% if cookiecutter.use_async_database == "yes" -%}
+# Batched lookups: the expanding parameter renders one IN list per call
+GET_USERS_BY_EMAIL = select(users).where(
+    users.c.email.in_(bindparam("emails", expanding=True)), users.c.deleted_at.is_(None)
+)
+GET_USERS_BY_ID = select(users).where(
+    users.c.id.in_(bindparam("user_ids", expanding=True)), users.c.deleted_at.is_(None)
+)
+{% endif -%}
+CREATE_USER = insert(users)
+UPDATE_USER_PASSWORD = (
+    update(users)
+    .where(users.c.id == bindparam("user_id"))
+    .values(hashed_password=bindparam("new_hashed_password"))
+)
+
 
 class UserRepositories(UserInterface):
     """User repository for database operations."""
@@ -20,11 +46,11 @@ class UserRepositories(UserInterface):
     def get_by_email(self, conn: Connection, email: str) -> RowMapping | None:
 {% endif -%}
         """Get user by email."""
-        query = select(users).where(users.c.email == email, users.c.deleted_at.is_(None))
+        with timed("db"):
 {% if cookiecutter.use_async_database == "yes" -%}
-        result = await conn.execute(query)
+            result = await conn.execute(GET_USER_BY_EMAIL, {"email": email})
 {% else -%}
-        result = conn.execute(query)
+            result = conn.execute(GET_USER_BY_EMAIL, {"email": email})
 {% endif -%}
         return result.mappings().first()
 
@@ -34,11 +60,11 @@ class UserRepositories(UserInterface):
     def get_by_username(self, conn: Connection, username: str) -> RowMapping | None:
 {% endif -%}
         """Get user by username."""
-        query = select(users).where(users.c.username == username, users.c.deleted_at.is_(None))
+        with timed("db"):
 {% if cookiecutter.use_async_database == "yes" -%}
-        result = await conn.execute(query)
+            result = await conn.execute(GET_USER_BY_USERNAME, {"username": username})
 {% else -%}
-        result = conn.execute(query)
+            result = conn.execute(GET_USER_BY_USERNAME, {"username": username})
 {% endif -%}
         return result.mappings().first()
 
@@ -48,13 +74,27 @@ class UserRepositories(UserInterface):
     def get_by_id(self, conn: Connection, user_id: str) -> RowMapping | None:
 {% endif -%}
         """Get user by ID."""
-        query = select(users).where(users.c.id == user_id, users.c.deleted_at.is_(None))
+        with timed("db"):
 {% if cookiecutter.use_async_database == "yes" -%}
-        result = await conn.execute(query)
+            result = await conn.execute(GET_USER_BY_ID, {"user_id": user_id})
 {% else -%}
-        result = conn.execute(query)
+            result = conn.execute(GET_USER_BY_ID, {"user_id": user_id})
 {% endif -%}
         return result.mappings().first()
+{% if cookiecutter.use_async_database == "yes" -%}
+
+    async def get_many_by_email(self, conn: AsyncConnection, emails: Sequence[str]) -> dict[str, RowMapping]:
+        """Get users by email, keyed by email."""
+        with timed("db"):
+            result = await conn.execute(GET_USERS_BY_EMAIL, {"emails": list(emails)})
+        return {row["email"]: row for row in result.mappings()}
+
+    async def get_many_by_id(self, conn: AsyncConnection, user_ids: Sequence[str]) -> dict[str, RowMapping]:
+        """Get users by ID, keyed by ID."""
+        with timed("db"):
+            result = await conn.execute(GET_USERS_BY_ID, {"user_ids": list(user_ids)})
+        return {row["id"]: row for row in result.mappings()}
+{% endif -%}
 
 {% if cookiecutter.use_async_database == "yes" -%}
     async def create(self, conn: AsyncConnection, user: UserEntity) -> None:
@@ -62,13 +102,11 @@ class UserRepositories(UserInterface):
     def create(self, conn: Connection, user: UserEntity) -> None:
 {% endif -%}
         """Create a new user."""
-        query = insert(users).values(**user.model_dump())
+        with timed("db"):
 {% if cookiecutter.use_async_database == "yes" -%}
-        await conn.execute(query)
-        await conn.commit()
+            await conn.execute(CREATE_USER, user.model_dump())
 {% else -%}
-        conn.execute(query)
-        conn.commit()
+            conn.execute(CREATE_USER, user.model_dump())
 {% endif -%}
 
 {% if cookiecutter.use_async_database == "yes" -%}
@@ -77,11 +115,10 @@ class UserRepositories(UserInterface):
     def update_password(self, conn: Connection, user_id: str, hashed_password: str) -> None:
 {% endif -%}
         """Update user password."""
-        query = update(users).where(users.c.id == user_id).values(hashed_password=hashed_password)
+        params = {"user_id": user_id, "new_hashed_password": hashed_password}
+        with timed("db"):
 {% if cookiecutter.use_async_database == "yes" -%}
-        await conn.execute(query)
-        await conn.commit()
+            await conn.execute(UPDATE_USER_PASSWORD, params)
 {% else -%}
-        conn.execute(query)
-        conn.commit()
+            conn.execute(UPDATE_USER_PASSWORD, params)
 {% endif -%}
@@ -0,0 +1,22 @@
+from pydantic import BaseModel
+
+
+class SettingsReloadResponse(BaseModel):
+    changed: list[str]
+    failed: list[str]
+{% if cookiecutter.use_database == "yes" %}
+
+
+class QueryStats(BaseModel):
+    fingerprint: str
+    count: int
+    total_ms: float
+    mean_ms: float
+    p95_ms: float
+    max_ms: float
+
+
+class QueryStatsResponse(BaseModel):
+    queries: list[QueryStats]
+    dropped: int
+{% endif -%}
@@ -2,8 +2,21 @@ from pydantic import BaseModel
 
 {% if cookiecutter.use_database == "yes" -%}
 
+class PoolStatus(BaseModel):
+    pool_size: int | None = None
+    checked_out: int | None = None
+    idle: int | None = None
+    overflow: int | None = None
+    waiting: int
+    created: int
+    closed: int
+    invalidated: int
+    soft_invalidated: int
+
+
 class Status(BaseModel):
     database: bool | None = None
+    pool: PoolStatus | None = None
 {% endif -%}
 
 
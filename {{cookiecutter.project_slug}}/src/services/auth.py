@@ -1,12 +1,15 @@
 import uuid
+{% if cookiecutter.use_async_database == "yes" -%}
+from dataclasses import dataclass
+{% endif -%}
 from datetime import datetime
 
 {% if cookiecutter.use_async_database == "yes" -%}
-from sqlalchemy.ext.asyncio import AsyncConnection
-{% else -%}
-from sqlalchemy import Connection
-{% endif -%}
+from sqlalchemy.engine.row import RowMapping
 
+from src.database.batch_loader import BatchLoader
+{% endif -%}
+from src.database.lazy import LazyConnection
 from src.entities.user import UserEntity
 from src.repositories.interface import UserInterface
 from src.schemas.auth import (
@@ -18,6 +21,7 @@ from src.schemas.auth import (
     UserResponse,
 )
 from src.helper.jwt_token import JWTHelper
+from src.helper.metrics import auth_operation_duration_seconds
 from src.helper.password import hash_password, verify_password
 from src.exceptions.auth import (
     InvalidCredentialsError,
@@ -26,19 +30,42 @@ from src.exceptions.auth import (
 )
 
 
+{% if cookiecutter.use_async_database == "yes" -%}
+@dataclass(frozen=True, slots=True)
+class UserLoaders:
+    """Batched user lookups, shared by concurrent requests."""
+
+    by_id: BatchLoader[str, RowMapping]
+    by_id_primary: BatchLoader[str, RowMapping]
+    by_email: BatchLoader[str, RowMapping]
+
+
+{% endif -%}
 class AuthService:
     """Authentication service for user operations."""
 
+{% if cookiecutter.use_async_database == "yes" -%}
+    def __init__(self, user_repo: UserInterface, jwt_helper: JWTHelper, user_loaders: UserLoaders):
+        self.user_repo = user_repo
+        self.jwt_helper = jwt_helper
+        self.user_loaders = user_loaders
+{% else -%}
     def __init__(self, user_repo: UserInterface, jwt_helper: JWTHelper):
         self.user_repo = user_repo
         self.jwt_helper = jwt_helper
+{% endif -%}
 
 {% if cookiecutter.use_async_database == "yes" -%}
-    async def register(self, conn: AsyncConnection, request: RegisterRequest) -> UserResponse:
+    async def register(self, conn: LazyConnection, request: RegisterRequest) -> UserResponse:
 {% else -%}
-    def register(self, conn: Connection, request: RegisterRequest) -> UserResponse:
+    def register(self, conn: LazyConnection, request: RegisterRequest) -> UserResponse:
 {% endif -%}
         """Register a new user."""
+        # Hash first, so no pool slot is held during hashing; the existence
+        # checks and the insert then run in the same transaction
+        with auth_operation_duration_seconds.time(operation="hash_password"):
+            hashed_password = hash_password(request.password)
+
         # Check if user already exists
 {% if cookiecutter.use_async_database == "yes" -%}
         existing_user = await self.user_repo.get_by_email(conn, request.email)
@@ -61,7 +88,7 @@ class AuthService:
             id=str(uuid.uuid4()),
             email=request.email,
             username=request.username,
-            hashed_password=hash_password(request.password),
+            hashed_password=hashed_password,
             full_name=request.full_name,
             is_active=True,
             is_superuser=False,
@@ -78,22 +105,26 @@ class AuthService:
         return UserResponse.model_validate(user, from_attributes=True)
 
 {% if cookiecutter.use_async_database == "yes" -%}
-    async def login(self, conn: AsyncConnection, request: LoginRequest) -> TokenResponse:
+    async def login(self, request: LoginRequest) -> TokenResponse:
 {% else -%}
-    def login(self, conn: Connection, request: LoginRequest) -> TokenResponse:
+    def login(self, conn: LazyConnection, request: LoginRequest) -> TokenResponse:
 {% endif -%}
         """Authenticate user and return tokens."""
-        # Get user by email
 {% if cookiecutter.use_async_database == "yes" -%}
-        user = await self.user_repo.get_by_email(conn, request.email)
+        # Get user by email
+        user = await self.user_loaders.by_email.load(request.email)
 {% else -%}
+        # Get user by email, then return the connection before verifying the password
         user = self.user_repo.get_by_email(conn, request.email)
+        conn.release()
 {% endif -%}
         if not user:
             raise InvalidCredentialsError()
 
         # Verify password
-        if not verify_password(request.password, user["hashed_password"]):
+        with auth_operation_duration_seconds.time(operation="verify_password"):
+            password_valid = verify_password(request.password, user["hashed_password"])
+        if not password_valid:
             raise InvalidCredentialsError()
 
         # Check if user is active
@@ -108,8 +139,9 @@ class AuthService:
         )
         refresh_token_payload = RefreshTokenPayload(sub=user["id"])
 
-        access_token = self.jwt_helper.create_access_token(access_token_payload.model_dump())
-        refresh_token = self.jwt_helper.create_refresh_token(refresh_token_payload.model_dump())
+        with auth_operation_duration_seconds.time(operation="create_tokens"):
+            access_token = self.jwt_helper.create_access_token(access_token_payload.model_dump())
+            refresh_token = self.jwt_helper.create_refresh_token(refresh_token_payload.model_dump())
 
         return TokenResponse(
             access_token=access_token,
@@ -120,14 +152,16 @@ class AuthService:
     def refresh_access_token(self, refresh_token: str) -> TokenResponse:
         """Generate new access token from refresh token."""
         # Verify refresh token
-        payload = self.jwt_helper.verify_token(refresh_token, token_type="refresh")
+        with auth_operation_duration_seconds.time(operation="verify_token"):
+            payload = self.jwt_helper.verify_token(refresh_token, token_type="refresh")
 
         # Generate new tokens
         access_token_payload = {"sub": payload["sub"]}
         refresh_token_payload = {"sub": payload["sub"]}
 
-        new_access_token = self.jwt_helper.create_access_token(access_token_payload)
-        new_refresh_token = self.jwt_helper.create_refresh_token(refresh_token_payload)
+        with auth_operation_duration_seconds.time(operation="create_tokens"):
+            new_access_token = self.jwt_helper.create_access_token(access_token_payload)
+            new_refresh_token = self.jwt_helper.create_refresh_token(refresh_token_payload)
 
         return TokenResponse(
             access_token=new_access_token,
@@ -136,21 +170,25 @@ class AuthService:
         )
 
 {% if cookiecutter.use_async_database == "yes" -%}
-    async def get_current_user(self, conn: AsyncConnection, token: str) -> UserResponse:
+    async def get_current_user(self, token: str, read_primary: bool = False) -> UserResponse:
 {% else -%}
-    def get_current_user(self, conn: Connection, token: str) -> UserResponse:
+    def get_current_user(self, conn: LazyConnection, token: str) -> UserResponse:
 {% endif -%}
         """Get current user from access token."""
         # Verify token
-        payload = self.jwt_helper.verify_token(token, token_type="access")
+        with auth_operation_duration_seconds.time(operation="verify_token"):
+            payload = self.jwt_helper.verify_token(token, token_type="access")
 
         # Get user
 {% if cookiecutter.use_async_database == "yes" -%}
-        user = await self.user_repo.get_by_id(conn, payload["sub"])
+        # read_primary follows the request's read-your-writes decision
+        loader = self.user_loaders.by_id_primary if read_primary else self.user_loaders.by_id
+        user = await loader.load(payload["sub"])
 {% else -%}
         user = self.user_repo.get_by_id(conn, payload["sub"])
+        conn.release()
 {% endif -%}
         if not user:
             raise UserNotFoundError()
 
-        return UserResponse.model_validate(**user)
+        return UserResponse.model_validate(dict(user))
@@ -0,0 +1,86 @@
+{% if cookiecutter.use_database == "yes" -%}
+"""Test database admission control."""
+
+import asyncio
+{% if cookiecutter.use_async_database != "yes" -%}
+import threading
+{% endif -%}
+
+import orjson
+{% if cookiecutter.use_async_database == "yes" -%}
+import pytest
+{% endif -%}
+from fastapi import status
+
+from src.config import SettingsProxy, settings
+from src.database.admission import AdmissionController
+from src.exceptions.base import BaseCustomException
+from src.exceptions.database import DatabaseUnavailableError
+from src.exceptions.exception_registration import exception_handlers
+
+
+def test_requests_beyond_capacity_are_rejected_fast(monkeypatch):
+    """Test a full queue rejects at once and a queued request gives up after the max wait."""
+    test_settings = settings.snapshot().model_copy(update={
+        "DB_ADMISSION_CONTROL": True,
+        "DB_ADMISSION_MAX_QUEUE": 1,
+        "DB_ADMISSION_MAX_WAIT": 0.2,
+    })
+    monkeypatch.setattr("src.database.admission.settings", SettingsProxy(test_settings))
+    admission = AdmissionController()
+    admission.configure(1)
+{% if cookiecutter.use_async_database == "yes" -%}
+
+    async def try_admit():
+        async with admission.admit():
+            pass
+
+    async def scenario():
+        async with admission.admit():
+            queued = asyncio.create_task(try_admit())
+            await asyncio.sleep(0.05)
+            with pytest.raises(DatabaseUnavailableError):
+                await try_admit()
+            with pytest.raises(DatabaseUnavailableError):
+                await queued
+        # The slot is free again
+        await try_admit()
+
+    asyncio.run(scenario())
+{% else -%}
+    errors = []
+
+    def try_admit():
+        try:
+            with admission.admit():
+                pass
+        except DatabaseUnavailableError as exc:
+            errors.append(exc)
+
+    with admission.admit():
+        queued = threading.Thread(target=try_admit)
+        queued.start()
+        while admission.waiting == 0:
+            pass
+        try_admit()
+        queued.join()
+    # The slot is free again
+    try_admit()
+
+    assert len(errors) == 2
+{% endif -%}
+
+    assert admission.rejected == 2
+    assert admission.waiting == 0
+
+
+def test_rejection_is_a_503_with_retry_after():
+    """Test the registered handler keeps the error format and passes Retry-After through."""
+    handler = exception_handlers[BaseCustomException]
+
+    response = asyncio.run(handler(None, DatabaseUnavailableError(retry_after=3)))
+
+    assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+    assert response.headers["retry-after"] == "3"
+    assert orjson.loads(response.body)["error_code"] == "DATABASE_UNAVAILABLE"
+{% endif -%}
@@ -0,0 +1,96 @@
+{% if cookiecutter.include_middleware_logging == "yes" -%}
+"""Test payload capture in the ASGI logging middleware."""
+
+import asyncio
+
+import orjson
+
+from src.middleware.asgi_logging import ASGILoggingMiddleware
+from src.middleware.payload_processor import payload_processor
+from src.middleware.redaction import REDACTED, Redactor
+from src.middleware.route_matcher import UNMATCHED_ROUTE
+from src.middleware.sampling import PayloadSamplingPolicy
+
+
+def test_large_bodies_are_captured_and_redacted_after_the_response(monkeypatch):
+    """Test multi-chunk bodies near the size limit are logged in full, with secrets redacted."""
+    notes = ["x" * 1000 for _ in range(40)]
+    request_body = orjson.dumps({"email": "user@example.com", "password": "hunter22", "notes": notes})
+    response_body = orjson.dumps({"access_token": "eyJhbGciOiJIUzI1NiJ9.eyJzdWIiOiIxIn0.sig", "notes": notes})
+    chunk_size = 4096
+    logged = []
+    jobs = []
+    monkeypatch.setattr("src.middleware.asgi_logging.logger.info", lambda message, **fields: logged.append(fields))
+    monkeypatch.setattr(payload_processor, "submit", lambda fn, *args: jobs.append((fn, args)) or True)
+
+    async def app(scope, receive, send):
+        more_body = True
+        while more_body:
+            more_body = (await receive()).get("more_body", False)
+        await send({"type": "http.response.start", "status": 200, "headers": [(b"content-type", b"application/json")]})
+        for start in range(0, len(response_body), chunk_size):
+            await send({
+                "type": "http.response.body",
+                "body": response_body[start:start + chunk_size],
+                "more_body": start + chunk_size < len(response_body),
+            })
+
+    middleware = ASGILoggingMiddleware(
+        app,
+        max_body_size=64 * 1024,
+        sampling_policy=PayloadSamplingPolicy(rate=1.0),
+        redactor=Redactor(max_string_length=2000),
+    )
+    messages = [
+        {
+            "type": "http.request",
+            "body": request_body[start:start + chunk_size],
+            "more_body": start + chunk_size < len(request_body),
+        }
+        for start in range(0, len(request_body), chunk_size)
+    ]
+
+    async def receive():
+        return messages.pop(0)
+
+    async def send(message):
+        pass
+
+    scope = {
+        "type": "http",
+        "method": "POST",
+        "path": "/api/v1/notes",
+        "query_string": b"",
+        "headers": [(b"content-type", b"application/json"), (b"content-length", str(len(request_body)).encode())],
+        "client": ("127.0.0.1", 1234),
+    }
+    asyncio.run(middleware(scope, receive, send))
+
+    # Nothing is parsed on the request path: the job runs once the response is sent
+    assert [fields.get("status_code") for fields in logged] == [None]
+    assert len(jobs) == 1
+    fn, args = jobs[0]
+    fn(*args)
+
+    completed = logged[-1]
+    assert completed["payload_sampled"] is True
+    assert completed["request_payload"] == {"email": "user@example.com", "password": REDACTED, "notes": notes}
+    assert completed["response_payload"] == {"access_token": REDACTED, "notes": notes}
+
+
+def test_unmatched_path_policies_are_memoized_until_reload():
+    """Test an unknown path resolves its policy once, and again after a settings reload."""
+    middleware = ASGILoggingMiddleware(lambda scope, receive, send: None)
+    middleware.compile_routes([])
+    resolved = []
+    resolve_policy = middleware._resolve_policy
+    middleware._resolve_policy = lambda route: resolved.append(route) or resolve_policy(route)
+
+    for _ in range(3):
+        route, _ = middleware._match_route({"path": "/wp-login.php"})
+    middleware._on_settings_reload()
+    middleware._match_route({"path": "/wp-login.php"})
+
+    assert route == UNMATCHED_ROUTE
+    assert resolved == ["/wp-login.php", "/wp-login.php"]
+{% endif -%}
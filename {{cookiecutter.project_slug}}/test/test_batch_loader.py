@@ -0,0 +1,140 @@
+{% if cookiecutter.use_database == "yes" and cookiecutter.use_async_database == "yes" -%}
+"""Test batching of concurrent lookups."""
+
+import asyncio
+{% if cookiecutter.include_authentication == "yes" -%}
+from types import SimpleNamespace
+{% endif -%}
+
+from src.config import SettingsProxy, settings
+from src.database.batch_loader import BatchLoader
+from src.database.query_monitor import QueryMonitor, start_query_tracking
+{% if cookiecutter.include_authentication == "yes" -%}
+from src.dependencies.auth import get_current_user
+from src.helper.jwt_token import JWTHelper
+{% endif -%}
+from src.helper.timing import start_request_timing, timed
+{% if cookiecutter.include_authentication == "yes" -%}
+from src.repositories.user import UserRepositories
+from src.services.auth import AuthService, UserLoaders
+{% endif -%}
+
+
+def use_batch_settings(monkeypatch, **values) -> None:
+    test_settings = settings.snapshot().model_copy(update=values)
+    monkeypatch.setattr("src.database.batch_loader.settings", SettingsProxy(test_settings))
+
+
+def test_concurrent_loads_share_capped_batches(monkeypatch):
+    """Test lookups in one loop iteration are deduplicated and fetched at most max size at a time."""
+    use_batch_settings(monkeypatch, DB_BATCH_MAX_SIZE=2, DB_BATCH_WINDOW_MS=0.0)
+    batches = []
+
+    async def fetch(keys):
+        batches.append(keys)
+        return {key: key * 10 for key in keys if key != 3}
+
+    loader = BatchLoader("test", fetch)
+
+    async def scenario():
+        return await asyncio.gather(*(loader.load(key) for key in (1, 1, 2, 3, 4)))
+
+    values = asyncio.run(scenario())
+
+    assert values == [10, 10, 20, None, 40]
+    assert batches == [[1, 2], [3, 4]]
+
+
+def test_failed_fetch_raises_in_every_waiter(monkeypatch):
+    """Test a failing batch reaches each of its callers, and the next batch runs normally."""
+    use_batch_settings(monkeypatch, DB_BATCH_MAX_SIZE=100, DB_BATCH_WINDOW_MS=1.0)
+    calls = []
+
+    async def fetch(keys):
+        calls.append(keys)
+        if len(calls) == 1:
+            raise RuntimeError("database down")
+        return {key: key for key in keys}
+
+    loader = BatchLoader("test", fetch)
+
+    async def scenario():
+        failed = await asyncio.gather(loader.load("a"), loader.load("b"), return_exceptions=True)
+        return failed, await loader.load("c")
+
+    failed, value = asyncio.run(scenario())
+
+    assert [type(result) for result in failed] == [RuntimeError, RuntimeError]
+    assert value == "c"
+    assert calls == [["a", "b"], ["c"]]
+
+
+def test_batch_timings_and_queries_reach_every_caller(monkeypatch):
+    """Test each request sharing a batch gets its db phase and statements, not just the first."""
+    use_batch_settings(monkeypatch, DB_BATCH_MAX_SIZE=100, DB_BATCH_WINDOW_MS=0.0)
+    monitor = QueryMonitor()
+
+    async def fetch(keys):
+        with timed("db"):
+            monitor.record("SELECT * FROM users WHERE id IN (?, ?)", 2.0)
+        return {key: key for key in keys}
+
+    loader = BatchLoader("test", fetch)
+
+    async def request(key):
+        timings, _ = start_request_timing()
+        queries, _ = start_query_tracking()
+        await loader.load(key)
+        return timings, queries
+
+    async def scenario():
+        # Each gathered request runs in its own context
+        return await asyncio.gather(request("a"), request("b"))
+
+    for timings, queries in asyncio.run(scenario()):
+        assert "db" in timings.phases
+        assert queries.count == 1
+        assert queries.duration_ms == 2.0
+{% if cookiecutter.include_authentication == "yes" -%}
+
+
+def test_current_user_lookup_follows_the_request_read_decision():
+    """Test a request that wrote reads the current user from the primary, others from a replica."""
+    loads = []
+
+    def loader(name):
+        async def fetch(keys):
+            loads.append(name)
+            return {
+                key: {
+                    "id": key,
+                    "email": "user@example.com",
+                    "username": "user",
+                    "is_active": True,
+                    "is_superuser": False,
+                }
+                for key in keys
+            }
+
+        return BatchLoader(name, fetch)
+
+    auth_service = AuthService(
+        user_repo=UserRepositories(),
+        jwt_helper=JWTHelper(),
+        user_loaders=UserLoaders(by_id=loader("replica"), by_id_primary=loader("primary"), by_email=loader("email")),
+    )
+    authorization = f"Bearer {JWTHelper.create_access_token({'sub': 'user-1'})}"
+    request = SimpleNamespace(state=SimpleNamespace())
+
+    async def scenario():
+        await get_current_user(request, authorization, auth_service)
+        # As set by get_connection when the endpoint also takes DBConnection
+        request.state.db_primary = True
+        return await get_current_user(request, authorization, auth_service)
+
+    user = asyncio.run(scenario())
+
+    assert user.id == "user-1"
+    assert loads == ["replica", "primary"]
+{% endif -%}
+{% endif -%}
@@ -0,0 +1,32 @@
+{% if cookiecutter.use_database == "yes" and cookiecutter.database_type == "PostgreSQL" and cookiecutter.use_async_database == "yes" -%}
+"""Test PostgreSQL driver selection."""
+
+from src.config import SettingsProxy, settings
+from src.database.driver import connect_args, driver_name
+
+
+def _use(monkeypatch, **overrides):
+    test_settings = settings.snapshot().model_copy(update=overrides)
+    monkeypatch.setattr("src.database.driver.settings", SettingsProxy(test_settings))
+
+
+def test_asyncpg_caches_prepared_statements(monkeypatch):
+    """Test asyncpg keeps DB_STATEMENT_CACHE_SIZE prepared statements per connection."""
+    _use(monkeypatch, DB_DRIVER="asyncpg", DB_STATEMENT_CACHE_SIZE=500, DB_PGBOUNCER=False)
+
+    assert driver_name() == "postgresql+asyncpg"
+    assert connect_args("asyncpg") == {"prepared_statement_cache_size": 500}
+    assert connect_args("psycopg") == {}
+
+
+def test_pgbouncer_mode_disables_server_side_prepared_statements(monkeypatch):
+    """Test PgBouncer mode turns statement caching off and names statements uniquely."""
+    _use(monkeypatch, DB_DRIVER="asyncpg", DB_PGBOUNCER=True)
+
+    args = connect_args("asyncpg")
+    name_statement = args.pop("prepared_statement_name_func")
+
+    assert args == {"prepared_statement_cache_size": 0, "statement_cache_size": 0}
+    assert name_statement() != name_statement()
+    assert connect_args("psycopg") == {"prepare_threshold": None}
+{% endif -%}
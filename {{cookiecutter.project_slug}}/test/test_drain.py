@@ -0,0 +1,65 @@
+"""Test graceful request draining."""
+
+import asyncio
+
+from src.helper.drain import RequestDrainer
+from src.middleware.drain import DrainMiddleware
+
+
+async def _call(middleware, path="/"):
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    await middleware({"type": "http", "method": "GET", "path": path, "headers": []}, receive, send)
+    return messages
+
+
+def test_draining_rejects_new_requests_and_waits_for_running_ones():
+    """Test new requests get 503 with Connection: close while running ones finish."""
+    release = asyncio.Event()
+
+    async def app(scope, receive, send):
+        if scope["path"] == "/slow":
+            await release.wait()
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b"ok"})
+
+    async def scenario():
+        drainer = RequestDrainer()
+        middleware = DrainMiddleware(app, drainer=drainer)
+        slow = asyncio.create_task(_call(middleware, "/slow"))
+        await asyncio.sleep(0)
+        assert drainer.in_flight == 1
+
+        drainer.start()
+        rejected = await _call(middleware)
+        waiter = asyncio.create_task(drainer.wait(timeout=5.0))
+        release.set()
+        return rejected, await slow, await waiter
+
+    rejected, completed, abandoned = asyncio.run(scenario())
+
+    assert rejected[0]["status"] == 503
+    assert (b"connection", b"close") in rejected[0]["headers"]
+    assert completed[0]["status"] == 200
+    assert (b"connection", b"close") in completed[0]["headers"]
+    assert abandoned == 0
+
+
+def test_drain_deadline_reports_abandoned_requests():
+    """Test the drain gives up at the deadline and counts requests still running."""
+    async def scenario():
+        drainer = RequestDrainer()
+        drainer.enter()
+        abandoned = await drainer.wait(timeout=0.05)
+        return drainer, abandoned
+
+    drainer, abandoned = asyncio.run(scenario())
+
+    assert abandoned == 1
+    assert drainer.drain_seconds >= 0.05
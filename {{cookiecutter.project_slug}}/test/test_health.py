@@ -1,5 +1,10 @@
 """Test health endpoints."""
 
+{% if cookiecutter.use_database == "yes" and cookiecutter.use_async_database != "yes" -%}
+import asyncio
+from contextlib import contextmanager
+
+{% endif -%}
 import pytest
 
 
@@ -20,3 +25,28 @@ def test_version_endpoint(client):
     assert data["success"] is True
     assert "version" in data["data"]
     assert "service" in data["data"]
+{% if cookiecutter.use_database == "yes" and cookiecutter.use_async_database != "yes" -%}
+
+
+def test_sync_database_work_runs_off_the_event_loop(client, monkeypatch):
+    """Test the blocking pool checkout of a sync endpoint happens in a worker thread."""
+    from src.database.client import client as db_client
+
+    on_event_loop = []
+    checkout = db_client.pool_monitor.checkout
+
+    @contextmanager
+    def recording_checkout():
+        try:
+            asyncio.get_running_loop()
+            on_event_loop.append(True)
+        except RuntimeError:
+            on_event_loop.append(False)
+        with checkout():
+            yield
+
+    monkeypatch.setattr(db_client.pool_monitor, "checkout", recording_checkout)
+
+    assert client.get("/health").status_code == 200
+    assert on_event_loop == [False]
+{% endif -%}
@@ -0,0 +1,92 @@
+{% if cookiecutter.use_database == "yes" and cookiecutter.database_type == "SQLite" -%}
+"""Test lazy connection checkout and early release."""
+
+{% if cookiecutter.use_async_database == "yes" -%}
+import asyncio
+
+{% endif -%}
+from sqlalchemy import text
+
+from src.config import SettingsProxy, settings
+from src.database.client import DatabaseClient
+from src.database.lazy import LazyConnection
+
+
+def make_database(monkeypatch, tmp_path) -> DatabaseClient:
+    test_settings = settings.snapshot().model_copy(update={"SQLITE_DB_PATH": str(tmp_path / "lazy.db")})
+    monkeypatch.setattr("src.database.client.settings", SettingsProxy(test_settings))
+    return DatabaseClient()
+
+
+def test_connection_is_checked_out_on_first_query(monkeypatch, tmp_path):
+    """Test nothing is checked out until execute, and release returns the connection."""
+    database = make_database(monkeypatch, tmp_path)
+{% if cookiecutter.use_async_database == "yes" -%}
+    pool = database.engine.sync_engine.pool
+{% else -%}
+    pool = database.engine.pool
+{% endif -%}
+    conn = LazyConnection(database.engine.connect)
+    checked_out = [pool.checkedout()]
+{% if cookiecutter.use_async_database == "yes" -%}
+
+    async def scenario():
+        await conn.release()
+        assert await conn.scalar(text("SELECT 1")) == 1
+        checked_out.append(pool.checkedout())
+        await conn.release()
+        checked_out.append(pool.checkedout())
+        await conn.execute(text("SELECT 1"))
+        await conn.release()
+        await database.close()
+
+    asyncio.run(scenario())
+{% else -%}
+
+    conn.release()
+    assert conn.scalar(text("SELECT 1")) == 1
+    checked_out.append(pool.checkedout())
+    conn.release()
+    checked_out.append(pool.checkedout())
+    conn.execute(text("SELECT 1"))
+    conn.release()
+    database.close()
+{% endif -%}
+
+    assert checked_out == [0, 1, 0]
+    assert conn.checkouts == 2
+    assert not conn.acquired
+
+
+def test_commit_returns_the_connection(monkeypatch, tmp_path):
+    """Test commit persists the write and gives the connection back at once."""
+    database = make_database(monkeypatch, tmp_path)
+    conn = LazyConnection(database.engine.connect)
+{% if cookiecutter.use_async_database == "yes" -%}
+
+    async def scenario():
+        await conn.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY)"))
+        await conn.execute(text("INSERT INTO items (id) VALUES (1)"))
+        await conn.commit()
+        acquired_after_commit = conn.acquired
+        count = await conn.scalar(text("SELECT COUNT(*) FROM items"))
+        await conn.rollback()
+        await database.close()
+        return acquired_after_commit, count
+
+    acquired_after_commit, count = asyncio.run(scenario())
+{% else -%}
+
+    conn.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY)"))
+    conn.execute(text("INSERT INTO items (id) VALUES (1)"))
+    conn.commit()
+    acquired_after_commit = conn.acquired
+    count = conn.scalar(text("SELECT COUNT(*) FROM items"))
+    conn.rollback()
+    database.close()
+{% endif -%}
+
+    assert not acquired_after_commit
+    assert count == 1
+    assert not conn.acquired
+{% endif -%}
@@ -0,0 +1,43 @@
+{% if cookiecutter.use_structured_logging == "yes" -%}
+"""Test single-pass JSON log rendering."""
+
+import json
+import logging
+
+from src.helper.logger import OrjsonRenderer
+
+
+def _record() -> logging.LogRecord:
+    return logging.LogRecord("app", logging.INFO, "/src/app.py", 12, "ignored", None, None, func="handler")
+
+
+def test_render_record_fields_event_fields_and_static_fields():
+    """Test a line carries record fields, event fields and the pre-encoded static fields."""
+    renderer = OrjsonRenderer(static_fields={"app_name": "demo", "app_env": "local"})
+    record = _record()
+
+    line = renderer(None, "info", {"event": "User created", "event_type": "user_created", "_record": record})
+
+    assert json.loads(line) == {
+        "timestamp": record.created,
+        "level": "INFO",
+        "logger": "app",
+        "module": "app",
+        "function": "handler",
+        "line": 12,
+        "message": "User created",
+        "event_type": "user_created",
+        "app_name": "demo",
+        "app_env": "local",
+    }
+
+
+def test_event_fields_override_static_fields():
+    """Test an event field with the same name as a static field wins."""
+    renderer = OrjsonRenderer(static_fields={"app_name": "demo", "app_env": "local"})
+
+    line = renderer(None, "info", {"event": "Switched", "app_env": "staging", "_record": _record()})
+
+    assert json.loads(line)["app_env"] == "staging"
+    assert line.count('"app_env"') == 1
+{% endif -%}
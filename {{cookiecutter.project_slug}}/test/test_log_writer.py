@@ -0,0 +1,133 @@
+"""Test background log writer."""
+
+import io
+import logging
+import threading
+
+from src.helper.log_writer import BackgroundLogHandler
+
+
+def _record(level: int, msg: str) -> logging.LogRecord:
+    return logging.LogRecord("test", level, __file__, 1, msg, None, None)
+
+
+class StalledStream(io.StringIO):
+    """Stream whose writes block until released, like a stdout pipe nobody reads."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.writing = threading.Event()
+        self.released = threading.Event()
+
+    def write(self, s: str) -> int:
+        self.writing.set()
+        self.released.wait(5)
+        return super().write(s)
+
+
+def _stall(overflow_policy: str, max_queue_size: int) -> tuple[BackgroundLogHandler, StalledStream]:
+    """Create a handler whose writer thread is stuck writing a first record, "first"."""
+    stream = StalledStream()
+    handler = BackgroundLogHandler(
+        stream=stream, max_queue_size=max_queue_size, batch_size=1, overflow_policy=overflow_policy
+    )
+    handler.emit(_record(logging.INFO, "first"))
+    assert stream.writing.wait(5)
+    return handler, stream
+
+
+def test_writes_all_records_in_order():
+    """Test records are written in order once flushed."""
+    stream = io.StringIO()
+    handler = BackgroundLogHandler(stream=stream, batch_size=3)
+    for i in range(10):
+        handler.emit(_record(logging.INFO, f"line {i}"))
+
+    assert handler.flush(timeout=5)
+    handler.close()
+
+    assert stream.getvalue().splitlines() == [f"line {i}" for i in range(10)]
+    assert handler.stats()["written"] == 10
+    assert handler.stats()["dropped"] == 0
+
+
+def test_drop_debug_first_policy():
+    """Test DEBUG records are discarded before anything else on overflow."""
+    handler = BackgroundLogHandler(stream=io.StringIO(), max_queue_size=2, overflow_policy="drop_debug_first")
+
+    # Hold the mutex so the writer thread cannot drain the queue during the check
+    with handler._mutex:
+        handler._queue.extend([_record(logging.DEBUG, "debug"), _record(logging.INFO, "info")])
+        handler._debug_pending = 1
+
+        assert handler._make_room(_record(logging.ERROR, "error"))
+        assert [record.msg for record in handler._queue] == ["info"]
+        assert not handler._make_room(_record(logging.DEBUG, "debug"))
+
+    handler.close()
+
+
+def test_drop_oldest_keeps_the_newest_records():
+    """Test a full queue discards its oldest records and counts them as dropped."""
+    handler, stream = _stall("drop_oldest", max_queue_size=2)
+    for i in range(4):
+        handler.emit(_record(logging.INFO, f"line {i}"))
+
+    assert handler.stats() == {"queued": 5, "pending": 2, "dropped": 2, "written": 0}
+    stream.released.set()
+    assert handler.flush(timeout=5)
+    handler.close()
+
+    assert stream.getvalue().splitlines() == ["first", "line 2", "line 3"]
+    assert handler.stats() == {"queued": 5, "pending": 0, "dropped": 2, "written": 3}
+
+
+def test_drop_debug_first_under_overflow():
+    """Test a full queue discards queued DEBUG records, then new DEBUG records, then the oldest."""
+    handler, stream = _stall("drop_debug_first", max_queue_size=2)
+    handler.emit(_record(logging.DEBUG, "debug 1"))
+    handler.emit(_record(logging.INFO, "info 1"))
+    handler.emit(_record(logging.ERROR, "error"))
+    handler.emit(_record(logging.DEBUG, "debug 2"))
+    handler.emit(_record(logging.INFO, "info 2"))
+
+    stream.released.set()
+    handler.close()
+
+    assert stream.getvalue().splitlines() == ["first", "error", "info 2"]
+    assert handler.stats() == {"queued": 5, "pending": 0, "dropped": 3, "written": 3}
+
+
+def test_block_waits_for_the_writer_without_loss():
+    """Test a full queue holds the logging thread back until the writer frees a slot."""
+    handler, stream = _stall("block", max_queue_size=1)
+    handler.emit(_record(logging.INFO, "queued"))
+    producer = threading.Thread(target=handler.emit, args=(_record(logging.INFO, "blocked"),))
+    producer.start()
+
+    producer.join(0.1)
+    assert producer.is_alive()
+    assert handler.stats() == {"queued": 2, "pending": 1, "dropped": 0, "written": 0}
+
+    stream.released.set()
+    producer.join(5)
+    assert not producer.is_alive()
+    assert handler.flush(timeout=5)
+    handler.close()
+
+    assert stream.getvalue().splitlines() == ["first", "queued", "blocked"]
+    assert handler.stats() == {"queued": 3, "pending": 0, "dropped": 0, "written": 3}
+
+
+def test_flush_times_out_and_close_drains_while_the_writer_is_stalled():
+    """Test flush reports a timeout on a stalled writer, and close still writes every queued record."""
+    handler, stream = _stall("block", max_queue_size=10)
+    handler.emit(_record(logging.INFO, "pending"))
+
+    assert handler.flush(timeout=0.05) is False
+    threading.Timer(0.1, stream.released.set).start()
+    handler.close()
+
+    assert not handler._thread.is_alive()
+    assert stream.getvalue().splitlines() == ["first", "pending"]
+    assert handler.stats() == {"queued": 2, "pending": 0, "dropped": 0, "written": 2}
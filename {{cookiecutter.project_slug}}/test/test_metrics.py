@@ -0,0 +1,66 @@
+"""Test the metrics registry and Prometheus rendering."""
+
+import os
+
+from src.helper.metrics import Counter, Gauge, Histogram, MetricsRegistry
+
+
+def test_render_counter_and_histogram():
+    """Test metrics render in the Prometheus text format."""
+    registry = MetricsRegistry()
+    requests = Counter("requests_total", "Requests", ("route",), registry=registry)
+    latency = Histogram("latency_seconds", "Latency", buckets=(0.1, 1.0), registry=registry)
+
+    requests.inc(route="/items/{item_id}")
+    requests.inc(route="/items/{item_id}")
+    latency.observe(0.05)
+    latency.observe(0.5)
+
+    output = registry.render()
+
+    assert '# TYPE requests_total counter' in output
+    assert 'requests_total{route="/items/{item_id}"} 2' in output
+    assert 'latency_seconds_bucket{le="0.1"} 1' in output
+    assert 'latency_seconds_bucket{le="+Inf"} 2' in output
+    assert 'latency_seconds_count 2' in output
+
+
+def test_multiprocess_snapshots_are_merged(tmp_path):
+    """Test a scrape merges snapshots written by other worker processes."""
+    worker = MetricsRegistry(multiproc_dir=str(tmp_path))
+    Counter("jobs_total", "Jobs", registry=worker).inc(3)
+    Gauge("workers_busy", "Busy workers", registry=worker).set(1)
+    worker.flush()
+    # Same snapshot reported by a second, already exited process
+    (tmp_path / "metrics_999999999.json").write_bytes((tmp_path / f"metrics_{os.getpid()}.json").read_bytes())
+
+    output = worker.render()
+
+    assert "jobs_total 6" in output
+    assert "workers_busy 1" in output
+
+
+def test_dead_worker_snapshots_are_compacted(tmp_path):
+    """Test exited workers fold into the aggregate, keeping counters and max gauges only."""
+    worker = MetricsRegistry(multiproc_dir=str(tmp_path))
+    Counter("jobs_total", "Jobs", registry=worker).inc(3)
+    Gauge("workers_busy", "Busy workers", registry=worker).set(1)
+    Gauge("peak_rss_bytes", "Peak RSS", multiprocess_mode="max", registry=worker).set(5)
+    Gauge("uptime_seconds", "Uptime", multiprocess_mode="all", registry=worker).set(7)
+    worker.flush()
+    snapshot = (tmp_path / f"metrics_{os.getpid()}.json").read_bytes()
+    for dead_pid in (999999998, 999999999):
+        (tmp_path / f"metrics_{dead_pid}.json").write_bytes(snapshot)
+        worker.mark_process_dead(dead_pid)
+
+    output = worker.render()
+
+    assert {path.name for path in tmp_path.glob("metrics_*.json")} == {
+        "metrics_aggregate.json",
+        f"metrics_{os.getpid()}.json",
+    }
+    assert "jobs_total 9" in output
+    assert "workers_busy 1" in output
+    assert "peak_rss_bytes 5" in output
+    assert 'uptime_seconds{pid="%d"} 7' % os.getpid() in output
+    assert "999999" not in output
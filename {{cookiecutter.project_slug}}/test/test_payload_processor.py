@@ -0,0 +1,110 @@
+{% if cookiecutter.include_middleware_logging == "yes" -%}
+"""Test the payload log worker pool and zero-copy body capture."""
+
+import asyncio
+import threading
+import time
+from contextvars import ContextVar
+
+from src.middleware.asgi_logging import ASGILoggingMiddleware
+from src.middleware.payload_processor import PayloadLogProcessor, payload_processor
+from src.middleware.sampling import PayloadSamplingPolicy
+
+request_marker: ContextVar[str] = ContextVar("request_marker", default="unset")
+
+
+def test_saturated_pool_rejects_jobs():
+    """Test jobs beyond max_pending are refused at once and accepted again once a slot frees."""
+    processor = PayloadLogProcessor(max_workers=1, max_pending=1)
+    started = threading.Event()
+    release = threading.Event()
+
+    def block():
+        started.set()
+        release.wait(5)
+
+    assert processor.submit(block)
+    started.wait(5)
+    assert not processor.submit(block)
+    release.set()
+    processor.shutdown(wait=True)
+
+    assert processor.stats() == {"submitted": 1, "rejected": 1}
+    # A shut down pool starts fresh threads on the next job
+    assert processor.submit(lambda: None)
+    processor.shutdown(wait=True)
+
+
+def test_jobs_run_in_a_copy_of_the_request_context():
+    """Test a job sees context variables set by the submitting request."""
+    processor = PayloadLogProcessor(max_workers=1, max_pending=10)
+    seen = []
+    token = request_marker.set("request-1")
+    try:
+        processor.submit(lambda: seen.append(request_marker.get()))
+    finally:
+        request_marker.reset(token)
+    processor.shutdown(wait=True)
+
+    assert seen == ["request-1"]
+
+
+def test_shutdown_drains_pending_jobs():
+    """Test shutdown waits for queued jobs instead of dropping them."""
+    processor = PayloadLogProcessor(max_workers=1, max_pending=10)
+    done = []
+
+    def job(index):
+        time.sleep(0.01)
+        done.append(index)
+
+    for index in range(5):
+        assert processor.submit(job, index)
+    processor.shutdown(wait=True)
+
+    assert done == [0, 1, 2, 3, 4]
+
+
+def test_captured_chunks_join_to_the_exact_body(monkeypatch):
+    """Test memoryview chunks captured from a streamed body join to the bytes sent and received."""
+    request_parts = [b'{"name": "', bytes(range(32, 127)) * 10, b'"}']
+    response_parts = [b"[1, ", b"2, ", b"3]"]
+    jobs = []
+    monkeypatch.setattr(payload_processor, "submit", lambda fn, *args: jobs.append(args) or True)
+
+    async def app(scope, receive, send):
+        more_body = True
+        while more_body:
+            more_body = (await receive()).get("more_body", False)
+        await send({"type": "http.response.start", "status": 200, "headers": [(b"content-type", b"application/json")]})
+        for index, part in enumerate(response_parts):
+            await send({"type": "http.response.body", "body": part, "more_body": index < len(response_parts) - 1})
+
+    middleware = ASGILoggingMiddleware(app, sampling_policy=PayloadSamplingPolicy(rate=1.0))
+    messages = [
+        {"type": "http.request", "body": part, "more_body": index < len(request_parts) - 1}
+        for index, part in enumerate(request_parts)
+    ]
+
+    async def receive():
+        return messages.pop(0)
+
+    async def send(message):
+        pass
+
+    scope = {
+        "type": "http",
+        "method": "POST",
+        "path": "/api/v1/echo",
+        "query_string": b"",
+        "headers": [(b"content-type", b"application/json")],
+        "client": ("127.0.0.1", 1234),
+    }
+    asyncio.run(middleware(scope, receive, send))
+
+    assert len(jobs) == 1
+    _, (request_chunks, _), (response_chunks, _) = jobs[0]
+    assert all(isinstance(chunk, memoryview) for chunk in request_chunks + response_chunks)
+    assert b"".join(request_chunks) == b"".join(request_parts)
+    assert b"".join(response_chunks) == b"".join(response_parts)
+{% endif -%}
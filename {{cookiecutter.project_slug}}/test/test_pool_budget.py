@@ -0,0 +1,30 @@
+{% if cookiecutter.use_database == "yes" -%}
+"""Test connection budget pool sizing."""
+
+import pytest
+
+from src.database.budget import ConnectionBudgetError, plan_pool
+
+
+def test_budget_is_split_across_processes_keeping_pool_overflow_ratio():
+    """Test each process gets an even share of the budget, split like the configured sizes."""
+    plan = plan_pool(pool_size=20, max_overflow=30, budget=100, workers=4, replicas=5)
+
+    assert (plan.pool_size, plan.max_overflow) == (2, 3)
+    assert plan.max_connections == 100
+    assert plan.within_budget
+
+    generous = plan_pool(pool_size=20, max_overflow=30, budget=1000, workers=2)
+    assert (generous.pool_size, generous.max_overflow) == (20, 30)
+
+
+def test_budget_smaller_than_process_count():
+    """Test an unsatisfiable budget warns by default and fails in strict mode."""
+    plan = plan_pool(pool_size=20, max_overflow=30, budget=4, workers=4, replicas=2)
+
+    assert (plan.pool_size, plan.max_overflow) == (1, 0)
+    assert not plan.within_budget
+
+    with pytest.raises(ConnectionBudgetError):
+        plan_pool(pool_size=20, max_overflow=30, budget=4, workers=4, replicas=2, strict=True)
+{% endif -%}
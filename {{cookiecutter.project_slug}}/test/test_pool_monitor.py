@@ -0,0 +1,62 @@
+{% if cookiecutter.use_database == "yes" and cookiecutter.database_type == "SQLite" -%}
+"""Test connection pool instrumentation."""
+
+{% if cookiecutter.use_async_database == "yes" -%}
+import asyncio
+
+{% endif -%}
+from src.config import SettingsProxy, settings
+from src.database.client import DatabaseClient
+from src.database.pool_monitor import PoolMonitor
+
+
+def test_snapshot_reports_usage_and_connection_events(monkeypatch, tmp_path):
+    """Test pool events are counted and usage is read from the current pool."""
+    test_settings = settings.snapshot().model_copy(update={"SQLITE_DB_PATH": str(tmp_path / "monitor.db")})
+    monkeypatch.setattr("src.database.client.settings", SettingsProxy(test_settings))
+    database = DatabaseClient()
+    database.create_engine()
+{% if cookiecutter.use_async_database == "yes" -%}
+
+    async def scenario():
+        await database.warm_up(2)
+        warmed = database.pool_monitor.snapshot()
+        await database.close()
+        return warmed
+
+    warmed = asyncio.run(scenario())
+{% else -%}
+
+    database.warm_up(2)
+    warmed = database.pool_monitor.snapshot()
+    database.close()
+{% endif -%}
+
+    assert warmed["created"] == 2
+    assert warmed["idle"] == 2
+    assert warmed["checked_out"] == 0
+    assert warmed["waiting"] == 0
+    assert database.pool_monitor.snapshot()["closed"] == 2
+
+
+def test_saturation_is_logged_once_per_interval(monkeypatch):
+    """Test waiters above the threshold log one saturation event per interval."""
+    test_settings = settings.snapshot().model_copy(update={
+        "DB_POOL_SATURATION_WAITERS": 1,
+        "DB_POOL_SATURATION_LOG_INTERVAL": 60.0,
+    })
+    monkeypatch.setattr("src.database.pool_monitor.settings", SettingsProxy(test_settings))
+    logged = []
+    monkeypatch.setattr(
+        "src.database.pool_monitor.logger.warning",
+        lambda message, **fields: logged.append(fields),
+    )
+    monitor = PoolMonitor()
+
+    with monitor.checkout(), monitor.checkout(), monitor.checkout():
+        assert monitor.waiting == 3
+
+    assert monitor.waiting == 0
+    assert [fields["waiting"] for fields in logged] == [2]
+    assert logged[0]["event_type"] == "db_pool_saturated"
+{% endif -%}
@@ -0,0 +1,34 @@
+{% if cookiecutter.use_database == "yes" and cookiecutter.database_type == "SQLite" -%}
+"""Test database pool warm-up."""
+
+{% if cookiecutter.use_async_database == "yes" -%}
+import asyncio
+
+{% endif -%}
+from src.config import SettingsProxy, settings
+from src.database.client import DatabaseClient
+
+
+def test_warm_up_fills_pool_up_to_pool_size(monkeypatch, tmp_path):
+    """Test warm-up opens connections concurrently and leaves them idle in the pool."""
+    test_settings = settings.snapshot().model_copy(update={"SQLITE_DB_PATH": str(tmp_path / "warmup.db")})
+    monkeypatch.setattr("src.database.client.settings", SettingsProxy(test_settings))
+    database = DatabaseClient()
+    pool_size = database.engine.pool.size()
+{% if cookiecutter.use_async_database == "yes" -%}
+
+    warmed = asyncio.run(database.warm_up(pool_size + 5))
+{% else -%}
+
+    warmed = database.warm_up(pool_size + 5)
+{% endif -%}
+
+    assert warmed == pool_size
+    assert database.engine.pool.checkedin() == pool_size
+    assert database.engine.pool.checkedout() == 0
+{% if cookiecutter.use_async_database == "yes" -%}
+    asyncio.run(database.close())
+{% else -%}
+    database.close()
+{% endif -%}
+{% endif -%}
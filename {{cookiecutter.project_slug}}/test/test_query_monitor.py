@@ -0,0 +1,65 @@
+{% if cookiecutter.use_database == "yes" and cookiecutter.database_type == "SQLite" -%}
+"""Test statement fingerprinting and per-request query tracking."""
+
+{% if cookiecutter.use_async_database == "yes" -%}
+import asyncio
+
+{% endif -%}
+from sqlalchemy import text
+
+from src.config import SettingsProxy, settings
+from src.database.client import DatabaseClient
+from src.database.query_monitor import fingerprint, start_query_tracking, stop_query_tracking
+
+
+def test_fingerprint_ignores_values():
+    """Test statements differing only in literals, parameters or list lengths share a fingerprint."""
+    assert fingerprint("SELECT * FROM users WHERE id = 42 AND name = 'ann'") == (
+        "SELECT * FROM users WHERE id = ? AND name = ?"
+    )
+    assert fingerprint("SELECT id FROM t1 WHERE id IN (?, ?, ?)") == fingerprint("SELECT id FROM t1 WHERE id IN (?)")
+    assert fingerprint("INSERT INTO t (a, b) VALUES (%(a)s, %(b)s), (%(a_1)s, %(b_1)s)") == (
+        "INSERT INTO t (a, b) VALUES (...)"
+    )
+    assert fingerprint("SELECT  x::text\n FROM t WHERE y = :y_1 OR z = $2") == "SELECT x::text FROM t WHERE y = ? OR z = ?"
+
+
+def test_repeated_statements_in_one_request_are_reported(monkeypatch, tmp_path):
+    """Test a fingerprint above the per-request threshold is logged once and aggregated."""
+    test_settings = settings.snapshot().model_copy(update={
+        "SQLITE_DB_PATH": str(tmp_path / "queries.db"),
+        "DB_N_PLUS_ONE_THRESHOLD": 2,
+    })
+    monkeypatch.setattr("src.database.client.settings", SettingsProxy(test_settings))
+    monkeypatch.setattr("src.database.query_monitor.settings", SettingsProxy(test_settings))
+    logged = []
+    monkeypatch.setattr(
+        "src.database.query_monitor.logger.warning",
+        lambda message, **fields: logged.append(fields),
+    )
+    database = DatabaseClient()
+    queries, token = start_query_tracking()
+{% if cookiecutter.use_async_database == "yes" -%}
+
+    async def run_queries():
+        async with database.engine.connect() as conn:
+            for user_id in range(4):
+                await conn.execute(text("SELECT :id"), {"id": user_id})
+        await database.close()
+
+    asyncio.run(run_queries())
+{% else -%}
+
+    with database.engine.connect() as conn:
+        for user_id in range(4):
+            conn.execute(text("SELECT :id"), {"id": user_id})
+    database.close()
+{% endif -%}
+    stop_query_tracking(token)
+
+    assert queries.count == 4
+    assert [(fields["event_type"], fields["executions"]) for fields in logged] == [("db_n_plus_one_detected", 3)]
+    (stats,) = [row for row in database.query_monitor.stats() if row["fingerprint"] == "SELECT ?"]
+    assert stats["count"] == 4
+    assert stats["p95_ms"] <= stats["max_ms"]
+{% endif -%}
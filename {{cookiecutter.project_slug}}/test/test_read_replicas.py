@@ -0,0 +1,72 @@
+{% if cookiecutter.use_database == "yes" and cookiecutter.database_type == "SQLite" -%}
+"""Test read replica routing."""
+
+{% if cookiecutter.use_async_database == "yes" -%}
+import asyncio
+
+{% endif -%}
+from src.config import SettingsProxy, settings
+from src.database.client import DatabaseClient
+
+{% if cookiecutter.use_async_database == "yes" -%}
+DRIVER = "sqlite+aiosqlite"
+{% else -%}
+DRIVER = "sqlite"
+{% endif -%}
+
+
+def _client(monkeypatch, tmp_path, replica_paths, selection="round_robin"):
+    test_settings = settings.snapshot().model_copy(update={
+        "SQLITE_DB_PATH": str(tmp_path / "primary.db"),
+        "DB_REPLICA_URLS": [f"{DRIVER}:///{path}" for path in replica_paths],
+        "DB_REPLICA_SELECTION": selection,
+    })
+    monkeypatch.setattr("src.database.client.settings", SettingsProxy(test_settings))
+    database = DatabaseClient()
+    database.create_engine()
+    return database
+
+
+def test_round_robin_skips_unhealthy_replicas(monkeypatch, tmp_path):
+    """Test reads rotate over healthy replicas and fall back to the primary when none is left."""
+    database = _client(monkeypatch, tmp_path, [tmp_path / "a.db", tmp_path / "b.db"])
+    first, second = database.replicas
+
+    assert [database.select_replica() for _ in range(4)] == [first, second, first, second]
+
+    database.mark_replica_unhealthy(first, RuntimeError("down"))
+    assert {database.select_replica().name for _ in range(3)} == {second.name}
+
+    database.mark_replica_unhealthy(second, RuntimeError("down"))
+    assert database.select_replica() is None
+
+
+def test_health_check_removes_and_restores_replicas(monkeypatch, tmp_path):
+    """Test a failing replica leaves rotation and returns once it answers again."""
+    missing_dir = tmp_path / "missing"
+    database = _client(monkeypatch, tmp_path, [missing_dir / "replica.db"], selection="least_busy")
+    (replica,) = database.replicas
+{% if cookiecutter.use_async_database == "yes" -%}
+
+    async def scenario():
+        await database.check_replicas()
+        removed = (replica.healthy, database.select_replica())
+        missing_dir.mkdir()
+        await database.check_replicas()
+        await database.close()
+        return removed
+
+    removed = asyncio.run(scenario())
+{% else -%}
+
+    database.check_replicas()
+    removed = (replica.healthy, database.select_replica())
+    missing_dir.mkdir()
+    database.check_replicas()
+    database.close()
+{% endif -%}
+
+    assert removed == (False, None)
+    assert replica.healthy
+    assert database.select_replica() is replica
+{% endif -%}
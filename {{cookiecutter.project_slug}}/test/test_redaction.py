@@ -0,0 +1,32 @@
+{% if cookiecutter.include_middleware_logging == "yes" -%}
+"""Test payload redaction."""
+
+from src.middleware.redaction import REDACTED, TRUNCATED, Redactor
+
+
+def test_redacts_sensitive_keys_and_values():
+    """Test sensitive keys and token-looking values are redacted."""
+    redactor = Redactor()
+    payload = {
+        "email": "user@example.com",
+        "Password": "hunter22",
+        "profile": {"API_KEY": "abc", "note": "Bearer abc.def"},
+        "session": "eyJhbGciOiJIUzI1NiJ9.eyJzdWIiOiIxIn0.sig",
+    }
+
+    assert redactor.redact(payload) == {
+        "email": "user@example.com",
+        "Password": REDACTED,
+        "profile": {"API_KEY": REDACTED, "note": REDACTED},
+        "session": REDACTED,
+    }
+
+
+def test_caps_depth_items_and_string_length():
+    """Test large payloads are truncated with markers."""
+    redactor = Redactor(max_depth=2, max_items=3, max_string_length=5)
+
+    assert redactor.redact(list(range(10))) == [0, 1, 2, f"{TRUNCATED} 7 more items"]
+    assert redactor.redact({"a": {"b": {"c": 1}}}) == {"a": {"b": TRUNCATED}}
+    assert redactor.redact("abcdefgh") == "abcde... [truncated]"
+{% endif -%}
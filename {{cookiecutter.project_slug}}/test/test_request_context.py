@@ -0,0 +1,35 @@
+"""Test request context binding and request ID generation."""
+
+from src.helper.request_context import (
+    add_request_context,
+    bind_request_context,
+    bind_user_id,
+    new_request_id,
+    reset_request_context,
+    resolve_request_id,
+)
+
+
+def test_request_ids_are_time_ordered_and_upstream_ids_validated():
+    """Test generated IDs sort by creation and only well-formed upstream IDs are reused."""
+    first, second = new_request_id(), new_request_id()
+
+    assert len(first) == 32
+    assert first < second
+    assert resolve_request_id(b"gw-1234.abc:5") == "gw-1234.abc:5"
+    assert resolve_request_id(b"bad id\nwith newline") != "bad id\nwith newline"
+    assert resolve_request_id(b"x" * 200) != "x" * 200
+
+
+def test_request_context_is_added_to_log_events():
+    """Test bound request fields are added to structured log events."""
+    assert add_request_context(None, "info", {"event": "outside"}) == {"event": "outside"}
+
+    token = bind_request_context("req-1", "GET", "/api/v1/auth/me")
+    try:
+        bind_user_id("user-1")
+        event = add_request_context(None, "info", {"event": "inside"})
+    finally:
+        reset_request_context(token)
+
+    assert event == {"event": "inside", "request_id": "req-1", "route": "/api/v1/auth/me", "user_id": "user-1"}
@@ -0,0 +1,37 @@
+{% if cookiecutter.include_middleware_logging == "yes" -%}
+"""Test route template matching for the logging middleware."""
+
+from src.middleware.route_matcher import RouteMatcher
+
+
+def test_match_static_and_parameterized_routes():
+    """Test paths resolve to their route templates."""
+    matcher = RouteMatcher([
+        "/health",
+        "/api/v1/items/{item_id}",
+        "/api/v1/items/latest",
+        "/api/v1/items/{item_id}/tags/{tag}",
+    ])
+
+    assert matcher.match("/health") == "/health"
+    assert matcher.match("/api/v1/items/42") == "/api/v1/items/{item_id}"
+    assert matcher.match("/api/v1/items/latest") == "/api/v1/items/latest"
+    assert matcher.match("/api/v1/items/42/tags/red") == "/api/v1/items/{item_id}/tags/{tag}"
+    assert matcher.match("/api/v1/unknown") is None
+
+
+def test_match_catch_all_route():
+    """Test path converters match the rest of the path."""
+    matcher = RouteMatcher(["/static/{file_path:path}", "/"])
+
+    assert matcher.match("/static/css/site.css") == "/static/{file_path:path}"
+    assert matcher.match("/") == "/"
+
+
+def test_match_backtracks_from_a_dead_end_static_segment():
+    """Test a static segment that leads nowhere falls back to the parameter route."""
+    matcher = RouteMatcher(["/items/latest", "/items/{item_id}/tags"])
+
+    assert matcher.match("/items/latest") == "/items/latest"
+    assert matcher.match("/items/latest/tags") == "/items/{item_id}/tags"
+{% endif -%}
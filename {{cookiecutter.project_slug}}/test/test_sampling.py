@@ -0,0 +1,119 @@
+{% if cookiecutter.include_middleware_logging == "yes" -%}
+"""Test payload sampling policies."""
+
+import asyncio
+
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+from src.middleware.asgi_logging import ASGILoggingMiddleware
+from src.middleware.payload_processor import payload_processor
+from src.middleware.route_matcher import RoutePolicy
+from src.middleware.sampling import PayloadSamplingPolicy
+
+
+def test_route_and_status_overrides():
+    """Test the longest route prefix wins and status classes use their own rate."""
+    policy = PayloadSamplingPolicy(
+        rate=0.5,
+        route_rates={"/api/v1": 0.0, "/api/v1/auth": 1.0},
+        status_rates={"2xx": 0.0, "4xx": 1.0},
+    )
+
+    assert policy.route_rate("/api/v1/auth/login") == 1.0
+    assert policy.route_rate("/api/v1/items/{item_id}") == 0.0
+    assert policy.route_rate("/health") == 0.5
+    assert not policy.should_log_payloads(True, 200, 5.0)
+    assert policy.should_log_payloads(True, 404, 5.0)
+    # No override for 3xx: sampled payloads are always logged
+    assert policy.should_log_payloads(True, 302, 5.0)
+    assert not policy.should_log_payloads(False, 404, 5.0)
+
+
+def test_errors_and_slow_requests_are_always_logged():
+    """Test 5xx, failed and slow requests log payloads unsampled, even when their status rate is zero."""
+    policy = PayloadSamplingPolicy(status_rates={"2xx": 0.0, "5xx": 0.0}, slow_request_ms=100.0)
+
+    assert policy.should_log_payloads(False, 503, 5.0)
+    assert policy.should_log_payloads(False, None, 5.0)
+    assert policy.should_log_payloads(False, 200, 100.0)
+    assert not policy.should_log_payloads(True, 200, 99.0)
+
+
+def test_middleware_samples_the_compiled_route_rate(monkeypatch):
+    """Test route rates, and explicit route policies over them, decide capture per request."""
+    jobs = []
+    monkeypatch.setattr(payload_processor, "submit", lambda fn, *args: jobs.append(args) or True)
+
+    async def endpoint(request):
+        return JSONResponse({"ok": True})
+
+    class App:
+        routes = [Route("/files/{file_id}", endpoint), Route("/auth/login", endpoint), Route("/items", endpoint)]
+
+        async def __call__(self, scope, receive, send):
+            await JSONResponse({"ok": True})(scope, receive, send)
+
+    app = App()
+    middleware = ASGILoggingMiddleware(
+        app,
+        sampling_policy=PayloadSamplingPolicy(rate=1.0, route_rates={"/files": 0.0, "/auth": 0.0}),
+        route_policies={"/auth/login": RoutePolicy(sample_rate=1.0)},
+    )
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    async def request(path):
+        scope = {"type": "http", "method": "GET", "path": path, "query_string": b"", "headers": [], "app": app}
+        await middleware(scope, receive, send)
+
+    for path in ("/files/1", "/auth/login", "/items"):
+        asyncio.run(request(path))
+
+    assert [(completed["route"], completed["payload_sampled"]) for completed, _, _ in jobs] == [
+        ("/files/{file_id}", False),
+        ("/auth/login", True),
+        ("/items", True),
+    ]
+
+
+def test_unsampled_server_error_logs_its_payloads(monkeypatch):
+    """Test a request left out by sampling still logs both bodies when it fails with a 500."""
+    logged = []
+    jobs = []
+    monkeypatch.setattr("src.middleware.asgi_logging.logger.info", lambda message, **fields: logged.append(fields))
+    monkeypatch.setattr(payload_processor, "submit", lambda fn, *args: jobs.append((fn, args)) or True)
+
+    async def app(scope, receive, send):
+        await receive()
+        await JSONResponse({"detail": "boom"}, status_code=500)(scope, receive, send)
+
+    middleware = ASGILoggingMiddleware(app, sampling_policy=PayloadSamplingPolicy(rate=0.0))
+
+    async def receive():
+        return {"type": "http.request", "body": b'{"item": "widget"}', "more_body": False}
+
+    async def send(message):
+        pass
+
+    scope = {
+        "type": "http",
+        "method": "POST",
+        "path": "/items",
+        "query_string": b"",
+        "headers": [(b"content-type", b"application/json")],
+    }
+    asyncio.run(middleware(scope, receive, send))
+    fn, args = jobs[0]
+    fn(*args)
+
+    completed = logged[-1]
+    assert completed["status_code"] == 500
+    assert completed["payload_sampled"] is True
+    assert completed["request_payload"] == {"item": "widget"}
+    assert completed["response_payload"] == {"detail": "boom"}
+{% endif -%}
@@ -0,0 +1,70 @@
+"""Test hot reloading of runtime settings."""
+
+import asyncio
+{% if cookiecutter.use_database == "yes" and cookiecutter.use_async_database != "yes" -%}
+import threading
+{% endif -%}
+
+import pytest
+from pydantic import ValidationError
+
+from src.config import reload_settings, settings, subscribe, unsubscribe
+
+
+def test_reload_swaps_snapshot_and_notifies_subscribers(monkeypatch):
+    """Test a reload applies new values and calls subscribers of changed fields only."""
+    calls = []
+
+    def on_log_level(old, new):
+        calls.append((old.LOG_LEVEL, new.LOG_LEVEL))
+
+    def on_app_name(old, new):
+        calls.append("app_name")
+
+    subscribe(("LOG_LEVEL",), on_log_level)
+    subscribe(("APP_NAME",), on_app_name)
+    original_level = settings.LOG_LEVEL
+    new_level = "CRITICAL" if original_level != "CRITICAL" else "ERROR"
+
+    monkeypatch.setenv("LOG_LEVEL", new_level)
+    try:
+        result = asyncio.run(reload_settings())
+    finally:
+        monkeypatch.delenv("LOG_LEVEL")
+        unsubscribe(on_log_level)
+        unsubscribe(on_app_name)
+        asyncio.run(reload_settings())
+
+    assert result == {"changed": ["LOG_LEVEL"], "failed": []}
+    assert calls[0] == (original_level, new_level)
+    assert "app_name" not in calls
+    # Unsubscribed before the restoring reload
+    assert len(calls) == 1
+    assert settings.LOG_LEVEL == original_level
+
+
+def test_invalid_reload_keeps_current_settings(monkeypatch):
+    """Test settings failing validation are rejected without replacing the snapshot."""
+    snapshot = settings.snapshot()
+
+    monkeypatch.setenv("LOG_LEVEL", "LOUD")
+    with pytest.raises(ValidationError):
+        asyncio.run(reload_settings())
+
+    assert settings.snapshot() is snapshot
+{% if cookiecutter.use_database == "yes" and cookiecutter.use_async_database != "yes" -%}
+
+
+def test_engine_rebuild_disposes_the_old_pool_off_the_event_loop(monkeypatch):
+    """Test the blocking disposal of a replaced sync engine runs in a worker thread."""
+    from src.database.client import client
+
+    old_engine = client.engine
+    disposed_in = []
+    monkeypatch.setattr(old_engine, "dispose", lambda: disposed_in.append(threading.current_thread()))
+
+    asyncio.run(client.rebuild_engine())
+
+    assert client.engine is not old_engine
+    assert disposed_in and disposed_in[0] is not threading.main_thread()
+{% endif -%}
@@ -0,0 +1,58 @@
+{% if cookiecutter.use_database == "yes" and cookiecutter.database_type == "SQLite" -%}
+"""Test the SQLite connection profile."""
+
+{% if cookiecutter.use_async_database == "yes" -%}
+import asyncio
+
+{% endif -%}
+import pytest
+from pydantic import ValidationError
+from sqlalchemy import text
+
+from src.config import Settings, SettingsProxy, settings
+from src.database.client import DatabaseClient
+
+PRAGMAS = ("journal_mode", "synchronous", "busy_timeout", "mmap_size", "cache_size")
+
+
+def test_connections_apply_pragmas(monkeypatch, tmp_path):
+    """Test every pooled connection runs with the configured PRAGMAs."""
+    test_settings = settings.snapshot().model_copy(update={
+        "SQLITE_DB_PATH": str(tmp_path / "profile.db"),
+        "SQLITE_MMAP_SIZE": 1024 * 1024,
+        "SQLITE_CACHE_SIZE": 2048,
+    })
+    monkeypatch.setattr("src.database.client.settings", SettingsProxy(test_settings))
+    monkeypatch.setattr("src.database.sqlite_profile.settings", SettingsProxy(test_settings))
+    database = DatabaseClient()
+{% if cookiecutter.use_async_database == "yes" -%}
+
+    async def read_pragmas():
+        async with database.engine.connect() as conn:
+            values = [(await conn.execute(text(f"PRAGMA {name}"))).scalar() for name in PRAGMAS]
+        await database.close()
+        return values
+
+    values = asyncio.run(read_pragmas())
+{% else -%}
+
+    with database.engine.connect() as conn:
+        values = [conn.execute(text(f"PRAGMA {name}")).scalar() for name in PRAGMAS]
+    database.close()
+{% endif -%}
+
+    # synchronous reads back as a number: NORMAL is 1
+    assert values == ["wal", 1, 5000, 1024 * 1024, -2048]
+
+
+def test_pragma_settings_are_validated():
+    """Test modes are normalized to upper case and unknown modes are rejected."""
+    base = Settings().model_dump()
+    settings_class = Settings.__wrapped__
+
+    configured = settings_class.model_validate({**base, "SQLITE_JOURNAL_MODE": "wal", "SQLITE_SYNCHRONOUS": "full"})
+    assert (configured.SQLITE_JOURNAL_MODE, configured.SQLITE_SYNCHRONOUS) == ("WAL", "FULL")
+
+    with pytest.raises(ValidationError):
+        settings_class.model_validate({**base, "SQLITE_JOURNAL_MODE": "FAST"})
+{% endif -%}
@@ -0,0 +1,75 @@
+"""Test the startup import profiler."""
+
+import sys
+import threading
+
+from src.helper.startup import ImportProfiler, StartupProfile, startup_profile
+
+
+def test_import_profiler_records_self_time(tmp_path, monkeypatch):
+    """Test imports are timed per module without leaking the loader proxy."""
+    (tmp_path / "startup_probe_outer.py").write_text("import time\nimport startup_probe_inner\ntime.sleep(0.01)\n")
+    (tmp_path / "startup_probe_inner.py").write_text("import time\ntime.sleep(0.05)\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    profiler = ImportProfiler()
+    profiler.install()
+    try:
+        import startup_probe_outer
+    finally:
+        profiler.uninstall()
+        sys.modules.pop("startup_probe_outer", None)
+        sys.modules.pop("startup_probe_inner", None)
+
+    assert profiler not in sys.meta_path
+    assert profiler.timings["startup_probe_inner"] >= 50
+    assert 10 <= profiler.timings["startup_probe_outer"] < 50
+    assert list(profiler.slowest(1)) == ["startup_probe_inner"]
+    assert type(startup_probe_outer.__loader__).__name__ == "SourceFileLoader"
+
+
+def test_startup_profile_reports_and_resets_phases():
+    """Test phase durations are reported once and cleared for the next startup."""
+    profile = StartupProfile()
+    profile.imports.install()
+    with profile.phase("database_engine"):
+        pass
+
+    report = profile.finish()
+
+    assert profile.imports not in sys.meta_path
+    assert set(report) == {"phases_ms", "imports_ms", "slowest_imports_ms"}
+    assert "database_engine" in report["phases_ms"]
+    assert profile.finish()["phases_ms"] == {}
+
+
+def test_import_profiler_is_off_unless_enabled():
+    """Test importing the app does not leave a finder on sys.meta_path by default."""
+    assert startup_profile.imports not in sys.meta_path
+
+
+def test_concurrent_imports_keep_separate_nesting(tmp_path, monkeypatch):
+    """Test imports running in parallel threads each get their own self time."""
+    for name in ("startup_probe_left", "startup_probe_right"):
+        (tmp_path / f"{name}.py").write_text("import time\ntime.sleep(0.05)\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    profiler = ImportProfiler()
+    barrier = threading.Barrier(2)
+
+    def load(name):
+        barrier.wait()
+        __import__(name)
+
+    threads = [threading.Thread(target=load, args=(name,)) for name in ("startup_probe_left", "startup_probe_right")]
+    profiler.install()
+    try:
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        profiler.uninstall()
+        sys.modules.pop("startup_probe_left", None)
+        sys.modules.pop("startup_probe_right", None)
+
+    assert profiler.timings["startup_probe_left"] >= 45
+    assert profiler.timings["startup_probe_right"] >= 45
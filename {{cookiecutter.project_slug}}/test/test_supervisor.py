@@ -0,0 +1,63 @@
+"""Test the production worker supervisor."""
+
+import os
+import time
+
+import pytest
+
+from src.config import Settings, SettingsProxy, settings
+from src.helper.supervisor import RESTART_BACKOFF_BASE, Supervisor, WorkerProcess
+
+
+def test_worker_count_defaults_to_available_cpus():
+    """Test WORKERS=0 follows CPU affinity and DEBUG runs a single process."""
+    base = Settings().model_dump()
+    settings_class = Settings.__wrapped__
+
+    assert settings_class.model_validate({**base, "DEBUG": False, "WORKERS": 3}).worker_count == 3
+    assert settings_class.model_validate({**base, "DEBUG": False, "WORKERS": 0}).worker_count == len(os.sched_getaffinity(0))
+    assert settings_class.model_validate({**base, "DEBUG": True, "WORKERS": 3}).worker_count == 1
+
+
+def test_crashed_workers_restart_with_exponential_backoff():
+    """Test consecutive fast crashes double the restart delay."""
+    supervisor = Supervisor(app=None)
+    delays = []
+    for _ in range(2):
+        pid = os.fork()
+        if pid == 0:
+            os._exit(1)
+        os.waitid(os.P_PID, pid, os.WEXITED | os.WNOWAIT)
+        supervisor._workers[pid] = WorkerProcess(pid=pid, generation=0, started_at=time.monotonic())
+        supervisor._next_spawn_at = 0.0
+
+        supervisor._reap()
+        delays.append(supervisor._next_spawn_at - time.monotonic())
+
+    assert not supervisor._workers
+    assert supervisor._consecutive_crashes == 2
+    assert RESTART_BACKOFF_BASE * 0.5 < delays[0] <= RESTART_BACKOFF_BASE
+    assert RESTART_BACKOFF_BASE * 1.5 < delays[1] <= RESTART_BACKOFF_BASE * 2
+
+
+def test_memory_recycles_follow_the_crash_backoff(monkeypatch):
+    """Test workers over the memory limit right after start are replaced on the backoff schedule."""
+    test_settings = settings.snapshot().model_copy(update={"WORKER_MAX_RSS_MB": 1, "WORKERS": 1, "DEBUG": False})
+    monkeypatch.setattr("src.helper.supervisor.settings", SettingsProxy(test_settings))
+    monkeypatch.setattr("src.helper.supervisor._rss_bytes", lambda pid: 2 * 1024 * 1024)
+    monkeypatch.setattr("src.helper.supervisor._signal", lambda pid, signum: None)
+    supervisor = Supervisor(app=None)
+    monkeypatch.setattr(supervisor, "_spawn", lambda: pytest.fail("respawned before the backoff delay"))
+    delays = []
+    for pid in (1001, 1002):
+        supervisor._workers = {pid: WorkerProcess(pid=pid, generation=0, started_at=time.monotonic())}
+
+        supervisor._recycle_oversized()
+        supervisor._maintain()
+        delays.append(supervisor._next_spawn_at - time.monotonic())
+
+    worker = supervisor._workers[1002]
+    assert worker.stopping and worker.failed
+    assert supervisor._consecutive_crashes == 2
+    assert RESTART_BACKOFF_BASE * 0.5 < delays[0] <= RESTART_BACKOFF_BASE
+    assert RESTART_BACKOFF_BASE * 1.5 < delays[1] <= RESTART_BACKOFF_BASE * 2
@@ -0,0 +1,26 @@
+"""Test per-request phase timing."""
+
+from src.helper.timing import start_request_timing, stop_request_timing, timed
+
+
+def test_phases_accumulate_only_inside_a_timed_request():
+    """Test phases are recorded while timing is enabled and ignored otherwise."""
+    with timed("db"):
+        pass
+
+    timings, token = start_request_timing()
+    try:
+        with timed("db"):
+            pass
+        with timed("db"):
+            pass
+        with timed("jwt"):
+            pass
+    finally:
+        stop_request_timing(token)
+
+    with timed("argon2"):
+        pass
+
+    assert list(timings.phases) == ["db", "jwt"]
+    assert timings.header_value().startswith("db;dur=")
@@ -0,0 +1,143 @@
+{% if cookiecutter.use_database == "yes" and cookiecutter.database_type == "SQLite" -%}
+"""Test the request unit of work."""
+
+{% if cookiecutter.use_async_database == "yes" -%}
+import asyncio
+
+{% endif -%}
+import pytest
+from sqlalchemy import event, text
+
+from src.config import SettingsProxy, settings
+from src.database.client import DatabaseClient
+from src.database.lazy import LazyConnection
+from src.database.unit_of_work import UnitOfWork
+from src.dependencies.database import get_unit_of_work
+
+
+def make_database(monkeypatch, tmp_path) -> DatabaseClient:
+    test_settings = settings.snapshot().model_copy(update={"SQLITE_DB_PATH": str(tmp_path / "uow.db")})
+    monkeypatch.setattr("src.database.client.settings", SettingsProxy(test_settings))
+    return DatabaseClient()
+
+
+def test_request_writes_commit_once(monkeypatch, tmp_path):
+    """Test several writes share one commit, and a raising request rolls them all back."""
+    database = make_database(monkeypatch, tmp_path)
+    commits = []
+{% if cookiecutter.use_async_database == "yes" -%}
+    event.listen(database.engine.sync_engine, "commit", lambda conn: commits.append(conn))
+
+    async def scenario():
+        async with database.engine.connect() as conn:
+            await conn.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY)"))
+            await conn.commit()
+        commits.clear()
+
+        dependency = get_unit_of_work(LazyConnection(database.engine.connect))
+        unit_of_work = await anext(dependency)
+        for item_id in (1, 2, 3):
+            await unit_of_work.connection.execute(text("INSERT INTO items (id) VALUES (:id)"), {"id": item_id})
+        with pytest.raises(StopAsyncIteration):
+            await anext(dependency)
+
+        dependency = get_unit_of_work(LazyConnection(database.engine.connect))
+        unit_of_work = await anext(dependency)
+        await unit_of_work.connection.execute(text("INSERT INTO items (id) VALUES (4)"))
+        with pytest.raises(ValueError):
+            await dependency.athrow(ValueError("handler failed"))
+
+        async with database.engine.connect() as conn:
+            rows = (await conn.execute(text("SELECT id FROM items ORDER BY id"))).scalars().all()
+        await database.close()
+        return rows
+
+    rows = asyncio.run(scenario())
+{% else -%}
+    event.listen(database.engine, "commit", lambda conn: commits.append(conn))
+    with database.engine.connect() as conn:
+        conn.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY)"))
+        conn.commit()
+    commits.clear()
+
+    dependency = get_unit_of_work(LazyConnection(database.engine.connect))
+    unit_of_work = next(dependency)
+    for item_id in (1, 2, 3):
+        unit_of_work.connection.execute(text("INSERT INTO items (id) VALUES (:id)"), {"id": item_id})
+    with pytest.raises(StopIteration):
+        next(dependency)
+
+    dependency = get_unit_of_work(LazyConnection(database.engine.connect))
+    unit_of_work = next(dependency)
+    unit_of_work.connection.execute(text("INSERT INTO items (id) VALUES (4)"))
+    with pytest.raises(ValueError):
+        dependency.throw(ValueError("handler failed"))
+
+    with database.engine.connect() as conn:
+        rows = conn.execute(text("SELECT id FROM items ORDER BY id")).scalars().all()
+    database.close()
+{% endif -%}
+
+    assert len(commits) == 1
+    assert rows == [1, 2, 3]
+
+
+def test_failed_savepoint_keeps_the_other_writes(monkeypatch, tmp_path):
+    """Test a failing savepoint rolls back alone, and a released one still rolls back with the request."""
+    database = make_database(monkeypatch, tmp_path)
+    insert = text("INSERT INTO items (id) VALUES (:id)")
+{% if cookiecutter.use_async_database == "yes" -%}
+
+    async def scenario():
+        async with database.engine.connect() as conn:
+            await conn.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY)"))
+            await conn.commit()
+
+        unit_of_work = UnitOfWork(LazyConnection(database.engine.connect))
+        await unit_of_work.connection.execute(insert, {"id": 1})
+        with pytest.raises(ValueError):
+            async with unit_of_work.savepoint():
+                await unit_of_work.connection.execute(insert, {"id": 2})
+                raise ValueError("partial failure")
+        async with unit_of_work.savepoint():
+            await unit_of_work.connection.execute(insert, {"id": 3})
+        await unit_of_work.commit()
+
+        # A savepoint opening the transaction must not commit it on release
+        async with unit_of_work.savepoint():
+            await unit_of_work.connection.execute(insert, {"id": 4})
+        await unit_of_work.rollback()
+
+        async with database.engine.connect() as conn:
+            rows = (await conn.execute(text("SELECT id FROM items ORDER BY id"))).scalars().all()
+        await database.close()
+        return rows
+
+    rows = asyncio.run(scenario())
+{% else -%}
+    with database.engine.connect() as conn:
+        conn.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY)"))
+        conn.commit()
+
+    unit_of_work = UnitOfWork(LazyConnection(database.engine.connect))
+    unit_of_work.connection.execute(insert, {"id": 1})
+    with pytest.raises(ValueError):
+        with unit_of_work.savepoint():
+            unit_of_work.connection.execute(insert, {"id": 2})
+            raise ValueError("partial failure")
+    with unit_of_work.savepoint():
+        unit_of_work.connection.execute(insert, {"id": 3})
+    unit_of_work.commit()
+
+    # A savepoint opening the transaction must not commit it on release
+    with unit_of_work.savepoint():
+        unit_of_work.connection.execute(insert, {"id": 4})
+    unit_of_work.rollback()
+
+    with database.engine.connect() as conn:
+        rows = conn.execute(text("SELECT id FROM items ORDER BY id")).scalars().all()
+    database.close()
+{% endif -%}
+
+    assert rows == [1, 3]
+{% endif -%}
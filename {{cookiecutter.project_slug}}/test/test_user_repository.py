@@ -0,0 +1,78 @@
+{% if cookiecutter.use_database == "yes" and cookiecutter.database_type == "SQLite" and cookiecutter.include_authentication == "yes" -%}
+"""Test the user repository's prebuilt statements."""
+
+{% if cookiecutter.use_async_database == "yes" -%}
+import asyncio
+
+{% endif -%}
+import uuid
+from datetime import datetime
+
+from src.config import SettingsProxy, settings
+from src.database.client import DatabaseClient
+from src.entities.user import UserEntity
+from src.models.user import metadata
+from src.repositories.user import UserRepositories
+
+
+def test_statements_are_reused_across_calls(monkeypatch, tmp_path):
+    """Test lookups bind new parameters into the same statements and see writes."""
+    test_settings = settings.snapshot().model_copy(update={"SQLITE_DB_PATH": str(tmp_path / "users.db")})
+    monkeypatch.setattr("src.database.client.settings", SettingsProxy(test_settings))
+    database = DatabaseClient()
+    repository = UserRepositories()
+    now = datetime.now()
+    users = [
+        UserEntity(
+            id=str(uuid.uuid4()),
+            email=f"user{i}@example.com",
+            username=f"user{i}",
+            hashed_password="hash",
+            created_at=now,
+            updated_at=now,
+        )
+        for i in range(2)
+    ]
+{% if cookiecutter.use_async_database == "yes" -%}
+
+    async def scenario():
+        async with database.engine.connect() as conn:
+            await conn.run_sync(metadata.create_all)
+            for user in users:
+                await repository.create(conn, user)
+            await repository.update_password(conn, users[1].id, "rehashed")
+            found = [
+                await repository.get_by_email(conn, "user0@example.com"),
+                await repository.get_by_username(conn, "user1"),
+                await repository.get_by_id(conn, users[1].id),
+                await repository.get_by_email(conn, "missing@example.com"),
+            ]
+            batched = await repository.get_many_by_id(conn, [users[0].id, users[1].id, "missing"])
+        await database.close()
+        return found, batched
+
+    found, batched = asyncio.run(scenario())
+{% else -%}
+
+    with database.engine.connect() as conn:
+        metadata.create_all(conn)
+        for user in users:
+            repository.create(conn, user)
+        repository.update_password(conn, users[1].id, "rehashed")
+        found = [
+            repository.get_by_email(conn, "user0@example.com"),
+            repository.get_by_username(conn, "user1"),
+            repository.get_by_id(conn, users[1].id),
+            repository.get_by_email(conn, "missing@example.com"),
+        ]
+    database.close()
+{% endif -%}
+
+    assert found[0]["id"] == users[0].id
+    assert found[1]["id"] == found[2]["id"] == users[1].id
+    assert found[2]["hashed_password"] == "rehashed"
+    assert found[3] is None
+{% if cookiecutter.use_async_database == "yes" -%}
+    assert sorted(batched) == sorted(user.id for user in users)
+{% endif -%}
+{% endif -%}